@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AdManagementConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'Ad_management'
+
+    def ready(self):
+        import Ad_management.signals
@@ -0,0 +1,54 @@
+import time
+from collections import defaultdict
+from django.utils import timezone
+
+from .models import ad
+
+# Other Passenger workers never see our save signals, so the in-process copy
+# also goes stale on its own after a minute.
+PLACEMENTS_TIMEOUT = 60
+
+_placements = {'day': None, 'loaded': 0, 'ads': None}
+
+
+def _load_placements(today):
+    ads = (
+        ad.objects.select_related('ads_cat')
+        .filter(is_active=True, ads_cat__isnull=False, from_date__lte=today, to_date__gte=today)
+        .order_by('-id')
+    )
+    placements = defaultdict(list)
+    for item in ads:
+        placements[item.ads_cat.ads_cat_slug].append(item)
+    return dict(placements)
+
+
+def active_placements():
+    """
+    Every running ad keyed by its ad_category slug, newest first.
+    """
+    # the site's day (TIME_ZONE), not the server's
+    today = timezone.localdate()
+    if (
+        _placements['ads'] is None
+        or _placements['day'] != today
+        or time.monotonic() - _placements['loaded'] > PLACEMENTS_TIMEOUT
+    ):
+        _placements['ads'] = _load_placements(today)
+        _placements['day'] = today
+        _placements['loaded'] = time.monotonic()
+    return _placements['ads']
+
+
+def ads_for(slug, limit=1):
+    """
+    Ads for one slot; a slug with no category or no running ads gives [].
+    """
+    ads = active_placements().get(slug, [])
+    if limit:
+        return ads[:limit]
+    return list(ads)
+
+
+def clear_placements():
+    _placements['ads'] = None
@@ -0,0 +1,10 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import ad_category, ad
+from .placements import clear_placements
+
+
+@receiver([post_save, post_delete], sender=ad_category)
+@receiver([post_save, post_delete], sender=ad)
+def invalidate_placements(sender, **kwargs):
+    clear_placements()
@@ -65,6 +65,8 @@ THUMBNAIL_PROCESSORS = (
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # serves STATIC_ROOT straight from the app, before anything touches the session
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -73,12 +75,40 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
+# The cache is shared by every Passenger worker (OTPs, page and chrome caches),
+# so the default is on disk. CACHE_BACKEND picks the tier:
+#   file   - FileBasedCache under BASE_DIR/cache, fine for one host (default)
+#   redis  - django-redis at REDIS_URL, for more than one host
+#   locmem - per-process memory, only for local runs (tests override CACHES)
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'file')
+
+if CACHE_BACKEND == 'redis':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': os.environ.get('REDIS_URL', 'redis://127.0.0.1:6379/1'),
+            'OPTIONS': {
+                'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            },
+        }
+    }
+elif CACHE_BACKEND == 'locmem':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'unique-snowflake',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ.get('CACHE_LOCATION', str(BASE_DIR / 'cache')),
+            'OPTIONS': {
+                'MAX_ENTRIES': 10000,
+            },
+        }
     }
-}
 
 AUTHENTICATION_BACKENDS = ['django.contrib.auth.backends.ModelBackend']
 
@@ -111,10 +141,36 @@ WSGI_APPLICATION = 'armustnews.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
+# Every Passenger worker writes to the same SQLite file (view counters, OTPs),
+# so each connection is opened tuned for that:
+#   WAL               - readers don't block the writer and the writer doesn't block readers
+#   synchronous=NORMAL - safe with WAL, skips an fsync per commit
+#   busy_timeout      - wait for the write lock (ms) instead of "database is locked"
+#   cache_size        - page cache per connection, negative = KiB
+#   mmap_size         - read the file through the OS page cache (bytes)
+# Write transactions start IMMEDIATE so two of them queue on busy_timeout
+# instead of failing when a read lock can't be upgraded.
+# Connections are kept per worker for DB_CONN_MAX_AGE seconds.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT', 5000)),
+    'cache_size': int(os.environ.get('SQLITE_CACHE_SIZE', -20000)),
+    'mmap_size': int(os.environ.get('SQLITE_MMAP_SIZE', 128 * 1024 * 1024)),
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'armustnews.sqlite3',
+        'OPTIONS': {
+            'init_command': ''.join(f'PRAGMA {name}={value};' for name, value in SQLITE_PRAGMAS.items()),
+            'transaction_mode': 'IMMEDIATE',
+        },
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 600)),
+        'CONN_HEALTH_CHECKS': os.environ.get('DB_CONN_HEALTH_CHECKS', '1') == '1',
+        # a file, not the default in-memory db, so tests run with WAL and real locking
+        'TEST': {'NAME': BASE_DIR / 'test_armustnews.sqlite3'},
     }
 }
 
@@ -162,6 +218,18 @@ STATIC_ROOT = 'static/'
 # STATIC_URL = 'static/'
 # STATICFILES_DIRS = os.path.join(BASE_DIR, 'static'),
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles_build', 'static')
+
+# collectstatic writes content-hashed copies (css/site.3f2a1c.css) plus .gz and
+# .br next to them; whitenoise serves the hashed names with a year-long
+# immutable Cache-Control and picks the variant the browser accepts.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'armustnews.storage.StaticFilesStorage',
+    },
+}
 # MEDIA_URL = '/images/'
 # MEDIA_ROOT = os.path.join(BASE_DIR, 'static/images')
 
@@ -1,210 +1,446 @@
-from django.shortcuts import render
 from post_management.models import NewsPost, VideoNews
+from django.conf import settings
+from django.core.files.storage import default_storage
 from django.template import loader
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse, FileResponse, Http404
+from django.urls import reverse
+from django.db.models import Count, Max
+from django.db.models.functions import TruncMonth
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.html import escape
 from django.utils.http import http_date
 from django.utils import timezone
 from datetime import datetime, timedelta
-import calendar
+import gzip
+import math
+import os
+import zlib
 
-def auto_refresh_response(template_name, context, request):
-    response = HttpResponse(loader.get_template(template_name).render(context), content_type='application/xml')
+SITE_URL = "https://www.armustnews.com"
 
-    expiry_time = datetime.utcnow() + timedelta(seconds=300)
-    response["Expires"] = http_date(expiry_time.timestamp())
-    response["Cache-Control"] = "max-age=0, no-cache, no-store, must-revalidate"
-    response["Pragma"] = "no-cache"
+SITEMAP_MAX_AGE = 300
 
-    if "_refresh" not in request.GET:
-        refresh_url = request.build_absolute_uri() + ("&_refresh=true" if "?" in request.build_absolute_uri() else "?_refresh=true")
-        response["Refresh"] = f"600; url={refresh_url}" 
+# protocol limit per sitemap file, bigger months are split into pages
+MAX_URLS = 50000
+# rows fetched from the database at a time while streaming
+CHUNK_SIZE = 2000
+
+DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+
+def sitemap_root():
+    """
+    Where `manage.py build_sitemaps` pre-renders the sitemaps (SITEMAP_ROOT,
+    default BASE_DIR/sitemaps). The views serve these files and only render
+    live when a file has not been built yet.
+    """
+    return getattr(settings, 'SITEMAP_ROOT', os.path.join(settings.BASE_DIR, 'sitemaps'))
+
+
+def dirty_dir():
+    return os.path.join(sitemap_root(), '.dirty')
+
+
+def _month_range(year, month):
+    first_day_of_month = timezone.make_aware(datetime(year, month, 1))
+    if month == 12:
+        first_day_of_next_month = timezone.make_aware(datetime(year + 1, 1, 1))
+    else:
+        first_day_of_next_month = timezone.make_aware(datetime(year, month + 1, 1))
+    return first_day_of_month, first_day_of_next_month
 
-    return response
 
 # 📌 Custom Sitemap Index
-def custom_sitemap_index(request):
-    """Generate Custom Sitemap Index with Auto Refresh and SEO-Friendly Headers"""
-    now = timezone.now().strftime('%Y-%m-%dT%H:%M:%SZ')
+def index_context():
+    now = timezone.now().strftime(DATE_FORMAT)
 
     sitemaps = [
-        {'loc': 'https://www.armustnews.com/sitemap/news', 'lastmod': now},
-        {'loc': 'https://www.armustnews.com/sitemap/videos', 'lastmod': now},
-        {'loc': 'https://www.armustnews.com/sitemap/articles', 'lastmod': now},
-        {'loc': 'https://www.armustnews.com/sitemap/images', 'lastmod': now},
-        {'loc': 'https://www.armustnews.com/sitemap/archive', 'lastmod': now},
+        {'loc': f'{SITE_URL}/sitemap/news', 'lastmod': now},
+        {'loc': f'{SITE_URL}/sitemap/videos', 'lastmod': now},
+        {'loc': f'{SITE_URL}/sitemap/articles', 'lastmod': now},
+        {'loc': f'{SITE_URL}/sitemap/images', 'lastmod': now},
+        {'loc': f'{SITE_URL}/sitemap/archive', 'lastmod': now},
     ]
+    return {'sitemaps': sitemaps}
 
-    return auto_refresh_response('sitemap_index.xml', {'sitemaps': sitemaps}, request)
 
 # 📰 News Sitemap
-def sitemap_news(request):
-    """Generate News Sitemap with Auto Refresh"""
+def news_context():
     five_days_ago = timezone.now() - timedelta(days=7)
-    news_items = NewsPost.objects.filter(status="active", post_date__gte=five_days_ago).order_by('-updated_at')
+    news_items = NewsPost.objects.cards().filter(status="active", post_date__gte=five_days_ago).order_by('-updated_at')
 
     processed_news_items = [
         {
-            'loc': f"https://www.armustnews.com{item.get_absolute_url()}",
-            'lastmod': item.updated_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'loc': f"{SITE_URL}{item.get_absolute_url()}",
+            'lastmod': item.updated_at.strftime(DATE_FORMAT),
             'publication_name': 'armustnews',
             'language': 'en',
-            'publication_date': item.post_date.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'publication_date': item.post_date.strftime(DATE_FORMAT),
             'title': item.post_title
         }
         for item in news_items
     ]
+    return {'news_items': processed_news_items}
 
-    return auto_refresh_response('sitemap_news.xml', {'news_items': processed_news_items}, request)
 
-# 🖼️ Image Sitemap
-def sitemap_images(request):
-    """Generate an Image Sitemap Index with Auto Refresh"""
-    image_posts = NewsPost.objects.filter(post_image__isnull=False).order_by('-updated_at')
+# Base querysets: every URL a feed lists, whatever the month
+def image_posts():
+    return NewsPost.objects.cards().filter(post_image__isnull=False)
 
-    sitemap_entries = {}
-    for post in image_posts:
-        year_month = post.post_date.strftime("%Y/%m")
-        if year_month not in sitemap_entries:
-            sitemap_entries[year_month] = post.post_date.strftime('%Y-%m-%dT%H:%M:%SZ')
 
-    sitemap_list = [{'loc': f"https://www.armustnews.com/sitemap/images/{key}", 'lastmod': value} for key, value in sitemap_entries.items()]
+def video_posts():
+    return VideoNews.objects.cards().filter(is_active="active")
 
-    return auto_refresh_response('sitemap_images.xml', {'sitemaps': sitemap_list}, request)
 
-# 📅 Image Sitemap by Month
-def sitemap_images_by_month(request, year, month):
-    """Generate Image Sitemap for a specific month (YYYY/MM)"""
-    first_day_of_month = datetime(year, month, 1)
-    last_day_of_month = datetime(year, month, calendar.monthrange(year, month)[1])
+def article_posts():
+    return NewsPost.objects.cards().filter(status="active", articles=True)
 
-    image_posts = NewsPost.objects.filter(post_image__isnull=False, post_date__gte=first_day_of_month, post_date__lte=last_day_of_month).order_by('-updated_at')
 
-    sitemap_entries = [
-        {
-            'loc': f"https://www.armustnews.com{post.get_absolute_url()}",
-            'image': f"https://www.armustnews.com{post.post_image.url}",
-            'lastmod': post.updated_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
-        }
-        for post in image_posts
-    ]
+def archive_posts():
+    return NewsPost.objects.cards().filter(status="active")
 
-    return auto_refresh_response('sitemap_images_by_month.xml', {'sitemaps': sitemap_entries}, request)
 
-# 🎥 Video Sitemap
-def sitemap_videos(request):
-    """Generate a Video Sitemap Index grouped by year/month"""
-    video_posts = VideoNews.objects.filter(is_active="active").order_by('-updated_at')
+# 🖼️ Image Sitemap
+def image_url(row):
+    if not row['post_image']:
+        return ''
+    return (
+        "    <url>\n"
+        f"        <loc>{SITE_URL}{reverse('newsdetails', args=[row['slug']])}</loc>\n"
+        f"        <lastmod>{row['updated_at'].strftime(DATE_FORMAT)}</lastmod>\n"
+        "        <image:image>\n"
+        f"            <image:loc>{escape(SITE_URL + default_storage.url(row['post_image']))}</image:loc>\n"
+        "        </image:image>\n"
+        "    </url>\n"
+    )
 
-    sitemap_entries = {}
-    for post in video_posts:
-        year_month = post.video_date.strftime("%Y/%m")
-        if year_month not in sitemap_entries:
-            sitemap_entries[year_month] = post.updated_at.strftime('%Y-%m-%dT%H:%M:%SZ')
 
-    sitemap_list = [{'loc': f"https://www.armustnews.com/sitemap/videos/{key}", 'lastmod': value} for key, value in sitemap_entries.items()]
+# 🎥 Video Sitemap
+def video_url(row):
+    if row['video_type'] == "reel":
+        content_loc = f"https://www.youtube.com/shorts/{escape(row['video_url'])}"
+    else:
+        content_loc = f"https://www.youtube.com/watch?v={escape(row['video_url'])}"
+    return (
+        "    <url>\n"
+        f"        <loc>{SITE_URL}{reverse('videonewsdetails', args=[row['slug']])}</loc>\n"
+        f"        <lastmod>{row['updated_at'].strftime(DATE_FORMAT)}</lastmod>\n"
+        "        <video:video>\n"
+        f"            <video:content_loc>{content_loc}</video:content_loc>\n"
+        f"            <video:thumbnail_loc>https://img.youtube.com/vi/{escape(row['video_url'])}/mqdefault.jpg</video:thumbnail_loc>\n"
+        f"            <video:title>{escape(row['video_title'])}</video:title>\n"
+        f"            <video:description>{escape(row['video_short_des'])}</video:description>\n"
+        f"            <video:viewcounter>{row['viewcounter']}</video:viewcounter>\n"
+        f"            <video:publication_date>{row['video_date'].strftime(DATE_FORMAT)}</video:publication_date>\n"
+        "        </video:video>\n"
+        "    </url>\n"
+    )
 
-    return auto_refresh_response('sitemap_video.xml', {'sitemaps': sitemap_list}, request)
 
-# 📅 Video Sitemap by Month
-def sitemap_videos_by_month(request, year, month):
-    """Generate Video Sitemap for a specific month (YYYY/MM)"""
-    first_day_of_month = datetime(year, month, 1)
-    last_day_of_month = datetime(year, month, calendar.monthrange(year, month)[1])
+# 📖 Article Sitemap
+def article_url(row):
+    return (
+        "    <url>\n"
+        f"        <loc>{SITE_URL}{reverse('newsdetails', args=[row['slug']])}</loc>\n"
+        f"        <lastmod>{row['updated_at'].strftime(DATE_FORMAT)}</lastmod>\n"
+        "        <changefreq>weekly</changefreq>\n"
+        "        <priority>0.7</priority>\n"
+        "    </url>\n"
+    )
 
-    video_posts = VideoNews.objects.filter(is_active="active", video_date__gte=first_day_of_month, video_date__lte=last_day_of_month).order_by('-updated_at')
 
-    sitemap_entries = [
-        {
-            'loc': f"https://www.armustnews.com{post.get_absolute_url()}",
-            'video': post.video_url,
-            'video_type': post.video_type,
-            'video_short_des': post.video_short_des,
-            'thumbnail': f"https://www.armustnews.com{post.video_thumbnail.url}" if post.video_thumbnail else "",
-            'lastmod': post.updated_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
-            'title': post.video_title,
-            'viewcounter': post.viewcounter,
-            'publish_date': post.video_date.strftime('%Y-%m-%dT%H:%M:%SZ'),
-        }
-        for post in video_posts
+# 🗂️ Archive Sitemap
+def archive_url(row):
+    return (
+        "    <url>\n"
+        f"        <loc>{SITE_URL}{reverse('newsdetails', args=[row['slug']])}</loc>\n"
+        f"        <lastmod>{row['updated_at'].strftime(DATE_FORMAT)}</lastmod>\n"
+        "        <news:news>\n"
+        "            <news:publication>\n"
+        "                <news:name>armustnews</news:name>\n"
+        "                <news:language>en</news:language>\n"
+        "            </news:publication>\n"
+        f"            <news:publication_date>{row['post_date'].strftime(DATE_FORMAT)}</news:publication_date>\n"
+        f"            <news:title>{escape(row['post_title'])}</news:title>\n"
+        "        </news:news>\n"
+        "    </url>\n"
+    )
+
+
+URLSET = '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"{namespaces}>\n'
+
+FEEDS = {
+    'images': {
+        'index_template': 'sitemap_images.xml',
+        'queryset': image_posts,
+        'date_field': 'post_date',
+        'fields': ('slug', 'updated_at', 'post_image'),
+        'namespaces': ' xmlns:image="http://www.google.com/schemas/sitemap-image/1.1"',
+        'url': image_url,
+    },
+    'videos': {
+        'index_template': 'sitemap_video.xml',
+        'queryset': video_posts,
+        'date_field': 'video_date',
+        'fields': ('slug', 'updated_at', 'video_url', 'video_type', 'video_title', 'video_short_des', 'viewcounter', 'video_date'),
+        'namespaces': ' xmlns:video="http://www.google.com/schemas/sitemap-video/1.1"',
+        'url': video_url,
+    },
+    'articles': {
+        'index_template': 'sitemap_article.xml',
+        'queryset': article_posts,
+        'date_field': 'post_date',
+        'fields': ('slug', 'updated_at'),
+        'namespaces': '',
+        'url': article_url,
+    },
+    'archive': {
+        'index_template': 'sitemap_archive.xml',
+        'queryset': archive_posts,
+        'date_field': 'post_date',
+        'fields': ('slug', 'updated_at', 'post_date', 'post_title'),
+        'namespaces': ' xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"',
+        'url': archive_url,
+    },
+}
+NEWS_FEEDS = ('images', 'articles', 'archive')
+VIDEO_FEEDS = ('videos',)
+
+
+def month_queryset(feed, year, month):
+    date_field = FEEDS[feed]['date_field']
+    start, end = _month_range(year, month)
+    return FEEDS[feed]['queryset']().filter(**{
+        f'{date_field}__gte': start,
+        f'{date_field}__lt': end,
+    })
+
+
+def month_pages(feed, year, month):
+    return max(1, math.ceil(month_queryset(feed, year, month).count() / MAX_URLS))
+
+
+def stream_month(feed, year, month, page=1):
+    """
+    Yield the XML of one month shard piece by piece. Rows come straight from
+    .values().iterator(), so memory stays flat however big the month is.
+    """
+    spec = FEEDS[feed]
+    rows = (
+        month_queryset(feed, year, month)
+        .order_by('-updated_at', '-id')
+        .values(*spec['fields'])[(page - 1) * MAX_URLS:page * MAX_URLS]
+    )
+    yield URLSET.format(namespaces=spec['namespaces'])
+    url = spec['url']
+    for row in rows.iterator(chunk_size=CHUNK_SIZE):
+        yield url(row)
+    yield '</urlset>\n'
+
+
+def gzip_stream(chunks):
+    compressor = zlib.compressobj(wbits=31)  # gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def month_summary(feed):
+    """
+    One row per month of a feed, newest first: year, month, count and lastmod
+    (the newest updated_at). A single GROUP BY, so it grows with the number of
+    months, not posts.
+    """
+    rows = (
+        FEEDS[feed]['queryset']()
+        .annotate(month=TruncMonth(FEEDS[feed]['date_field']))
+        .values('month')
+        .annotate(count=Count('id'), lastmod=Max('updated_at'))
+        .order_by('-month')
+    )
+    return [
+        {'year': row['month'].year, 'month': row['month'].month, 'count': row['count'], 'lastmod': row['lastmod']}
+        for row in rows
     ]
 
-    return auto_refresh_response('sitemap_videos_by_month.xml', {'sitemaps': sitemap_entries}, request)
 
-# 📖 Article Sitemap
-def sitemap_article(request):
-    """Generate an Article Sitemap Index grouped by year/month"""
-    article_posts = NewsPost.objects.filter(status="active", articles=True).order_by('-updated_at')
+def feed_index_context(feed):
+    sitemap_list = []
+    for row in month_summary(feed):
+        loc = f"{SITE_URL}/sitemap/{feed}/{row['year']:04d}/{row['month']:02d}"
+        lastmod = row['lastmod'].strftime(DATE_FORMAT)
+        sitemap_list.append({'loc': loc, 'lastmod': lastmod})
+        for page in range(2, math.ceil(row['count'] / MAX_URLS) + 1):
+            sitemap_list.append({'loc': f"{loc}/{page}", 'lastmod': lastmod})
+    return {'sitemaps': sitemap_list}
+
+
+def sitemap_path(feed=None, year=None, month=None, page=1):
+    """
+    File for a sitemap: index.xml, <feed>.xml or <feed>/YYYY/MM[-page].xml.
+    """
+    if feed is None:
+        return os.path.join(sitemap_root(), 'index.xml')
+    if year is None:
+        return os.path.join(sitemap_root(), f'{feed}.xml')
+    suffix = f'-{page}' if page > 1 else ''
+    return os.path.join(sitemap_root(), feed, f'{year:04d}', f'{month:02d}{suffix}.xml')
+
+
+def iter_sitemap(feed=None, year=None, month=None, page=1):
+    if feed is None:
+        return [loader.render_to_string('sitemap_index.xml', index_context())]
+    if feed == 'news':
+        return [loader.render_to_string('sitemap_news.xml', news_context())]
+    if year is None:
+        return [loader.render_to_string(FEEDS[feed]['index_template'], feed_index_context(feed))]
+    return stream_month(feed, year, month, page)
+
+
+def write_sitemap(feed=None, year=None, month=None, page=1):
+    """
+    Write a sitemap and its .gz twin, swapped in only once complete.
+    """
+    path = sitemap_path(feed, year, month, page)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(f'{path}.tmp', 'w', encoding='utf-8') as f, gzip.open(f'{path}.gz.tmp', 'wt', encoding='utf-8') as gz:
+        for chunk in iter_sitemap(feed, year, month, page):
+            f.write(chunk)
+            gz.write(chunk)
+    # readers never see a half written file
+    os.replace(f'{path}.gz.tmp', f'{path}.gz')
+    os.replace(f'{path}.tmp', path)
+    return path
+
+
+def write_month(feed, year, month):
+    """
+    Write every page of a month shard and drop pages it no longer needs.
+    """
+    pages = month_pages(feed, year, month)
+    for page in range(1, pages + 1):
+        write_sitemap(feed, year, month, page)
+    page = pages + 1
+    while os.path.exists(sitemap_path(feed, year, month, page)):
+        os.remove(sitemap_path(feed, year, month, page))
+        if os.path.exists(sitemap_path(feed, year, month, page) + '.gz'):
+            os.remove(sitemap_path(feed, year, month, page) + '.gz')
+        page += 1
+    return pages
+
+
+def feed_months(feed):
+    return [(row['year'], row['month']) for row in month_summary(feed)]
+
+
+def mark_month_dirty(feeds, date):
+    """
+    Flag the month shards of ``date`` for the next build_sitemaps run.
+    """
+    if date is None:
+        return
+    date = timezone.localtime(date)
+    os.makedirs(dirty_dir(), exist_ok=True)
+    for feed in feeds:
+        marker = os.path.join(dirty_dir(), f'{feed}-{date.year:04d}-{date.month:02d}')
+        with open(marker, 'a'):
+            pass
+
+
+def _accepts_gzip(request):
+    return 'gzip' in request.META.get('HTTP_ACCEPT_ENCODING', '')
+
+
+def sitemap_response(request, feed=None, year=None, month=None, page=1):
+    path = sitemap_path(feed, year, month, page)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        # not built yet, stream it for this request only
+        if year is None:
+            return HttpResponse(iter_sitemap(feed), content_type='application/xml')
+        if page > 1 and page > month_pages(feed, year, month):
+            raise Http404("No such sitemap page")
+        chunks = stream_month(feed, year, month, page)
+        if _accepts_gzip(request):
+            response = StreamingHttpResponse(gzip_stream(chunks), content_type='application/xml')
+            response["Content-Encoding"] = "gzip"
+        else:
+            response = StreamingHttpResponse(chunks, content_type='application/xml')
+        patch_vary_headers(response, ('Accept-Encoding',))
+        return response
+
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    last_modified = int(stat.st_mtime)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        return response
+
+    if _accepts_gzip(request) and os.path.exists(f'{path}.gz'):
+        response = FileResponse(open(f'{path}.gz', 'rb'), content_type='application/xml')
+        response["Content-Encoding"] = "gzip"
+    else:
+        response = FileResponse(open(path, 'rb'), content_type='application/xml')
+    response["Cache-Control"] = f"public, max-age={SITEMAP_MAX_AGE}"
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
 
-    sitemap_entries = {}
-    for post in article_posts:
-        year_month = post.post_date.strftime("%Y/%m")
-        if year_month not in sitemap_entries:
-            sitemap_entries[year_month] = post.updated_at.strftime('%Y-%m-%dT%H:%M:%SZ')
 
-    sitemap_list = [{'loc': f"https://www.armustnews.com/sitemap/articles/{key}", 'lastmod': value} for key, value in sitemap_entries.items()]
+def _month(year, month, page=1):
+    if not 1 <= month <= 12 or page < 1:
+        raise Http404("No such month")
+    return year, month, page
 
-    return auto_refresh_response('sitemap_article.xml', {'sitemaps': sitemap_list}, request)
 
+def custom_sitemap_index(request):
+    """Sitemap Index"""
+    return sitemap_response(request)
 
-def sitemap_article_by_month(request, year, month):
-    """Generate Article Sitemap for a specific month (YYYY/MM)"""
-    first_day_of_month = datetime(year, month, 1)
-    last_day_of_month = datetime(year, month, calendar.monthrange(year, month)[1])
 
-    article_posts = NewsPost.objects.filter(
-        status="active",
-        articles=True,
-        post_date__gte=first_day_of_month,
-        post_date__lte=last_day_of_month
-    ).order_by('-updated_at')
+def sitemap_news(request):
+    """News Sitemap (last 7 days)"""
+    return sitemap_response(request, 'news')
 
-    sitemap_entries = [
-        {
-            'loc': f"https://www.armustnews.com{post.get_absolute_url()}",
-            'lastmod': post.updated_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
-            'title': post.post_title,
-            'publish_date': post.post_date.strftime('%Y-%m-%dT%H:%M:%SZ'),
-        }
-        for post in article_posts
-    ]
 
-    return auto_refresh_response('sitemap_article_by_month.xml', {'sitemaps': sitemap_entries}, request)
+def sitemap_images(request):
+    """Image Sitemap Index grouped by year/month"""
+    return sitemap_response(request, 'images')
 
-# 🗂️ Archive Sitemap
-def sitemap_archive(request):
-    """Generate an Archive Sitemap Index grouped by year/month"""
-    archive_posts = NewsPost.objects.filter(status="active").order_by('-updated_at')
 
-    sitemap_entries = {}
-    for post in archive_posts:
-        year_month = post.post_date.strftime("%Y/%m")
-        if year_month not in sitemap_entries:
-            sitemap_entries[year_month] = post.updated_at.strftime('%Y-%m-%dT%H:%M:%SZ')
+def sitemap_images_by_month(request, year, month, page=1):
+    """Image Sitemap for a specific month (YYYY/MM)"""
+    return sitemap_response(request, 'images', *_month(year, month, page))
 
-    sitemap_list = [{'loc': f"https://www.armustnews.com/sitemap/archive/{key}", 'lastmod': value} for key, value in sitemap_entries.items()]
 
-    return auto_refresh_response('sitemap_archive.xml', {'sitemaps': sitemap_list}, request)
+def sitemap_videos(request):
+    """Video Sitemap Index grouped by year/month"""
+    return sitemap_response(request, 'videos')
 
-# 📅 Archive Sitemap by Month
-def sitemap_archive_by_month(request, year, month):
-    """Generate Archive Sitemap for a specific month (YYYY/MM)"""
-    first_day_of_month = datetime(year, month, 1)
-    last_day_of_month = datetime(year, month, calendar.monthrange(year, month)[1])
 
-    archive_posts = NewsPost.objects.filter(
-        status="active",
-        post_date__gte=first_day_of_month,
-        post_date__lte=last_day_of_month
-    ).order_by('-updated_at')
+def sitemap_videos_by_month(request, year, month, page=1):
+    """Video Sitemap for a specific month (YYYY/MM)"""
+    return sitemap_response(request, 'videos', *_month(year, month, page))
+
+
+def sitemap_article(request):
+    """Article Sitemap Index grouped by year/month"""
+    return sitemap_response(request, 'articles')
+
+
+def sitemap_article_by_month(request, year, month, page=1):
+    """Article Sitemap for a specific month (YYYY/MM)"""
+    return sitemap_response(request, 'articles', *_month(year, month, page))
+
+
+def sitemap_archive(request):
+    """Archive Sitemap Index grouped by year/month"""
+    return sitemap_response(request, 'archive')
 
-    sitemap_entries = [
-        {
-            'loc': f"https://www.armustnews.com{post.get_absolute_url()}",
-            'lastmod': post.updated_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
-            'title': post.post_title,
-            'publish_date': post.post_date.strftime('%Y-%m-%dT%H:%M:%SZ'),
-        }
-        for post in archive_posts
-    ]
 
-    return auto_refresh_response('sitemap_archive_by_month.xml', {'sitemaps': sitemap_entries}, request)
+def sitemap_archive_by_month(request, year, month, page=1):
+    """Archive Sitemap for a specific month (YYYY/MM)"""
+    return sitemap_response(request, 'archive', *_month(year, month, page))
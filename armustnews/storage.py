@@ -0,0 +1,21 @@
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+
+class StaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """
+    Hashed + gzip/brotli static files that don't fall over on references to
+    files that were never there: a dead url() in a vendor stylesheet (missing
+    fonts, .map files) no longer stops collectstatic, and a template's
+    {% static %} for a missing file keeps its plain URL instead of a 500.
+    Everything that exists gets its hashed name.
+    """
+
+    manifest_strict = False
+
+    def hashed_name(self, name, content=None, filename=None):
+        try:
+            return super().hashed_name(name, content, filename)
+        except ValueError:
+            if content is not None:
+                raise
+            return name
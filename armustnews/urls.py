@@ -71,12 +71,16 @@ urlpatterns = [
     path('sitemap/news', sitemap_news, name='sitemap-news'),
     path('sitemap/images', sitemap_images, name='sitemap-images'),
     path('sitemap/images/<int:year>/<int:month>/', sitemap_images_by_month, name='sitemap-images-by-month'),
+    path('sitemap/images/<int:year>/<int:month>/<int:page>/', sitemap_images_by_month, name='sitemap-images-by-month-page'),
     path('sitemap/videos', sitemap_videos, name='sitemap-video'),
     path('sitemap/videos/<int:year>/<int:month>/', sitemap_videos_by_month, name='sitemap-videos-by-month'),
+    path('sitemap/videos/<int:year>/<int:month>/<int:page>/', sitemap_videos_by_month, name='sitemap-videos-by-month-page'),
     path('sitemap/articles', sitemap_article, name='sitemap-articles'),
     path('sitemap/articles/<int:year>/<int:month>/', sitemap_article_by_month, name='sitemap-articles-by-month'),
+    path('sitemap/articles/<int:year>/<int:month>/<int:page>/', sitemap_article_by_month, name='sitemap-articles-by-month-page'),
     path('sitemap/archive', sitemap_archive, name='sitemap-archive'),
     path('sitemap/archive/<int:year>/<int:month>/', sitemap_archive_by_month, name='sitemap-archive-by-month'),
+    path('sitemap/archive/<int:year>/<int:month>/<int:page>/', sitemap_archive_by_month, name='sitemap-archive-by-month-page'),
     #sitmap end
     #admin-user-pannel-path
     path('user-dashboard', views.Userdashboard, name="user-dashboard"),
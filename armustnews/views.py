@@ -4,15 +4,19 @@ logger = logging.getLogger(__name__)
 
 from django.http import HttpResponse
 
-from django.db.models import Q
+from django.db.models import Count
 
-from post_management.models import category,sub_category,NewsPost,VideoNews,NewsRedirect
+from post_management.models import sub_category,NewsPost,VideoNews,NewsRedirect
 
-from setting.models import profile_setting, CMS
-
-from Ad_management.models import ad_category
+from post_management.chrome import get_chrome, chrome_context, SIDEBAR_ADS, FESTIVE_ADS, HEADER_ADS, ALL_ADS
+from post_management.viewcounts import record_view
+from post_management.search import search_posts
+from post_management.feeds import latest_per_category
+from post_management.pagecache import anonymous_page_cache, conditional_page
+from post_management.pagination import keyset_page
+from post_management.category_page import category_blocks
 
-from Ad_management.models import ad
+from setting.models import profile_setting, CMS
 
 from Seo_management.models import seo_optimization
 
@@ -44,8 +48,6 @@ from datetime import date, datetime
 
 import re
 
-from django.utils import timezone
-
 import random
 
 from django.core.cache import cache
@@ -60,47 +62,27 @@ from journalist.models import Journalist
 
 # home-pahe---------
 
+@anonymous_page_cache('home')
+
 def home(request):
 
     seo=seo_optimization.objects.get(pageslug='https://www.armustnews.com')
 
     current_datetime = datetime.now()
 
-    blogdata=NewsPost.objects.filter(schedule_date__lt=current_datetime,is_active=1,status='active').order_by('-id')[:10]
-
-    mainnews=NewsPost.objects.filter(schedule_date__lt=current_datetime,status='active').order_by('order')[:4]
+    blogdata=NewsPost.objects.cards().filter(schedule_date__lt=current_datetime,is_active=1,status='active').order_by('-id')[:10]
 
-    events=NewsPost.objects.filter(schedule_date__lt=current_datetime,Event=1,status='active').order_by('-id')[:10]
+    events=NewsPost.objects.cards().filter(schedule_date__lt=current_datetime,Event=1,status='active').order_by('-id')[:10]
 
     bp=BrandPartner.objects.filter(is_active=1).order_by('-id')[:30]
 
-    articales=NewsPost.objects.filter(schedule_date__lt=current_datetime,articles=1,status='active').order_by('-id')[:14]
-
-    headline=NewsPost.objects.filter(schedule_date__lt=current_datetime,Head_Lines=1,status='active').order_by('-id')[:6]
-
-    trending=NewsPost.objects.filter(schedule_date__lt=current_datetime,trending=1,status='active').order_by('-id')[:6]
-
-    brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-id')[:4]
-
-    user_news = NewsPost.objects.filter(schedule_date__lt=current_datetime, journalist_id__isnull=False, status='active').order_by('-id')[:10]
+    user_news = NewsPost.objects.cards().filter(schedule_date__lt=current_datetime, journalist_id__isnull=False, status='active').order_by('-id')[:10]
 
     profiles = Journalist.objects.filter(status='active').exclude(registration_type='journalist').order_by('-id')[:6]
 
-    Category = category.objects.filter(cat_status='active').order_by('order')[:12]
-
-    grouped_postsdata = {}
-
-
-
-    for cat in Category:
-
-        subcategories = cat.sub_category_set.all()
-
-        category_posts = NewsPost.objects.filter(Q(post_cat__in=subcategories), is_active=1, status='active', schedule_date__lte=timezone.now()).order_by('-schedule_date')[:9]
+    data=chrome_context(ads=ALL_ADS, BlogData=0, headline=6, trendpost=6, bnews=4, Articale=14, vidart=3, vidnews=0)
 
-
-
-        grouped_postsdata[cat] = {"subcategories": subcategories, "posts": category_posts,}
+    grouped_postsdata = latest_per_category(data['Blogcat'], 9)
 
 
 
@@ -112,130 +94,30 @@ def home(request):
 
     
 
-    truet=VideoNews.objects.filter(is_active='active',video_type='reel',News_Category=75).order_by('-id')[:8]
+    truet=VideoNews.objects.cards().filter(is_active='active',video_type='reel',News_Category=75).order_by('-id')[:8]
 
-    recipe=VideoNews.objects.filter(is_active='active',video_type='reel',News_Category=76).order_by('-id')[:8]
+    recipe=VideoNews.objects.cards().filter(is_active='active',video_type='reel',News_Category=76).order_by('-id')[:8]
 
 # --------------video-post-manage--------------
 
-    podcast=VideoNews.objects.filter(is_active='active',video_type='video',Head_Lines=1).order_by('order')[:2]
-
-    mainvid=VideoNews.objects.filter(is_active='active',video_type='video',order__range=[3, 6]).order_by('order')[:4]
-
-    video=VideoNews.objects.filter(is_active='active',video_type='video').order_by('order')[:4]
-
-    reel=VideoNews.objects.filter(is_active='active',video_type='reel').order_by('-id')[:16]
-
-    vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:3]
-
-# --------------ad-manage-meny--------------
-
-    lfsid=ad_category.objects.get(ads_cat_slug='left-fest-square')
-
-    leftsquqre=ad.objects.filter(ads_cat_id=lfsid.id, is_active=1).order_by('-id') [:4]
-
-    
-
-    adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
-
-    adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
+    podcast=VideoNews.objects.cards().filter(is_active='active',video_type='video',Head_Lines=1).order_by('order')[:2]
 
-    adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
+    mainvid=VideoNews.objects.cards().filter(is_active='active',video_type='video',order__range=[3, 6]).order_by('order')[:4]
 
-    
-
-    adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
-
-    adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
-
-    adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adrcol=ad_category.objects.get(ads_cat_slug='mrec')
-
-    adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    festbg=ad_category.objects.get(ads_cat_slug='festivebg')
-
-    festive=ad.objects.filter(ads_cat_id=festbg.id, is_active=1).order_by('-id') [:1]
-
-    # header--to--ad---
+    video=VideoNews.objects.cards().filter(is_active='active',video_type='video').order_by('order')[:4]
 
-    topad=ad_category.objects.get(ads_cat_slug='topad')
+    reel=VideoNews.objects.cards().filter(is_active='active',video_type='reel').order_by('-id')[:16]
 
-    tophead=ad.objects.filter(ads_cat_id=topad.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    popup=ad_category.objects.get(ads_cat_slug='popup')
-
-    popupad=ad.objects.filter(ads_cat_id=popup.id, is_active=1).order_by('-id') [:1]
-
-# -------------end-ad-manage-meny--------------    
-
-    # slider=NewsPost.objects.filter(id=1).order_by('id')[:5] use for filter value
-
-    slider=NewsPost.objects.filter().order_by('-id')[:5]
-
-    latestnews=NewsPost.objects.all().order_by('-id')[:5]
-
-    data={
+    data.update({
 
             'indseo':seo,
 
             'LatestNews':blogdata,
 
-            'mainnews':mainnews,
-
             'events':events,
 
             'bplogo':bp,
 
-            'Slider':slider,
-
-            'Blogcat':Category,
-
-            'latnews':latestnews,
-
-            'adtop':adtop,
-
-            'adleft':adleft,
-
-            'adright':adright,
-
-            'adtl':adtopleft,
-
-            'adtr':adtopright,
-
-            'bgad':festive,
-
-            'headtopad':tophead,
-
-            'popup':popupad,
-
-            'lfs':leftsquqre,
-
-            'Articale':articales,
-
-            'vidart':vidarticales,
-
-            'headline':headline,
-
-            'trendpost':trending,
-
-            'bnews':brknews,
-
             'vidnews':podcast,
 
             'MainV':mainvid,
@@ -256,7 +138,7 @@ def home(request):
 
             'profiles': profiles,
 
-        }
+        })
 
     return render(request,'index.html',data)
 
@@ -264,129 +146,36 @@ def home(request):
 
 
 
+@conditional_page(NewsPost.objects.filter(status='active'))
+
+@anonymous_page_cache('news:{slug}')
+
 def newsdetails(request, slug):
     try:
         current_datetime = datetime.now()
 
-        counter = NewsPost.objects.get(slug=slug)
-        counter.viewcounter = counter.viewcounter + 1
-        counter.save()
-
         seo = 'ndetail'
 
         blogdetails = NewsPost.objects.get(slug=slug, status='active')
+        record_view(blogdetails, request)
 
-        blogdata = NewsPost.objects.filter(
-            schedule_date__lt=current_datetime,
-            is_active=1,
-            status='active'
-        ).order_by('-id')[:9]
-
-        mainnews = NewsPost.objects.filter(
+        mainnews = NewsPost.objects.cards().filter(
             schedule_date__lt=current_datetime,
             is_active=1,
             status='active'
         ).order_by('-id')[:2]
 
-        articales = NewsPost.objects.filter(
-            schedule_date__lt=current_datetime,
-            articles=1,
-            status='active'
-        ).order_by('-id')[:3]
-
-        headline = NewsPost.objects.filter(
-            schedule_date__lt=current_datetime,
-            Head_Lines=1,
-            status='active'
-        ).order_by('-id')[:4]
-
-        trending = NewsPost.objects.filter(
-            schedule_date__lt=current_datetime,
-            trending=1,
-            status='active'
-        ).order_by('-id')[:8]
-
-        brknews = NewsPost.objects.filter(
-            schedule_date__lt=current_datetime,
-            BreakingNews=1,
-            status='active'
-        ).order_by('-id')[:8]
-
-        podcast = VideoNews.objects.filter(
-            is_active='active'
-        ).order_by('-id')[:1]
-
-        vidarticales = VideoNews.objects.filter(
-            articles=1,
-            is_active='active',
-            video_type='video'
-        ).order_by('order')[:2]
-
-        # Ad Sections
-        lfsid = ad_category.objects.get(ads_cat_slug='left-fest-square')
-        leftsquqre = ad.objects.filter(
-            ads_cat_id=lfsid.id, is_active=1
-        ).order_by('-id')[:4]
-
-        adtlid = ad_category.objects.get(ads_cat_slug='topleft-600x80')
-        adtopleft = ad.objects.filter(
-            ads_cat_id=adtlid.id, is_active=1
-        ).order_by('-id')[:1]
-
-        adtrid = ad_category.objects.get(ads_cat_slug='topright-600x80')
-        adtopright = ad.objects.filter(
-            ads_cat_id=adtrid.id, is_active=1
-        ).order_by('-id')[:1]
-
-        adtopid = ad_category.objects.get(ads_cat_slug='leaderboard')
-        adtop = ad.objects.filter(
-            ads_cat_id=adtopid.id, is_active=1
-        ).order_by('-id')[:1]
-
-        adleftid = ad_category.objects.get(ads_cat_slug='skyscraper')
-        adleft = ad.objects.filter(
-            ads_cat_id=adleftid.id, is_active=1
-        ).order_by('-id')[:1]
-
-        adrcol = ad_category.objects.get(ads_cat_slug='mrec')
-        adright = ad.objects.filter(
-            ads_cat_id=adrcol.id, is_active=1
-        ).order_by('-id')[:1]
-
-        festbg = ad_category.objects.get(ads_cat_slug='festivebg')
-        festive = ad.objects.filter(
-            ads_cat_id=festbg.id, is_active=1
-        ).order_by('-id')[:1]
-
-        Category = category.objects.filter(
-            cat_status='active'
-        ).order_by('order')[:12]
-
-        slider = NewsPost.objects.order_by('-id')[:5]
-        latestnews = NewsPost.objects.order_by('-id')[:5]
-
-        data = {
+        data = chrome_context(
+            ads=FESTIVE_ADS + ('lfs',),
+            BlogData=9,
+            headline=4,
+            trendpost=8,
+        )
+        data.update({
             'indseo': seo,
             'Blogdetails': blogdetails,
-            'BlogData': blogdata,
             'mainnews': mainnews,
-            'Slider': slider,
-            'Blogcat': Category,
-            'latnews': latestnews,
-            'adtop': adtop,
-            'adleft': adleft,
-            'adright': adright,
-            'adtl': adtopleft,
-            'adtr': adtopright,
-            'bgad': festive,
-            'lfs': leftsquqre,
-            'Articale': articales,
-            'vidart': vidarticales,
-            'headline': headline,
-            'trendpost': trending,
-            'bnews': brknews,
-            'vidnews': podcast,
-        }
+        })
 
         return render(request, 'news-details.html', data)
 
@@ -407,15 +196,15 @@ def GetNewsPdf(request):
 
     current_datetime = datetime.now()
 
-    blogdata=NewsPost.objects.filter(schedule_date__lt=current_datetime,is_active=1,status='active').order_by('-id') [:10]
+    blogdata=NewsPost.objects.cards().filter(schedule_date__lt=current_datetime,is_active=1,status='active').order_by('-id') [:10]
 
-    mainnews=NewsPost.objects.filter(schedule_date__lt=current_datetime,status='active').order_by('order')[:4]
+    mainnews=NewsPost.objects.cards().filter(schedule_date__lt=current_datetime,status='active').order_by('order')[:4]
 
-    articales=NewsPost.objects.filter(schedule_date__lt=current_datetime,articles=1,status='active').order_by('-id') [:3]
+    articales=NewsPost.objects.cards().filter(schedule_date__lt=current_datetime,articles=1,status='active').order_by('-id') [:3]
 
-    headline=NewsPost.objects.filter(schedule_date__lt=current_datetime,Head_Lines=1,status='active').order_by('-id') [:4]
+    headline=NewsPost.objects.cards().filter(schedule_date__lt=current_datetime,Head_Lines=1,status='active').order_by('-id') [:4]
 
-    vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:3]
+    vidarticales=VideoNews.objects.cards().filter(articles=1,is_active='active',video_type='video').order_by('order')[:3]
 
     data={
 
@@ -447,87 +236,35 @@ def find_post_by_title(request):
 
     seo='allnews'
 
-    current_datetime = datetime.now()
-
-    events=NewsPost.objects.filter(Event=1,status='active').order_by('-id') [:10]
+    events=NewsPost.objects.cards().filter(Event=1,status='active').order_by('-id') [:10]
 
     bp=BrandPartner.objects.filter(is_active=1).order_by('-id') [:20]
 
-    articales=NewsPost.objects.filter(schedule_date__lt=current_datetime,articles=1,status='active').order_by('-id') [:3]
-
-    vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:2]
-
-    headline=NewsPost.objects.filter(schedule_date__lt=current_datetime,Head_Lines=1,status='active').order_by('-id') [:14]
-
-    trending=NewsPost.objects.filter(schedule_date__lt=current_datetime,trending=1,status='active').order_by('-id') [:7]
-
-    brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-id') [:8]
-
-    podcast=VideoNews.objects.filter(is_active='active').order_by('-id') [:2]
-
-    Category=category.objects.filter(cat_status='active').order_by('order') [:12]
-
-    
-
-    # --------------ad-manage-meny--------------
-
-    adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
-
-    adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
-
-    adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
-
-    adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
-
-    adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adrcol=ad_category.objects.get(ads_cat_slug='mrec')
-
-    adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    festbg=ad_category.objects.get(ads_cat_slug='festivebg')
-
-    festive=ad.objects.filter(ads_cat_id=festbg.id, is_active=1).order_by('-id') [:1]
-
-    
+    title = request.GET.get('title')
 
-    topad=ad_category.objects.get(ads_cat_slug='topad')
+    if title:
 
-    tophead=ad.objects.filter(ads_cat_id=topad.id, is_active=1).order_by('-id') [:1]
+        results = search_posts(title)
 
-    popup=ad_category.objects.get(ads_cat_slug='popup')
+        if results.count():
 
-    popupad=ad.objects.filter(ads_cat_id=popup.id, is_active=1).order_by('-id') [:1]
+            paginator = Paginator(results, 12)
 
-# -------------end-ad-manage-meny--------------    
+            try:
 
+                blogdata = paginator.page(request.GET.get('page', 1))
 
+            except PageNotAnInteger:
 
-    title = request.GET.get('title')
+                blogdata = paginator.page(1)
 
-    if title:
+            except EmptyPage:
 
-        blogdata = NewsPost.objects.filter(post_title__contains=title,is_active=1,status='active')
+                blogdata = paginator.page(paginator.num_pages)
 
-        if blogdata.exists():
+            data=chrome_context(ads=HEADER_ADS, BlogData=0, mainnews=0, vidnews=2, Slider=0, latnews=0)
 
-            data={
+            data.update({
 
                 'indseo':seo,
 
@@ -537,37 +274,7 @@ def find_post_by_title(request):
 
                 'bplogo':bp,
 
-                'Blogcat':Category,
-
-                'adtop':adtop,
-
-                'adleft':adleft,
-
-                'adright':adright,
-
-                'adtl':adtopleft,
-
-                'adtr':adtopright,
-
-                'bgad':festive,
-
-                'headtopad':tophead,
-
-                'popup':popupad,
-
-                'Articale':articales,
-
-                'vidart':vidarticales,
-
-                'headline':headline,
-
-                'bnews':brknews,
-
-                'vidnews':podcast,
-
-                'trendpost':trending,
-
-                }
+                })
 
             return render(request, 'all-news.html', data)
 
@@ -615,6 +322,8 @@ def ErrorPage(request):
 
 # All-News-----------
 
+@anonymous_page_cache('news-lists')
+
 def AllNews(request,slug):
 
     alnslug='/all-news/'+ slug
@@ -623,2875 +332,1295 @@ def AllNews(request,slug):
 
     current_datetime = datetime.now()
 
-    page_number = request.GET.get('page', 1)  
-
-    # Get the page number from the request, default to 1 if not provided
-
     if slug == 'articles':
 
-        blogdata=NewsPost.objects.filter(schedule_date__lt=current_datetime,articles=1,status='active').order_by('-schedule_date')
+        blogdata=NewsPost.objects.cards().filter(schedule_date__lt=current_datetime,articles=1,status='active')
 
-        podcast=VideoNews.objects.filter(is_active='active',articles=1).order_by('-schedule_date') [:3]
+        podcast=VideoNews.objects.cards().filter(is_active='active',articles=1).order_by('-schedule_date') [:3]
 
     elif slug == 'breaking':
 
-        blogdata=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-schedule_date') [:100]
+        blogdata=NewsPost.objects.cards().filter(BreakingNews=1,status='active')
 
-        podcast=VideoNews.objects.filter(is_active='active',BreakingNews=1).order_by('-schedule_date') [:3]
+        podcast=VideoNews.objects.cards().filter(is_active='active',BreakingNews=1).order_by('-schedule_date') [:3]
 
     elif slug == 'head-lines':
 
-        blogdata=NewsPost.objects.filter(schedule_date__lt=current_datetime,Head_Lines=1,status='active').order_by('-schedule_date') [:100]
+        blogdata=NewsPost.objects.cards().filter(schedule_date__lt=current_datetime,Head_Lines=1,status='active')
 
-        podcast=VideoNews.objects.filter(is_active='active',Head_Lines=1).order_by('-schedule_date') [:3]
+        podcast=VideoNews.objects.cards().filter(is_active='active',Head_Lines=1).order_by('-schedule_date') [:3]
 
     elif slug == 'trending':
 
-        blogdata=NewsPost.objects.filter(schedule_date__lt=current_datetime,trending=1,status='active').order_by('-schedule_date') [:100]
+        blogdata=NewsPost.objects.cards().filter(schedule_date__lt=current_datetime,trending=1,status='active')
 
-        podcast=VideoNews.objects.filter(is_active='active',trending=1).order_by('-schedule_date') [:3]
-
-    elif slug == 'latest':
-
-        blogdata=NewsPost.objects.filter(schedule_date__lt=current_datetime,is_active=1,status='active').order_by('-schedule_date') [:1000]
-
-        podcast=VideoNews.objects.filter(is_active='active',).order_by('-schedule_date') [:3]
+        podcast=VideoNews.objects.cards().filter(is_active='active',trending=1).order_by('-schedule_date') [:3]
 
     else:
 
-        blogdata=NewsPost.objects.filter(schedule_date__lt=current_datetime,is_active=1,status='active').order_by('-schedule_date') [:200]
+        blogdata=NewsPost.objects.cards().filter(schedule_date__lt=current_datetime,is_active=1,status='active')
 
-        podcast=VideoNews.objects.filter(is_active='active').order_by('-schedule_date') [:3]
+        podcast=VideoNews.objects.cards().filter(is_active='active').order_by('-schedule_date') [:3]
 
     
 
-    paginator = Paginator(blogdata, 12)   
-
-
-
-    try:
-
-        blogdata = paginator.page(page_number)
+    # cursor pages (?after=/?before=), no COUNT and no OFFSET however deep
+    blogdata = keyset_page(blogdata, request, 12)
 
-    except PageNotAnInteger:
-
-        # If page is not an integer, deliver first page.
-
-        blogdata = paginator.page(1)
-
-    except EmptyPage:
+        
 
-        # If page is out of range (e.g. 9999), deliver last page of results.
+    events=NewsPost.objects.cards().filter(Event=1,status='active').order_by('-id') [:10]
 
-        blogdata = paginator.page(paginator.num_pages) 
+    bp=BrandPartner.objects.filter(is_active=1).order_by('-id') [:20]
 
-        
+    data=chrome_context(ads=HEADER_ADS, BlogData=0, Articale=12)
 
-    mainnews=NewsPost.objects.filter(schedule_date__lt=current_datetime,status='active').order_by('order')[:4]
+    data.update({
 
-    events=NewsPost.objects.filter(Event=1,status='active').order_by('-id') [:10]
+            'indseo':seo,
 
-    bp=BrandPartner.objects.filter(is_active=1).order_by('-id') [:20]
+            'BlogData':blogdata,
 
-    articales=NewsPost.objects.filter(schedule_date__lt=current_datetime,articles=1,status='active').order_by('-schedule_date') [:12]
+            'event':events,
 
-    vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:2]
+            'bplogo':bp,
 
-    headline=NewsPost.objects.filter(schedule_date__lt=current_datetime,Head_Lines=1,status='active').order_by('-schedule_date') [:14]
+            'vidnews':podcast,
 
-    trending=NewsPost.objects.filter(schedule_date__lt=current_datetime,trending=1,status='active').order_by('-schedule_date') [:7]
+        })
 
-    brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-schedule_date') [:8]
+    return render(request,'all-news.html',data)
 
-    Category=category.objects.filter(cat_status='active').order_by('order') [:12]
+    #return render(request, 'index.html')
 
-# --------------ad-manage-meny--------------
+# News-details-page--end--------
 
-    adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
 
-    adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
 
-    
 
-    adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
 
-    adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
+# Video-all-News-details-----------
 
-    
+def AllvideoNews(request,slug):
 
-    adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
+    alnslug='/all-video-news/'+ slug
 
-    adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
+    seo=seo_optimization.objects.get(pageslug=alnslug)
 
     
 
-    adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
-
-    adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
+    if slug == 'articles':
 
-    
+        blogdata=VideoNews.objects.cards().filter(articles=1,is_active='active',video_type='video')
 
-    adrcol=ad_category.objects.get(ads_cat_slug='mrec')
+    elif slug == 'breaking':
 
-    adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
+        blogdata=VideoNews.objects.cards().filter(BreakingNews=1,is_active='active',video_type='video')
 
-    
+    elif slug == 'head-lines':
 
-    festbg=ad_category.objects.get(ads_cat_slug='festivebg')
+        blogdata=VideoNews.objects.cards().filter(Head_Lines=1,is_active='active',video_type='video')
 
-    festive=ad.objects.filter(ads_cat_id=festbg.id, is_active=1).order_by('-id') [:1]
+    elif slug == 'trending':
 
-    
+        blogdata=VideoNews.objects.cards().filter(trending=1,is_active='active',video_type='video')
 
-    topad=ad_category.objects.get(ads_cat_slug='topad')
+    elif slug == 'stories':
 
-    tophead=ad.objects.filter(ads_cat_id=topad.id, is_active=1).order_by('-id') [:1]
+        blogdata=VideoNews.objects.cards().filter(is_active='active',video_type='reel')
 
-    popup=ad_category.objects.get(ads_cat_slug='popup')
+    else:
 
-    popupad=ad.objects.filter(ads_cat_id=popup.id, is_active=1).order_by('-id') [:1]
+        blogdata=VideoNews.objects.cards().filter(is_active='active',video_type='video')
 
-# -------------end-ad-manage-meny--------------    
+    blogdata = keyset_page(blogdata, request, 12)
 
-    # slider=NewsPost.objects.filter(id=1).order_by('id')[:5] use for filter value
+        
 
-    
+    events=NewsPost.objects.cards().filter(Event=1,status='active').order_by('-id') [:10]
 
-    slider=NewsPost.objects.filter().order_by('-id')[:5]
+    bp=BrandPartner.objects.filter(is_active=1).order_by('-id') [:20]
 
-    latestnews=NewsPost.objects.all().order_by('-id')[:5]
+    data=chrome_context(ads=HEADER_ADS, vidnews=2)
 
-    data={
+    data.update({
 
             'indseo':seo,
 
             'BlogData':blogdata,
 
-            'mainnews':mainnews,
-
             'event':events,
 
             'bplogo':bp,
 
-            'Slider':slider,
-
-            'Blogcat':Category,
+        })
 
-            'latnews':latestnews,
-
-            'adtop':adtop,
+    return render(request,'all-video-news.html',data)
 
-            'adleft':adleft,
+    #return render(request, 'index.html')
 
-            'adright':adright,
+# Video-all-News-details-page--end--------
 
-            'adtl':adtopleft,
 
-            'adtr':adtopright,
 
-            'bgad':festive,
 
-            'headtopad':tophead,
 
-            'popup':popupad,
+# Events-page----------
 
-            'Articale':articales,
+def UcEvents(request):
 
-            'vidart':vidarticales,
+    seo='Event'
 
-            'headline':headline,
+    eventdata=NewsPost.objects.cards().filter(Event=1,status='active').order_by('-id') [:100]
 
-            'trendpost':trending,
+    data=chrome_context(ads=HEADER_ADS, BlogData=0, mainnews=0, vidnews=2)
 
-            'bnews':brknews,
+    data.update({
 
-            'vidnews':podcast,
+            'indseo':seo,
 
-        }
+            'EventData':eventdata,
 
-   
+        })
 
-    return render(request,'all-news.html',data)
+    return render(request,'upcoming-events.html',data)
 
     #return render(request, 'index.html')
 
-# News-details-page--end--------
+# Events-page--end--------
 
+def eventdetails(request,slug):
 
+    seo='eventdetails'
 
+    subcatid=sub_category.objects.get(subcat_slug=slug)
 
+    
 
-# Video-all-News-details-----------
+    catvid=VideoNews.objects.cards().filter(News_Category=subcatid.id,is_active='active',video_type='video').order_by('order')[:50]
 
-def AllvideoNews(request,slug):
+    if not catvid:
 
-    alnslug='/all-video-news/'+ slug
+        catvid="no data"
 
-    seo=seo_optimization.objects.get(pageslug=alnslug)
+    # posts carrying every #tag of this sub category, an indexed join on the tag table
 
-    
+    # no tags on the sub category: every active post, like the old regex
 
-    if slug == 'articles':
+    subcat_tags=list(subcatid.tags.values_list('id',flat=True))
 
-        blogdata=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('-id')
+    databytag=NewsPost.objects.cards().filter(status='active')
 
-    elif slug == 'breaking':
+    if subcat_tags:
 
-        blogdata=VideoNews.objects.filter(BreakingNews=1,is_active='active',video_type='video').order_by('-id') [:100]
+        databytag=databytag.filter(tags__in=subcat_tags).annotate(matched_tags=Count('tags')).filter(matched_tags=len(subcat_tags))
 
-    elif slug == 'head-lines':
+    databytag=databytag.order_by('-id') [:400]
 
-        blogdata=VideoNews.objects.filter(Head_Lines=1,is_active='active',video_type='video').order_by('-id') [:100]
+    
 
-    elif slug == 'trending':
+    blogdata=NewsPost.objects.cards().filter(is_active=1,status='active',post_cat=subcatid.id).order_by('-id') [:20]
 
-        blogdata=VideoNews.objects.filter(trending=1,is_active='active',video_type='video').order_by('-id') [:100]
+    eventdata=NewsPost.objects.cards().filter(Event=1,status='active').order_by('-id') [:100]
 
-    elif slug == 'stories':
+    
 
-        blogdata=VideoNews.objects.filter(is_active='active',video_type='reel').order_by('-id')
+    events=NewsPost.objects.cards().filter(Event=1,status='active').order_by('-id') [:10]
 
-    else:
+    bp=BrandPartner.objects.filter(is_active=1).order_by('-id') [:20]
 
-        blogdata=VideoNews.objects.filter(is_active='active',video_type='video').order_by('-id')
+    data=chrome_context(ads=HEADER_ADS, vidnews=2)
 
-        
+    data.update({
 
-    mainnews=NewsPost.objects.filter(status='active').order_by('order')[:4]
+            'indseo':seo,
 
-    events=NewsPost.objects.filter(Event=1,status='active').order_by('-id') [:10]
+            'BlogData':blogdata,
 
-    bp=BrandPartner.objects.filter(is_active=1).order_by('-id') [:20]
+            'event':events,
 
-    articales=NewsPost.objects.filter(articles=1,status='active').order_by('-id') [:3]
+            'bplogo':bp,
 
-    vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:2]
+            'CatV':catvid,
 
-    headline=NewsPost.objects.filter(Head_Lines=1,status='active').order_by('-id') [:14]
+            'subcat':subcatid,
 
-    trending=NewsPost.objects.filter(trending=1,status='active').order_by('-id') [:7]
+            'evedata':eventdata,
 
-    brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-id') [:8]
+            'bytag':databytag
 
-    podcast=VideoNews.objects.filter(is_active='active').order_by('-id') [:2]
+        })
 
-    Category=category.objects.filter(cat_status='active').order_by('order') [:12]
+    return render(request,'eventdetails.html',data)
 
-# --------------ad-manage-meny--------------
 
-    adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
 
-    adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
+# News-details-page----------
 
-    
+@conditional_page(VideoNews.objects.all())
 
-    adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
+@anonymous_page_cache('video:{slug}')
 
-    adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
+def videonewsdetails(request,slug):
 
-    
+    seo='video'
 
-    adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
+    viddetails=VideoNews.objects.get(slug=slug)
 
-    adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
+    record_view(viddetails, request)
 
-    
+    data=chrome_context(ads=FESTIVE_ADS, vidart=8, trendpost=4)
 
-    adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
+    data.update({
 
-    adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
+            'indseo':seo,
 
-    
+            'Vnews':viddetails,
 
-    adrcol=ad_category.objects.get(ads_cat_slug='mrec')
+        })
 
-    adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
+    return render(request,'video-news-details.html',data)
 
-    
+    #return render(request, 'index.html')
 
-    festbg=ad_category.objects.get(ads_cat_slug='festivebg')
+# News-details-page--end--------
 
-    festive=ad.objects.filter(ads_cat_id=festbg.id, is_active=1).order_by('-id') [:1]
 
-    
 
-    topad=ad_category.objects.get(ads_cat_slug='topad')
 
-    tophead=ad.objects.filter(ads_cat_id=topad.id, is_active=1).order_by('-id') [:1]
 
-    popup=ad_category.objects.get(ads_cat_slug='popup')
+# cat-details-page---------
 
-    popupad=ad.objects.filter(ads_cat_id=popup.id, is_active=1).order_by('-id') [:1]
+@anonymous_page_cache('subcat:{slug}')
 
-# -------------end-ad-manage-meny--------------    
+def catdetails(request,catlink,slug):
 
-    # slider=NewsPost.objects.filter(id=1).order_by('id')[:5] use for filter value
+    seourl='/'+catlink+'/'+slug
 
-    
+    seoslug = seourl.replace("-", " ").upper()
 
-    slider=NewsPost.objects.filter().order_by('-id')[:5]
+   
 
-    latestnews=NewsPost.objects.all().order_by('-id')[:5]
+    try:
 
-    data={
+        seo = seo_optimization.objects.get(pageslug=seourl)
 
-            'indseo':seo,
+    except seo_optimization.DoesNotExist:
 
-            'BlogData':blogdata,
+        seo=seo_optimization.objects.get(pageslug='https://www.armustnews.com/')
 
-            'mainnews':mainnews,
 
-            'event':events,
 
-            'bplogo':bp,
+    subcatid = sub_category.objects.get(subcat_slug=slug)
 
-            'Slider':slider,
 
-            'Blogcat':Category,
 
-            'latnews':latestnews,
+    blocks = category_blocks(subcatid, request)
 
-            'adtop':adtop,
 
-            'adleft':adleft,
 
-            'adright':adright,
+    for video in blocks['videos']:
 
-            'adtl':adtopleft,
+        video.get_absolute_url = lambda slug=video.slug: f"/video/{slug}"
 
-            'adtr':adtopright,
 
-            'bgad':festive,
 
-            'headtopad':tophead,
 
-            'popup':popupad,
 
-            'Articale':articales,
+    category_name = catlink.replace("-", " ").title()
+    subcategory_name = slug.replace("-", " ").title()
 
-            'vidart':vidarticales,
+    data=chrome_context(ads=FESTIVE_ADS, mainnews=0, vidart=0, bnews=0)
 
-            'headline':headline,
+    data.update({ 
 
-            'trendpost':trending,
+            'indseo':seo,
 
-            'bnews':brknews,
+            'sslug':seoslug,
 
-            'vidnews':podcast,
+            'slugurl':catlink+'/'+slug,
 
-        }
+            'latestnews':blocks['latest'],
 
-   
+            'BlogData':blocks['blogdata'],
 
-    return render(request,'all-video-news.html',data)
+            'headline': blocks['headline'],
 
-    #return render(request, 'index.html')
+            'Articale': blocks['articles'],
 
-# Video-all-News-details-page--end--------
+            'trendpost': blocks['trending'],
 
+            'breakingnews': blocks['brknews'],
 
+            'videos': blocks['videos'],
 
+            'reels': blocks['reels'],
 
+            'vidnews': blocks['podcast'],
 
-# Events-page----------
+            'category_name': category_name,
 
-def UcEvents(request):
+            'subcategory_name': subcategory_name,
 
-    seo='Event'
+        })
 
-    eventdata=NewsPost.objects.filter(Event=1,status='active').order_by('-id') [:100]
 
-    articales=NewsPost.objects.filter(articles=1,status='active').order_by('-id') [:3]
 
-    vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:2]
+    return render(request,'category.html',data)
 
-    headline=NewsPost.objects.filter(Head_Lines=1,status='active').order_by('-id') [:14]
+# cat-details-page--end--------
 
-    trending=NewsPost.objects.filter(trending=1,status='active').order_by('-id') [:7]
 
-    brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-id') [:8]
 
-    podcast=VideoNews.objects.filter(is_active='active').order_by('-id') [:2]
 
-    Category=category.objects.filter(cat_status='active').order_by('order') [:12]
+from service.models import Contact
+# cat-contact-page---------
+def Contactus(request):
+    if request.method == "POST":
+        name = request.POST.get('name')
+        email = request.POST.get('email')
+        subject = request.POST.get('subject')
+        message = request.POST.get('message')
 
-# --------------ad-manage-meny--------------
+        contact = Contact(
+            name=name,
+            email=email,
+            subject=subject,
+            message=message
+        )
+        contact.save()
+        messages.success(request, 'Your message has been submitted successfully.')
+        return redirect('contact-us') 
 
-    adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
 
-    adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
+    data=chrome_context(ads=FESTIVE_ADS)
 
-    
+    return render(request,'contact.html',data)
+# cat-contact-page--end--------
+# cat-contact-page--end--------
 
-    adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
 
-    adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
 
-    
+# cat-registration-page---------
 
-    adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
+def Userregistration(request):
 
-    adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
+    data=chrome_context(ads=FESTIVE_ADS)
 
-    
+    return render(request,'inn/registrations.html',data)
 
-    adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
 
-    adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
 
-    
+def Registeration(request):
 
-    adrcol=ad_category.objects.get(ads_cat_slug='mrec')
+    if request.method == "POST":
 
-    adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
+        fname=request.POST.get('fname')
 
-    
+        lname=request.POST.get('lname')
 
-    festbg=ad_category.objects.get(ads_cat_slug='festivebg')
+        username=request.POST.get('username')
 
-    festive=ad.objects.filter(ads_cat_id=festbg.id, is_active=1).order_by('-id') [:1]
+        email=request.POST.get('email')
 
-    
+        #contact=request.POST.get('contact')
 
-    topad=ad_category.objects.get(ads_cat_slug='topad')
+        if request.POST.get('password1')==request.POST.get('password2'):
 
-    tophead=ad.objects.filter(ads_cat_id=topad.id, is_active=1).order_by('-id') [:1]
+            password=request.POST.get('password1')
 
-    popup=ad_category.objects.get(ads_cat_slug='popup')
+            user=User(
 
-    popupad=ad.objects.filter(ads_cat_id=popup.id, is_active=1).order_by('-id') [:1]
+                first_name=fname,
 
-# -------------end-ad-manage-meny--------------    
+                last_name=lname,
 
-    # slider=NewsPost.objects.filter(id=1).order_by('id')[:5] use for filter value
+                username = username,
 
-    
+                email = email,
 
-    slider=NewsPost.objects.filter().order_by('-id')[:5]
+                )
 
-    latestnews=NewsPost.objects.all().order_by('-id')[:5]
+            user.set_password(password)
 
-    data={
+            user.save()
 
-            'indseo':seo,
+            if user is not None:
 
-            'EventData':eventdata,
+                messages.success(request, 'You Are Registered successfully!')
 
-            'Slider':slider,
+                return redirect(Userlogin)
 
-            'Blogcat':Category,
+            else:
 
-            'latnews':latestnews,
+                messages.success(request, 'You Are Not Registered !')
 
-            'adtop':adtop,
+        else:
 
-            'adleft':adleft,
+            messages.success(request, 'The password dose not match !')
 
-            'adright':adright,
+    return render(request,'registration.html')
 
-            'adtl':adtopleft,
+        #messages.success(request, 'Your message was successfully sent!')
 
-            'adtr':adtopright,
+    
 
-            'bgad':festive,
+# cat-registration-page--end--------
 
-            'headtopad':tophead,
 
-            'popup':popupad,
 
-            'Articale':articales,
+# start-subscriber-page-----------
 
-            'vidart':vidarticales,
 
-            'headline':headline,
 
-            'trendpost':trending,
 
-            'bnews':brknews,
 
-            'vidnews':podcast,
+def SubscribeView(request):
 
-        }
+    if request.method == "POST":
 
-   
+        fname = request.POST.get('fname')
 
-    return render(request,'upcoming-events.html',data)
+        email = request.POST.get('email')
 
-    #return render(request, 'index.html')
 
-# Events-page--end--------
 
-def eventdetails(request,slug):
+        if not fname or not email:
 
-    seo='eventdetails'
+            return JsonResponse({"status": "error", "message": "Name and Email are required."})
 
-    subcatid=sub_category.objects.get(subcat_slug=slug)
 
-    
 
-    catvid=VideoNews.objects.filter(News_Category=subcatid.id,is_active='active',video_type='video').order_by('order')[:50]
+        if SubscribeUser.objects.filter(email=email).exists():
 
-    if not catvid:
+            return JsonResponse({"status": "error", "message": "You have already subscribed!"})
 
-        catvid="no data"
 
-    #using regex post_tag__regex for search  match....
 
-    databytag=NewsPost.objects.filter(status='active').filter(post_tag__regex = rf'^(\D+){subcatid.subcat_tag}(\D+)').order_by('-id') [:400]
+        try:
 
-    
+            ip = request.META.get('REMOTE_ADDR', '')
 
-    blogdata=NewsPost.objects.filter(is_active=1,status='active',post_cat=subcatid.id).order_by('-id') [:20]
+            country = request.META.get('GEOIP_COUNTRY_NAME', '')
 
-    eventdata=NewsPost.objects.filter(Event=1,status='active').order_by('-id') [:100]
+            city = request.META.get('GEOIP_CITY', '')
 
-    
 
-    adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
 
-    adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
+            SubUser = SubscribeUser(
 
-        
+                name=fname,
 
-    mainnews=NewsPost.objects.filter(status='active').order_by('order')[:4]
+                email=email,
 
-    events=NewsPost.objects.filter(Event=1,status='active').order_by('-id') [:10]
+                ip=ip,
 
-    bp=BrandPartner.objects.filter(is_active=1).order_by('-id') [:20]
+                country=country,
 
-    articales=NewsPost.objects.filter(articles=1,status='active').order_by('-id') [:3]
+                city=city,
 
-    vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:2]
+            )
 
-    headline=NewsPost.objects.filter(Head_Lines=1,status='active').order_by('-id') [:14]
+            SubUser.save()
 
-    trending=NewsPost.objects.filter(trending=1,status='active').order_by('-id') [:7]
 
-    brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-id') [:8]
 
-    podcast=VideoNews.objects.filter(is_active='active').order_by('-id') [:2]
+            message = f"""
 
-    Category=category.objects.filter(cat_status='active').order_by('order') [:12]
+            Subject: Welcome to DXB News Network - Your Source for Insightful News!
 
-# --------------ad-manage-meny--------------
+            Dear {fname},
 
-    adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
+            Thank you for subscribing to DXB News Network! Stay updated with the latest news.
 
-    adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
+                Regards,
 
-    
+                DXB News Network
 
-    adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
+            """
 
-    adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
+            send_mail(
 
-    
+                "Welcome to DXB News Network",
 
-    adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
+                message,
 
-    adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
+                "no-reply@armustnews.com",
 
-    
+                [email],
 
-    adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
+                fail_silently=False,
 
-    adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
+            )
 
-    
+            return JsonResponse({"status": "success", "message": "You are registered successfully!"})
 
-    adrcol=ad_category.objects.get(ads_cat_slug='mrec')
 
-    adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
 
-    
+        except Exception as e:
 
-    festbg=ad_category.objects.get(ads_cat_slug='festivebg')
+            return JsonResponse({"status": "error", "message": "An error occurred while saving your data."})
 
-    festive=ad.objects.filter(ads_cat_id=festbg.id, is_active=1).order_by('-id') [:1]
+    return render(request, 'index.html')
 
-    
 
-    topad=ad_category.objects.get(ads_cat_slug='topad')
 
-    tophead=ad.objects.filter(ads_cat_id=topad.id, is_active=1).order_by('-id') [:1]
+@csrf_exempt
 
-    popup=ad_category.objects.get(ads_cat_slug='popup')
+def send_otp(request):
 
-    popupad=ad.objects.filter(ads_cat_id=popup.id, is_active=1).order_by('-id') [:1]
+    if request.method == "POST":
 
-# -------------end-ad-manage-meny--------------    
+        email = request.POST.get("email")
 
-    # slider=NewsPost.objects.filter(id=1).order_by('id')[:5] use for filter value
+        otp = random.randint(100000, 999999)
 
-    
+        cache.set(f"otp_{email}", otp, timeout=300)
 
-    slider=NewsPost.objects.filter().order_by('-id')[:5]
 
-    latestnews=NewsPost.objects.all().order_by('-id')[:5]
 
-    data={
+        otp_from_cache = cache.get(f"otp_{email}")
 
-            'indseo':seo,
 
-            'BlogData':blogdata,
 
-            'mainnews':mainnews,
+        send_mail(
 
-            'event':events,
+            "Your Secure OTP for DXB News Network",
 
-            'bplogo':bp,
+            f"Hello,\n\nYour OTP is: {otp_from_cache}.\n\nPlease use this code within 5 minutes. If you didn't request this, please ignore this email.\n\nThank you,\nDXB News Network Team",
 
-            'Slider':slider,
+            "no-reply@armustnews.com",
 
-            'Blogcat':Category,
+            [email],
 
-            'latnews':latestnews,
+            fail_silently=False,
 
-            'adtop':adtop,
+        )
 
-            'adleft':adleft,
 
-            'adright':adright,
 
-            'adtl':adtopleft,
+        return JsonResponse({"status": "success", "message": "OTP sent successfully!"})
 
-            'adtr':adtopright,
 
-            'bgad':festive,
 
-            'headtopad':tophead,
+    return JsonResponse({"status": "error", "message": "Invalid request"}, status=400)
 
-            'popup':popupad,
 
-            'Articale':articales,
 
-            'vidart':vidarticales,
+@csrf_exempt
 
-            'headline':headline,
+def verify_otp(request):
 
-            'trendpost':trending,
+    if request.method == "POST":
 
-            'bnews':brknews,
+        email = request.POST.get("email")
 
-            'vidnews':podcast,
+        entered_otp = request.POST.get("otp")
 
-            'CatV':catvid,
 
-            'subcat':subcatid,
 
-            'evedata':eventdata,
+        stored_otp = cache.get(f"otp_{email}")
 
-            'bytag':databytag
 
-        }
 
-    return render(request,'eventdetails.html',data)
+        if stored_otp and str(stored_otp) == entered_otp:
 
+            return JsonResponse({"status": "success", "message": "OTP verified successfully!"})
 
+        else:
 
-# News-details-page----------
+            return JsonResponse({"status": "error", "message": "Invalid or expired OTP"})
 
-def videonewsdetails(request,slug):
+    return JsonResponse({"status": "error", "message": "Invalid request"}, status=400)
 
-    counter=VideoNews.objects.get(slug=slug)
+# subscribe-page--end--------
 
-    counter.viewcounter=counter.viewcounter + 1
 
-    counter.save()
 
-    seo='video'
 
-    current_datetime = datetime.now()
 
-    viddetails=VideoNews.objects.get(slug=slug)
+def Reg_Form(request):
 
-    blogdata=NewsPost.objects.filter(schedule_date__lt=current_datetime,is_active=1,status='active').order_by('-id') [:20]
+    if request.method == "POST":
 
-    mainnews=NewsPost.objects.filter(status='active').order_by('order')[:4]
+            pname=request.POST.get('person_name')
 
-    articales=NewsPost.objects.filter(schedule_date__lt=current_datetime,articles=1,status='active').order_by('-id') [:3]
+            cname=request.POST.get('company_name')
 
-    
+            cadd=request.POST.get('company_address')
 
-    vidarticales=VideoNews.objects.filter(schedule_date__lt=current_datetime,articles=1,is_active='active',video_type='video').order_by('order')[:8]
+            phone=request.POST.get('phone')
 
-    headline=NewsPost.objects.filter(schedule_date__lt=current_datetime,Head_Lines=1,status='active').order_by('-id') [:14]
+            email=request.POST.get('email')
 
-    trending=NewsPost.objects.filter(schedule_date__lt=current_datetime,trending=1,status='active').order_by('-id') [:4]
+            city=request.POST.get('city')
 
-    brknews=NewsPost.objects.filter(schedule_date__lt=current_datetime,BreakingNews=1,status='active').order_by('-id') [:8]
+            country=request.POST.get('country')
 
-    podcast=VideoNews.objects.filter(schedule_date__lt=current_datetime,is_active='active').order_by('-id') [:1]
+            dgn=request.POST.get('designation')
 
-    # --------------ad-manage-meny--------------
+            et=request.POST.get('enquiry_type')
 
-    adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
+            staff=request.POST.get('executive_names')
 
-    adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
+            sf=request.POST.get('source_from')
 
-    
+            win=request.POST.get('walk_in')
 
-    adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
+            ip=request.META['REMOTE_ADDR']
 
-    adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
+            
 
-    
+            RegUser=RegForm(
 
-    adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
+                person_name=pname,
 
-    adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
+                company_name=cname,
 
-    
+                company_address= cadd,
 
-    adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
+                phone=phone,
 
-    adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
+                email=email,
 
-    
-
-    adrcol=ad_category.objects.get(ads_cat_slug='mrec')
-
-    adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    festbg=ad_category.objects.get(ads_cat_slug='festivebg')
-
-    festive=ad.objects.filter(ads_cat_id=festbg.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    # festivetop
-
-    # festiveleft
-
-    # festiveright
-
-# -------------end-ad-manage-meny--------------    
-
-    # slider=NewsPost.objects.filter(id=1).order_by('id')[:5] use for filter value
-
-    Category=category.objects.filter(cat_status='active').order_by('order') [:12]
-
-    slider=NewsPost.objects.filter().order_by('-id')[:5]
-
-    latestnews=NewsPost.objects.all().order_by('-id')[:5]
-
-    data={
-
-            'indseo':seo,
-
-            'Vnews':viddetails,
-
-            'BlogData':blogdata,
-
-            'mainnews':mainnews,
-
-            'Slider':slider,
-
-            'Blogcat':Category,
-
-            'latnews':latestnews,
-
-            'adtop':adtop,
-
-            'adleft':adleft,
-
-            'adright':adright,
-
-            'adtl':adtopleft,
-
-            'adtr':adtopright,
-
-            'bgad':festive,
-
-            'Articale':articales,
-
-            'vidart':vidarticales,
-
-            'headline':headline,
-
-            'trendpost':trending,
-
-            'bnews':brknews,
-
-            'vidnews':podcast,
-
-        }
-
-    return render(request,'video-news-details.html',data)
-
-    #return render(request, 'index.html')
-
-# News-details-page--end--------
-
-
-
-
-
-# cat-details-page---------
-
-def catdetails(request,catlink,slug):
-
-    current_datetime = datetime.now()
-
-    seourl='/'+catlink+'/'+slug
-
-    seoslug = seourl.replace("-", " ").upper()
-
-   
-
-    try:
-
-        seo = seo_optimization.objects.get(pageslug=seourl)
-
-    except seo_optimization.DoesNotExist:
-
-        seo=seo_optimization.objects.get(pageslug='https://www.armustnews.com/')
-
-
-
-    subcatid = sub_category.objects.get(subcat_slug=slug)
-
-
-
-    Latest_News = NewsPost.objects.filter(post_cat=subcatid.id, schedule_date__lt=current_datetime,is_active=1, status='active').order_by('-id')[:3]
-
-    blogdata_list = NewsPost.objects.filter(post_cat=subcatid.id, schedule_date__lt=current_datetime, status='active').order_by('-id')
-
-    headline = NewsPost.objects.filter(post_cat=subcatid.id, schedule_date__lt=current_datetime, Head_Lines=1, status='active').order_by('-id')
-
-    articales = NewsPost.objects.filter(post_cat=subcatid.id, schedule_date__lt=current_datetime, articles=1, status='active').order_by('-id')
-
-    trending = NewsPost.objects.filter(post_cat=subcatid.id, schedule_date__lt=current_datetime, trending=1, status='active').order_by('-id')
-
-    brknews = NewsPost.objects.filter(post_cat=subcatid.id, schedule_date__lt=current_datetime, BreakingNews=1, status='active').order_by('-id')
-
-    videos = VideoNews.objects.filter(schedule_date__lt=current_datetime, is_active='active', video_type='video').order_by('order')
-
-    reels = VideoNews.objects.filter(News_Category=subcatid.id,schedule_date__lt=current_datetime, is_active='active', video_type='reel').order_by('order')
-
-    podcast = VideoNews.objects.filter(News_Category=subcatid.id,schedule_date__lt=current_datetime, is_active='active').order_by('order')
-
-
-
-    blogdata = Paginator(blogdata_list, 12).get_page(request.GET.get('page'))
-
-    headline_page = Paginator(headline, 5).get_page(request.GET.get('headline_page'))
-
-    articles_page = Paginator(articales, 5).get_page(request.GET.get('articles_page'))
-
-    trending_page = Paginator(trending, 7).get_page(request.GET.get('trending_page'))
-
-    brknews_page = Paginator(brknews, 8).get_page(request.GET.get('brknews_page'))
-
-    videos_page = Paginator(videos, 10).get_page(request.GET.get('videos_page'))
-
-    reels_page = Paginator(reels, 10).get_page(request.GET.get('reels_page'))
-
-    podcast_page = Paginator(podcast, 7).get_page(request.GET.get('podcast_page'))
-
-
-
-    for video in videos_page:
-
-        video.get_absolute_url = lambda slug=video.slug: f"/video/{slug}"
-
-
-
-
-
-    # --------------ad-manage-meny--------------
-
-    adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
-
-    adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
-
-    adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
-
-    adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
-
-    adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adrcol=ad_category.objects.get(ads_cat_slug='mrec')
-
-    adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
-
-    festbg=ad_category.objects.get(ads_cat_slug='festivebg')
-
-    festive=ad.objects.filter(ads_cat_id=festbg.id, is_active=1).order_by('-id') [:1]
-
-    
-
-# -------------end-ad-manage-meny--------------   
-
-    Category=category.objects.filter(cat_status='active').order_by('order') [:12]
-
-    slider=NewsPost.objects.filter().order_by('-id')[:5]
-
-    latestnews=NewsPost.objects.all().order_by('-id')[:5]
-    category_name = catlink.replace("-", " ").title()
-    subcategory_name = slug.replace("-", " ").title()
-
-    data={ 
-
-            'indseo':seo,
-
-            'sslug':seoslug,
-
-            'slugurl':catlink+'/'+slug,
-
-            'latestnews':Latest_News,
-
-            'BlogData':blogdata,
-
-            'headline': headline_page,
-
-            'Articale': articles_page,
-
-            'trendpost': trending_page,
-
-            'breakingnews': brknews_page,
-
-            'videos': videos_page,
-
-            'reels': reels_page,
-
-            'vidnews': podcast_page,
-
-            'Slider':slider,
-
-            'Blogcat':Category,
-
-            'latnews':latestnews,
-
-            'adtop':adtop,
-
-            'adleft':adleft,
-
-            'adright':adright,
-
-            'adtl':adtopleft,
-
-            'adtr':adtopright,
-
-            'bgad':festive,
-            
-            'category_name': category_name,
-
-            'subcategory_name': subcategory_name,
-
-        }
-
-
-
-    return render(request,'category.html',data)
-
-# cat-details-page--end--------
-
-
-
-
-from service.models import Contact
-# cat-contact-page---------
-def Contactus(request):
-    if request.method == "POST":
-        name = request.POST.get('name')
-        email = request.POST.get('email')
-        subject = request.POST.get('subject')
-        message = request.POST.get('message')
-
-        contact = Contact(
-            name=name,
-            email=email,
-            subject=subject,
-            message=message
-        )
-        contact.save()
-        messages.success(request, 'Your message has been submitted successfully.')
-        return redirect('contact-us') 
-
-
-    blogdata=NewsPost.objects.filter(is_active=1,status='active').order_by('-id') [:20]
-    mainnews=NewsPost.objects.filter(status='active').order_by('order')[:4]
-    articales=NewsPost.objects.filter(articles=1,status='active').order_by('-id') [:3]
-    vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:2]
-    headline=NewsPost.objects.filter(Head_Lines=1,status='active').order_by('-id') [:14]
-    trending=NewsPost.objects.filter(trending=1,status='active').order_by('-id') [:7]
-    brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-id') [:8]
-    podcast=VideoNews.objects.filter(is_active='active').order_by('-id') [:1]
-    Category=category.objects.filter(cat_status='active').order_by('order') [:12]
-    
-    # --------------ad-manage-meny--------------
-    adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
-    adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
-    
-    adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
-    adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
-    
-    adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
-    adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
-    
-    adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
-    adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
-    
-    adrcol=ad_category.objects.get(ads_cat_slug='mrec')
-    adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
-    festbg=ad_category.objects.get(ads_cat_slug='festivebg')
-    festive=ad.objects.filter(ads_cat_id=festbg.id, is_active=1).order_by('-id') [:1]
-# -------------end-ad-manage-meny--------------   
-    # slider=NewsPost.objects.filter(id=1).order_by('id')[:5] use for filter value
-    
-    slider=NewsPost.objects.filter().order_by('-id')[:5]
-    latestnews=NewsPost.objects.all().order_by('-id')[:5]
-    data={
-            'BlogData':blogdata,
-            'mainnews':mainnews,
-            'Slider':slider,
-            'Blogcat':Category,
-            'latnews':latestnews,
-            'adtop':adtop,
-            'adleft':adleft,
-            'adright':adright,
-            'adtl':adtopleft,
-            'adtr':adtopright,
-            'bgad':festive,
-            'Articale':articales,
-            'vidart':vidarticales,
-            'headline':headline,
-            'trendpost':trending,
-            'bnews':brknews,
-            'vidnews':podcast,
-        }
-    return render(request,'contact.html',data)
-# cat-contact-page--end--------
-# cat-contact-page--end--------
-
-
-
-# cat-registration-page---------
-
-def Userregistration(request):
-
-    blogdata=NewsPost.objects.filter(is_active=1,status='active').order_by('-id') [:20]
-
-    mainnews=NewsPost.objects.filter(status='active').order_by('order')[:4]
-
-    articales=NewsPost.objects.filter(articles=1,status='active').order_by('-id') [:3]
-
-    vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:2]
-
-    headline=NewsPost.objects.filter(Head_Lines=1,status='active').order_by('-id') [:14]
-
-    trending=NewsPost.objects.filter(trending=1,status='active').order_by('-id') [:7]
-
-    brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-id') [:8]
-
-    podcast=VideoNews.objects.filter(is_active='active').order_by('-id') [:1]
-
-    Category=category.objects.filter(cat_status='active').order_by('order') [:12]
-
-    
-
-    # --------------ad-manage-meny--------------
-
-    adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
-
-    adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
-
-    adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
-
-    adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
-
-    adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adrcol=ad_category.objects.get(ads_cat_slug='mrec')
-
-    adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
-
-    festbg=ad_category.objects.get(ads_cat_slug='festivebg')
-
-    festive=ad.objects.filter(ads_cat_id=festbg.id, is_active=1).order_by('-id') [:1]
-
-    # festivetop
-
-    # festiveleft
-
-    # festiveright
-
-# -------------end-ad-manage-meny--------------   
-
-    # slider=NewsPost.objects.filter(id=1).order_by('id')[:5] use for filter value
-
-    
-
-    slider=NewsPost.objects.filter().order_by('-id')[:5]
-
-    latestnews=NewsPost.objects.all().order_by('-id')[:5]
-
-    data={
-
-            'BlogData':blogdata,
-
-            'mainnews':mainnews,
-
-            'Slider':slider,
-
-            'Blogcat':Category,
-
-            'latnews':latestnews,
-
-            'adtop':adtop,
-
-            'adleft':adleft,
-
-            'adright':adright,
-
-            'adtl':adtopleft,
-
-            'adtr':adtopright,
-
-            'bgad':festive,
-
-            'Articale':articales,
-
-            'vidart':vidarticales,
-
-            'headline':headline,
-
-            'trendpost':trending,
-
-            'bnews':brknews,
-
-            'vidnews':podcast,
-
-        }
-
-    return render(request,'inn/registrations.html',data)
-
-
-
-def Registeration(request):
-
-    if request.method == "POST":
-
-        fname=request.POST.get('fname')
-
-        lname=request.POST.get('lname')
-
-        username=request.POST.get('username')
-
-        email=request.POST.get('email')
-
-        #contact=request.POST.get('contact')
-
-        if request.POST.get('password1')==request.POST.get('password2'):
-
-            password=request.POST.get('password1')
-
-            user=User(
-
-                first_name=fname,
-
-                last_name=lname,
-
-                username = username,
-
-                email = email,
-
-                )
-
-            user.set_password(password)
-
-            user.save()
-
-            if user is not None:
-
-                messages.success(request, 'You Are Registered successfully!')
-
-                return redirect(Userlogin)
-
-            else:
-
-                messages.success(request, 'You Are Not Registered !')
-
-        else:
-
-            messages.success(request, 'The password dose not match !')
-
-    return render(request,'registration.html')
-
-        #messages.success(request, 'Your message was successfully sent!')
-
-    
-
-# cat-registration-page--end--------
-
-
-
-# start-subscriber-page-----------
-
-
-
-
-
-def SubscribeView(request):
-
-    if request.method == "POST":
-
-        fname = request.POST.get('fname')
-
-        email = request.POST.get('email')
-
-
-
-        if not fname or not email:
-
-            return JsonResponse({"status": "error", "message": "Name and Email are required."})
-
-
-
-        if SubscribeUser.objects.filter(email=email).exists():
-
-            return JsonResponse({"status": "error", "message": "You have already subscribed!"})
-
-
-
-        try:
-
-            ip = request.META.get('REMOTE_ADDR', '')
-
-            country = request.META.get('GEOIP_COUNTRY_NAME', '')
-
-            city = request.META.get('GEOIP_CITY', '')
-
-
-
-            SubUser = SubscribeUser(
-
-                name=fname,
-
-                email=email,
-
-                ip=ip,
-
-                country=country,
-
-                city=city,
-
-            )
-
-            SubUser.save()
-
-
-
-            message = f"""
-
-            Subject: Welcome to DXB News Network - Your Source for Insightful News!
-
-            Dear {fname},
-
-            Thank you for subscribing to DXB News Network! Stay updated with the latest news.
-
-                Regards,
-
-                DXB News Network
-
-            """
-
-            send_mail(
-
-                "Welcome to DXB News Network",
-
-                message,
-
-                "no-reply@armustnews.com",
-
-                [email],
-
-                fail_silently=False,
-
-            )
-
-            return JsonResponse({"status": "success", "message": "You are registered successfully!"})
-
-
-
-        except Exception as e:
-
-            return JsonResponse({"status": "error", "message": "An error occurred while saving your data."})
-
-    return render(request, 'index.html')
-
-
-
-@csrf_exempt
-
-def send_otp(request):
-
-    if request.method == "POST":
-
-        email = request.POST.get("email")
-
-        otp = random.randint(100000, 999999)
-
-        cache.set(f"otp_{email}", otp, timeout=300)
-
-
-
-        otp_from_cache = cache.get(f"otp_{email}")
-
-
-
-        send_mail(
-
-            "Your Secure OTP for DXB News Network",
-
-            f"Hello,\n\nYour OTP is: {otp_from_cache}.\n\nPlease use this code within 5 minutes. If you didn't request this, please ignore this email.\n\nThank you,\nDXB News Network Team",
-
-            "no-reply@armustnews.com",
-
-            [email],
-
-            fail_silently=False,
-
-        )
-
-
-
-        return JsonResponse({"status": "success", "message": "OTP sent successfully!"})
-
-
-
-    return JsonResponse({"status": "error", "message": "Invalid request"}, status=400)
-
-
-
-@csrf_exempt
-
-def verify_otp(request):
-
-    if request.method == "POST":
-
-        email = request.POST.get("email")
-
-        entered_otp = request.POST.get("otp")
-
-
-
-        stored_otp = cache.get(f"otp_{email}")
-
-
-
-        if stored_otp and str(stored_otp) == entered_otp:
-
-            return JsonResponse({"status": "success", "message": "OTP verified successfully!"})
-
-        else:
-
-            return JsonResponse({"status": "error", "message": "Invalid or expired OTP"})
-
-    return JsonResponse({"status": "error", "message": "Invalid request"}, status=400)
-
-# subscribe-page--end--------
-
-
-
-
-
-def Reg_Form(request):
-
-    if request.method == "POST":
-
-            pname=request.POST.get('person_name')
-
-            cname=request.POST.get('company_name')
-
-            cadd=request.POST.get('company_address')
-
-            phone=request.POST.get('phone')
-
-            email=request.POST.get('email')
-
-            city=request.POST.get('city')
-
-            country=request.POST.get('country')
-
-            dgn=request.POST.get('designation')
-
-            et=request.POST.get('enquiry_type')
-
-            staff=request.POST.get('executive_names')
-
-            sf=request.POST.get('source_from')
-
-            win=request.POST.get('walk_in')
-
-            ip=request.META['REMOTE_ADDR']
-
-            
-
-            RegUser=RegForm(
-
-                person_name=pname,
-
-                company_name=cname,
-
-                company_address= cadd,
-
-                phone=phone,
-
-                email=email,
-
-                city= city,
-
-                country=country,
-
-                diesgantion=dgn,
-
-                enquiry_type=et,
-
-                executive_names=staff,
-
-                source_from=sf,
-
-                walk_in=win,
-
-                ip=ip
-
-                )
-
-            RegUser.save()
-
-            if RegUser is not None:
-
-                messages.success(request, 'You Are Registered successfully!')
-
-                return redirect(thanks)
-
-            else:
-
-                messages.success(request, 'You Are Not Registered !')
-
-        
-
-    return render(request,'thanks.html')
-
-        #messages.success(request, 'Your message was successfully sent!')
-
-    
-
-# cat-subscribe-page--end--------
-
-
-
-# cat-Userlogin-page---------
-
-def Userlogin(request):
-
-    seo=seo_optimization.objects.get(pageslug='/login')
-
-    if request.method == "POST":
-
-        uname=request.POST.get('username')
-
-        password=request.POST.get('password')
-
-        user = authenticate(username=uname, password=password)
-
-        if user is not None:
-
-            login(request,user)
-
-            return redirect(Userdashboard)
-
-        else:
-
-            messages.success(request, 'User and Password Wrong!')
-
-            
-
-        return render(request,'login.html')
-
-      
-
-    else:    
-
-        blogdata=NewsPost.objects.filter(is_active=1,status='active').order_by('-id') [:20]
-
-        mainnews=NewsPost.objects.filter(status='active').order_by('order')[:4]
-
-        articales=NewsPost.objects.filter(articles=1,status='active').order_by('-id') [:3]
-
-        vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:2]
-
-        headline=NewsPost.objects.filter(Head_Lines=1,status='active').order_by('-id') [:14]
-
-        trending=NewsPost.objects.filter(trending=1,status='active').order_by('-id') [:7]
-
-        brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-id') [:8]
-
-        podcast=VideoNews.objects.filter(is_active='active').order_by('-id') [:1]
-
-        Category=category.objects.filter(cat_status='active').order_by('order') [:12]
-
-
-
-        # --------------ad-manage-meny--------------
-
-        adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
-
-        adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
-
-        
-
-        adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
-
-        adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
-
-        
-
-        adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
-
-        adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
-
-        
-
-        adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
-
-        adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
-
-        
-
-        adrcol=ad_category.objects.get(ads_cat_slug='mrec')
-
-        adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
-
-        festbg=ad_category.objects.get(ads_cat_slug='festivebg')
-
-        festive=ad.objects.filter(ads_cat_id=festbg.id, is_active=1).order_by('-id') [:1]
-
-    # festivetop
-
-    # festiveleft
-
-    # festiveright
-
-    # -------------end-ad-manage-meny--------------  
-
-    # slider=NewsPost.objects.filter(id=1).order_by('id')[:5] use for filter value
-
-
-
-        slider=NewsPost.objects.filter().order_by('-id')[:5]
-
-        latestnews=NewsPost.objects.all().order_by('-id')[:5]
-
-        data={
-
-                'indseo':seo,
-
-                'BlogData':blogdata,
-
-                'mainnews':mainnews,
-
-                'Slider':slider,
-
-                'Blogcat':Category,
-
-                'latnews':latestnews,
-
-                'adtop':adtop,
-
-                'adleft':adleft,
-
-                'adright':adright,
-
-                'adtl':adtopleft,
-
-                'adtr':adtopright,
-
-                'bgad':festive,
-
-                'Articale':articales,
-
-                'vidart':vidarticales,
-
-                'headline':headline,
-
-                'trendpost':trending,
-
-                'bnews':brknews,
-
-                'vidnews':podcast,
-
-            }
-
-    return render(request,'inn/login.html',data)
-
-
-
-# def Logincheck(request):
-
-#     if request.method == "POST":
-
-#         form = AuthenticationForm(request, data=request.POST)
-
-#         if form.is_valid():
-
-#             user=form.get_user()
-
-#             login(request,user)
-
-#             return redirect(Userdashboard)
-
-#     else:
-
-#         initial_data={'username':'','password':''}
-
-#         form =AuthenticationForm(initial=initial_data)
-
-#         #return redirect('Userlogin')
-
-#     return render(request,'login.html',{'form':form})
-
-# cat-Userlogin-page--end--------
-
-
-
-# cat-Userdashboard-page---------
-
-@login_required(login_url="/login")
-
-def Userdashboard(request):
-
-    blogdata=NewsPost.objects.filter(is_active=1,status='active').order_by('-id') [:20]
-
-    mainnews=NewsPost.objects.filter(status='active').order_by('order')[:4]
-
-    articales=NewsPost.objects.filter(articles=1,status='active').order_by('-id') [:3]
-
-    vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:2]
-
-    headline=NewsPost.objects.filter(Head_Lines=1,status='active').order_by('-id') [:14]
-
-    trending=NewsPost.objects.filter(trending=1,status='active').order_by('-id') [:3]
-
-    brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-id') [:8]
-
-    podcast=VideoNews.objects.filter(is_active='active').order_by('-id') [:1]
-
-    Category=category.objects.filter(cat_status='active').order_by('order') [:12]
-
-    Categories=category.objects.filter(cat_status='active').order_by('order') [:11]
-
-    # --------------ad-manage-meny--------------
-
-    adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
-
-    adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
-
-
-
-    adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
-
-    adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
-
-
-
-    adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
-
-    adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
-
-
-
-    adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
-
-    adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
-
-
-
-    adrcol=ad_category.objects.get(ads_cat_slug='mrec')
-
-    adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
-
-
-
-    slider=NewsPost.objects.filter().order_by('-id')[:5]
-
-    latestnews=NewsPost.objects.all().order_by('-id')[:5]
-
-    data={
-
-            'BlogData':blogdata,
-
-            'mainnews':mainnews,
-
-            'Slider':slider,
-
-            'Blogcat':Category,
-
-            'latnews':latestnews,
-
-            'adtop':adtop,
-
-            'adleft':adleft,
-
-            'adright':adright,
-
-            'adtl':adtopleft,
-
-            'adtr':adtopright,
-
-            'Articale':articales,
-
-            'vidart':vidarticales,
-
-            'headline':headline,
-
-            'trendpost':trending,
-
-            'bnews':brknews,
-
-            'vidnews':podcast,
-
-            'categories':Categories
-
-        }
-
-    
-
-    return render(request,'inn/user-dashboard.html',data)
-
-# cat-Userdashboard-page--end--------
-
-
-
-# cat-ManagePost-page---------
-
-@login_required(login_url="/login")
-
-def ManagePost(request):
-
-    blogdata = NewsPost.objects.filter(author=request.user, is_active=1).order_by('-id')[:20]
-
-    mainnews=NewsPost.objects.filter(status='active').order_by('order')[:4]
-
-    articales=NewsPost.objects.filter(articles=1,status='active').order_by('-id') [:3]
-
-    vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:2]
-
-    headline=NewsPost.objects.filter(Head_Lines=1,status='active').order_by('-id') [:14]
-
-    trending=NewsPost.objects.filter(trending=1,status='active').order_by('-id') [:3]
-
-    brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-id') [:8]
-
-    podcast=VideoNews.objects.filter(is_active='active').order_by('-id') [:1]
-
-    Category=category.objects.filter(cat_status='active').order_by('order') [:12]
-
-    Categories=category.objects.filter(cat_status='active').order_by('order') [:11]
-
-    # --------------ad-manage-meny--------------
-
-    adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
-
-    adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
-
-
-
-    adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
-
-    adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
-
-
-
-    adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
-
-    adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
-
-
-
-    adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
-
-    adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
-
-
-
-    adrcol=ad_category.objects.get(ads_cat_slug='mrec')
-
-    adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
-
-
-
-    slider=NewsPost.objects.filter().order_by('-id')[:5]
-
-    latestnews=NewsPost.objects.all().order_by('-id')[:5]
-
-    data={
-
-            'BlogData':blogdata,
-
-            'mainnews':mainnews,
-
-            'Slider':slider,
-
-            'Blogcat':Category,
-
-            'latnews':latestnews,
-
-            'adtop':adtop,
-
-            'adleft':adleft,
-
-            'adright':adright,
-
-            'adtl':adtopleft,
-
-            'adtr':adtopright,
-
-            'Articale':articales,
-
-            'vidart':vidarticales,
-
-            'headline':headline,
-
-            'trendpost':trending,
-
-            'bnews':brknews,
-
-            'vidnews':podcast,
-
-            'categories':Categories
-
-        }
-
-    
-
-    return render(request,'inn/managepost.html',data)
-
-# cat-ManagePost-page--end--------
-
-
-
-# cat-logout-page---------
-
-def Logout(request):
-
-    logout(request)
-
-    return redirect('login')
-
-
-
-
-
-# cat-career-page---------
-
-@login_required(login_url="/login")
-
-def Career(request):
-
-    if request.method == "POST":    
-
-        name=request.POST.get('name')
-
-        mobnumber=request.POST.get('mobnumber')
-
-        email=request.POST.get('email')
-
-        location=request.POST.get('location')
-
-        nationality=request.POST.get('nationality')
-
-        language=request.POST.get('language')
-
-        address=request.POST.get('address')
-
-        highestedu=request.POST.get('highestedu')
-
-        fos=request.POST.get('fos')
-
-        occupation=request.POST.get('occupation')
-
-        journalexp=request.POST.get('journalexp')
-
-        lastwork=request.POST.get('lastwork')
-
-        portfolio=request.POST.get('portfolio')
-
-        category1=request.POST.get('category')
-
-        equipment=request.POST.get('equipment')
-
-        softwareskill=request.POST.get('softwareskill')
-
-        availability=request.POST.get('availability')
-
-        resume=request.FILES.get('resume')
-
-        whyjoin=request.POST.get('whyjoin')
-
-        anysegment=request.POST.get('anysegment')
-
-        career=CareerApplication(
-
-                name=name,
-
-                mobnumber=mobnumber,
-
-                email=email,
-
-                location=location,
-
-                nationality=nationality,
-
-                language=language,
-
-                address=address,
-
-                highestedu=highestedu,
-
-                fos=fos,
-
-                occupation=occupation,
-
-                journalexp=journalexp,
-
-                lastwork=lastwork,
-
-                portfolio=portfolio,
-
-                category=category1,
-
-                equipment=equipment,
-
-                softwareskill=softwareskill,
-
-                availability=availability,
-
-                resume=resume,
-
-                whyjoin=whyjoin,
-
-                anysegment=anysegment,
-
-                )
-
-        career.save()
-
-        if career is not None:
-
-            messages.success(request, 'You Are Registered successfully!')
-
-            return redirect('career')
-
-        else:
-
-            messages.success(request, 'You Are Not Registered !')
-
-            return redirect('career')
-
-    else:
-
-            blogdata=NewsPost.objects.filter(is_active=1,status='active').order_by('-id') [:20]
-
-            mainnews=NewsPost.objects.filter(status='active').order_by('order')[:4]
-
-            articales=NewsPost.objects.filter(articles=1,status='active').order_by('-id') [:3]
-
-            vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:2]
-
-            headline=NewsPost.objects.filter(Head_Lines=1,status='active').order_by('-id') [:14]
-
-            trending=NewsPost.objects.filter(trending=1,status='active').order_by('-id') [:7]
-
-            brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-id') [:8]
-
-            podcast=VideoNews.objects.filter(is_active='active').order_by('-id') [:1]
-
-            Category=category.objects.filter(cat_status='active').order_by('order') [:12]
-
-            # --------------ad-manage-meny--------------
-
-            adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
-
-            adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
-
-
-
-            adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
-
-            adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
-
-
-
-            adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
-
-            adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
-
-
-
-            adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
-
-            adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
-
-
-
-            adrcol=ad_category.objects.get(ads_cat_slug='mrec')
-
-            adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
-
-
-
-            # festivetop
-
-            # festiveleft
-
-            # festiveright
-
-            # -------------end-ad-manage-meny--------------  
-
-            # slider=NewsPost.objects.filter(id=1).order_by('id')[:5] use for filter value
-
-            
-
-            slider=NewsPost.objects.filter().order_by('-id')[:5]
-
-            latestnews=NewsPost.objects.all().order_by('-id')[:5]
-
-            data={
-
-                    'BlogData':blogdata,
-
-                    'mainnews':mainnews,
-
-                    'Slider':slider,
-
-                    'Blogcat':Category,
-
-                    'latnews':latestnews,
-
-                    'adtop':adtop,
-
-                    'adleft':adleft,
-
-                    'adright':adright,
-
-                    'adtl':adtopleft,
-
-                    'adtr':adtopright,
-
-                    'Articale':articales,
-
-                    'vidart':vidarticales,
-
-                    'headline':headline,
-
-                    'trendpost':trending,
-
-                    'bnews':brknews,
-
-                    'vidnews':podcast,
-
-                }
-
-    return render(request,'inn/career.html',data)
-
-# cat-career-page--end--------
-
-   
-
-# cat-Guestnewspost-page---------
-
-@login_required(login_url="/login")
-
-def Guestpost(request):
-
-    if request.method == "POST":
-
-        if 'upcoming_events' in request.POST:
-
-            start_date = request.POST.get('start_date')
-
-            end_date = request.POST.get('end_date')
-
-        else:
-
-            start_date = date.today()
-
-            end_date = date.today()
-
-            
-
-        post_image = None
-
-        if 'post_image' in request.FILES:
-
-            post_image = request.FILES['post_image']
-
-        
-
-        postcat = request.POST.get('post_cat')
-
-        post_title = request.POST.get('post_title')
-
-        post_short_des = request.POST.get('post_short_des')
-
-        post_des = request.POST.get('post_des')
-
-        post_tag = request.POST.get('post_tag')
-
-        is_active = request.POST.get('is_active')
-
-        Head_Lines = request.POST.get('Head_Lines')
-
-        articles = request.POST.get('articles')
-
-        trending = request.POST.get('trending')
-
-        brknews = request.POST.get('BreakingNews')
-
-        newsch = request.POST.get('scheduled_datetime')
-
-        order = request.POST.get('order')
-
-        # counter = request.POST.get('counter')
-
-        # status = request.POST.get('status')
-
-        status = "inactive"
-
-        upcoming_events=request.POST.get('upcoming_events')
-
-        
-
-        
-
-        # Instantiate NewsPost with corrected fields
-
-        newsdata = NewsPost(
-
-            post_cat_id=postcat,
-
-            post_title=post_title,
-
-            post_short_des=post_short_des,
-
-            post_des=post_des,
-
-            post_image=post_image,
-
-            post_tag=post_tag,
-
-            is_active=is_active,
-
-            Head_Lines=Head_Lines,
-
-            articles=articles,
-
-            trending=trending,
-
-            BreakingNews=brknews,
-
-            schedule_date=newsch,
+                city= city,
 
-            order=order,
+                country=country,
 
-            status=status,
+                diesgantion=dgn,
 
-            # post_status=counter,
+                enquiry_type=et,
 
-            Event=upcoming_events,
+                executive_names=staff,
 
-            Event_date=start_date,
+                source_from=sf,
 
-            Eventend_date=end_date,
+                walk_in=win,
 
-            author_id = request.user.id
+                ip=ip
 
                 )
 
-        newsdata.save()
-
-        if newsdata is not None:
-
-            messages.success(request, 'Your news post successfully!')
-
-            return redirect('guest-news-post')
-
-        else:
-
-            messages.success(request, 'You Are Not Registered !')
-
-            return redirect('guest-news-post')
-
-    else:
-
-            blogdata=NewsPost.objects.filter(is_active=1,status='active').order_by('-id') [:20]
-
-            mainnews=NewsPost.objects.filter(status='active').order_by('order')[:4]
-
-            articales=NewsPost.objects.filter(articles=1,status='active').order_by('-id') [:3]
-
-            vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:2]
-
-            headline=NewsPost.objects.filter(Head_Lines=1,status='active').order_by('-id') [:14]
-
-            trending=NewsPost.objects.filter(trending=1,status='active').order_by('-id') [:3]
-
-            brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-id') [:8]
-
-            podcast=VideoNews.objects.filter(is_active='active').order_by('-id') [:1]
+            RegUser.save()
 
-            Category=category.objects.filter(cat_status='active').order_by('order') [:12]
+            if RegUser is not None:
 
-            Categories=category.objects.filter(cat_status='active').order_by('order') [:11]
+                messages.success(request, 'You Are Registered successfully!')
 
-            # --------------ad-manage-meny--------------
+                return redirect(thanks)
 
-            adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
+            else:
 
-            adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
+                messages.success(request, 'You Are Not Registered !')
 
+        
 
+    return render(request,'thanks.html')
 
-            adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
+        #messages.success(request, 'Your message was successfully sent!')
 
-            adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
+    
 
+# cat-subscribe-page--end--------
 
 
-            adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
 
-            adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
+# cat-Userlogin-page---------
 
+def Userlogin(request):
 
+    seo=seo_optimization.objects.get(pageslug='/login')
 
-            adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
+    if request.method == "POST":
 
-            adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
+        uname=request.POST.get('username')
 
+        password=request.POST.get('password')
 
+        user = authenticate(username=uname, password=password)
 
-            adrcol=ad_category.objects.get(ads_cat_slug='mrec')
+        if user is not None:
 
-            adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
+            login(request,user)
 
+            return redirect(Userdashboard)
 
+        else:
 
-            slider=NewsPost.objects.filter().order_by('-id')[:5]
+            messages.success(request, 'User and Password Wrong!')
 
-            latestnews=NewsPost.objects.all().order_by('-id')[:5]
+            
 
-            data={
+        return render(request,'login.html')
 
-                    'BlogData':blogdata,
+      
 
-                    'mainnews':mainnews,
+    else:    
 
-                    'Slider':slider,
+        data=chrome_context(ads=FESTIVE_ADS)
 
-                    'Blogcat':Category,
+        data['indseo']=seo
 
-                    'latnews':latestnews,
+    return render(request,'inn/login.html',data)
 
-                    'adtop':adtop,
 
-                    'adleft':adleft,
 
-                    'adright':adright,
+# def Logincheck(request):
 
-                    'adtl':adtopleft,
+#     if request.method == "POST":
 
-                    'adtr':adtopright,
+#         form = AuthenticationForm(request, data=request.POST)
 
-                    'Articale':articales,
+#         if form.is_valid():
 
-                    'vidart':vidarticales,
+#             user=form.get_user()
 
-                    'headline':headline,
+#             login(request,user)
 
-                    'trendpost':trending,
+#             return redirect(Userdashboard)
 
-                    'bnews':brknews,
+#     else:
 
-                    'vidnews':podcast,
+#         initial_data={'username':'','password':''}
 
-                    'categories':Categories
+#         form =AuthenticationForm(initial=initial_data)
 
-                }
+#         #return redirect('Userlogin')
 
-    return render(request,'inn/guestnewspost.html',data)
+#     return render(request,'login.html',{'form':form})
 
-# cat-guestnewspost-page--end--------
+# cat-Userlogin-page--end--------
 
 
 
-# cat-EditNewsPost-page--start--------
+# cat-Userdashboard-page---------
 
 @login_required(login_url="/login")
 
-def EditNewsPost(request,post_id):
+def Userdashboard(request):
 
-    blogdata=NewsPost.objects.get(id=post_id)
+    data=chrome_context(ads=SIDEBAR_ADS, trendpost=3)
 
-    Category=category.objects.filter(cat_status='active').order_by('order') [:12]
+    data['categories']=data['Blogcat'][:11]
 
-    Categories=category.objects.filter(cat_status='active').order_by('order') [:11]
+    return render(request,'inn/user-dashboard.html',data)
 
-    trending=NewsPost.objects.filter(trending=1,status='active').order_by('-id') [:3]
+# cat-Userdashboard-page--end--------
 
-    articales=NewsPost.objects.filter(articles=1,status='active').order_by('-id') [:3]
 
-    data={
 
-            'ed':blogdata,
+# cat-ManagePost-page---------
 
-            'categories':Categories,
+@login_required(login_url="/login")
 
-            'Blogcat':Category,
+def ManagePost(request):
 
-            'trendpost':trending,
+    blogdata = NewsPost.objects.cards().filter(author=request.user, is_active=1).order_by('-id')[:20]
 
-            'Articale':articales,
+    data=chrome_context(ads=SIDEBAR_ADS, trendpost=3)
 
-            }
+    data.update({
 
-    return render(request,'inn/edit-news-post.html',data)
+            'BlogData':blogdata,
 
+            'categories':data['Blogcat'][:11],
 
+        })
 
-# cat-updateNewsPost-page--start--------
+    return render(request,'inn/managepost.html',data)
 
-@login_required(login_url="/login")
+# cat-ManagePost-page--end--------
 
-def UpdateNewsPost(request):
 
-    if request.method == "POST":
 
-        if 'upcoming_events' in request.POST:
+# cat-logout-page---------
 
-            start_date = request.POST.get('start_date')
+def Logout(request):
 
-            end_date = request.POST.get('end_date')
+    logout(request)
 
-        else:
+    return redirect('login')
 
-            start_date = date.today()
 
-            end_date = date.today()
 
-            
 
-        
 
-        if 'post_image' in request.FILES:
+# cat-career-page---------
 
-            post_image = request.FILES['post_image']
+@login_required(login_url="/login")
 
-        else:
+def Career(request):
 
-            post_image =request.POST.get('post_image')
+    if request.method == "POST":    
 
-            
+        name=request.POST.get('name')
 
-        post_id = request.POST.get('postId')
+        mobnumber=request.POST.get('mobnumber')
 
-        postcat = request.POST.get('post_cat')
+        email=request.POST.get('email')
 
-        post_title = request.POST.get('post_title')
+        location=request.POST.get('location')
 
-        post_short_des = request.POST.get('post_short_des')
+        nationality=request.POST.get('nationality')
 
-        post_des = request.POST.get('post_des')
+        language=request.POST.get('language')
 
-        post_tag = request.POST.get('post_tag')
+        address=request.POST.get('address')
 
-        is_active = request.POST.get('is_active')
+        highestedu=request.POST.get('highestedu')
 
-        Head_Lines = request.POST.get('Head_Lines')
+        fos=request.POST.get('fos')
 
-        articles = request.POST.get('articles')
+        occupation=request.POST.get('occupation')
 
-        trending = request.POST.get('trending')
+        journalexp=request.POST.get('journalexp')
 
-        brknews = request.POST.get('BreakingNews')
+        lastwork=request.POST.get('lastwork')
 
-        newsch = request.POST.get('scheduled_datetime')
+        portfolio=request.POST.get('portfolio')
 
-        order = request.POST.get('order')
+        category1=request.POST.get('category')
 
-        counter = request.POST.get('counter')
+        equipment=request.POST.get('equipment')
 
-        status = "inactive"
+        softwareskill=request.POST.get('softwareskill')
 
-        upcoming_events=request.POST.get('upcoming_events')
+        availability=request.POST.get('availability')
 
-        
+        resume=request.FILES.get('resume')
 
-        # Instantiate NewsPost with corrected fields
+        whyjoin=request.POST.get('whyjoin')
 
-        newsdata = NewsPost(
+        anysegment=request.POST.get('anysegment')
 
-            id=post_id,
+        career=CareerApplication(
 
-            post_cat_id=postcat,
+                name=name,
 
-            post_title=post_title,
+                mobnumber=mobnumber,
 
-            post_short_des=post_short_des,
+                email=email,
 
-            post_des=post_des,
+                location=location,
 
-            post_image=post_image,
+                nationality=nationality,
 
-            post_tag=post_tag,
+                language=language,
 
-            is_active=is_active,
+                address=address,
 
-            Head_Lines=Head_Lines,
+                highestedu=highestedu,
 
-            articles=articles,
+                fos=fos,
 
-            trending=trending,
+                occupation=occupation,
 
-            BreakingNews=brknews,
+                journalexp=journalexp,
 
-            schedule_date=newsch,
+                lastwork=lastwork,
 
-            order=order,
+                portfolio=portfolio,
 
-            status=status,
+                category=category1,
 
-            post_status=counter,
+                equipment=equipment,
 
-            Event=upcoming_events,
+                softwareskill=softwareskill,
 
-            Event_date=start_date,
+                availability=availability,
 
-            Eventend_date=end_date,
+                resume=resume,
 
-            author_id = request.user.id,
+                whyjoin=whyjoin,
 
-            post_date=date.today()
+                anysegment=anysegment,
 
                 )
 
-        newsdata.save()
+        career.save()
 
-        if newsdata is not None:
+        if career is not None:
 
-            messages.success(request, 'Your news post Update successfully!')
+            messages.success(request, 'You Are Registered successfully!')
 
-            return redirect('managepost')
+            return redirect('career')
 
         else:
 
-            messages.success(request, 'Not Update Somthing Went Wrong !')
-
-            return redirect('managepost')
+            messages.success(request, 'You Are Not Registered !')
 
-    
+            return redirect('career')
 
+    else:
 
+            data=chrome_context(ads=SIDEBAR_ADS)
 
-# sitemap-us-page---------
+    return render(request,'inn/career.html',data)
 
-# thanks-page---------
+# cat-career-page--end--------
 
-def thanks(request):
+   
 
-    blogdata=NewsPost.objects.all().order_by('-id') [:4]
+# cat-Guestnewspost-page---------
 
-    articales=NewsPost.objects.filter(articles=1, status='active').order_by('-id') [:3]
+@login_required(login_url="/login")
 
-    vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:2]
+def Guestpost(request):
 
-    headline=NewsPost.objects.filter(Head_Lines=1, status='active').order_by('-id') [:14]
+    if request.method == "POST":
 
-    trending=NewsPost.objects.filter(trending=1, status='active').order_by('-id') [:7]
+        if 'upcoming_events' in request.POST:
 
-    brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-id') [:8]
+            start_date = request.POST.get('start_date')
 
-    
+            end_date = request.POST.get('end_date')
 
-    # --------------ad-manage-meny--------------
+        else:
 
-    adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
+            start_date = date.today()
 
-    adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
+            end_date = date.today()
 
-    
+            
 
-    adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
+        post_image = None
 
-    adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
+        if 'post_image' in request.FILES:
 
-    
+            post_image = request.FILES['post_image']
 
-    adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
+        
 
-    adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
+        postcat = request.POST.get('post_cat')
 
-    
+        post_title = request.POST.get('post_title')
 
-    adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
+        post_short_des = request.POST.get('post_short_des')
 
-    adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
+        post_des = request.POST.get('post_des')
 
-    
+        post_tag = request.POST.get('post_tag')
 
-    adrcol=ad_category.objects.get(ads_cat_slug='mrec')
+        is_active = request.POST.get('is_active')
 
-    adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
+        Head_Lines = request.POST.get('Head_Lines')
 
-    
+        articles = request.POST.get('articles')
 
-    # festivetop
+        trending = request.POST.get('trending')
 
-    # festiveleft
+        brknews = request.POST.get('BreakingNews')
 
-    # festiveright
+        newsch = request.POST.get('scheduled_datetime')
 
-# -------------end-ad-manage-meny--------------  
+        order = request.POST.get('order')
 
-    # slider=NewsPost.objects.filter(id=1).order_by('id')[:5] use for filter value
+        # counter = request.POST.get('counter')
 
-    Category=category.objects.filter(cat_status='active').order_by('order') [:12]
+        # status = request.POST.get('status')
 
-    slider=NewsPost.objects.filter().order_by('-id')[:5]
+        status = "inactive"
 
-    latestnews=NewsPost.objects.all().order_by('-id')[:5]
+        upcoming_events=request.POST.get('upcoming_events')
 
-    data={
+        
 
-            'BlogData':blogdata,
+        
 
-            'Slider':slider,
+        # Instantiate NewsPost with corrected fields
 
-            'Blogcat':Category,
+        newsdata = NewsPost(
 
-            'latnews':latestnews,
+            post_cat_id=postcat,
 
-            'adtop':adtop,
+            post_title=post_title,
 
-            'adleft':adleft,
+            post_short_des=post_short_des,
 
-            'adright':adright,
+            post_des=post_des,
 
-            'adtl':adtopleft,
+            post_image=post_image,
 
-            'adtr':adtopright,
+            post_tag=post_tag,
 
-            'Articale':articales,
+            is_active=is_active,
 
-            'vidart':vidarticales,
+            Head_Lines=Head_Lines,
 
-            'headline':headline,
+            articles=articles,
 
-            'trendpost':trending,
+            trending=trending,
 
-            'bnews':brknews,
+            BreakingNews=brknews,
 
-        }
+            schedule_date=newsch,
 
-   
+            order=order,
 
-    return render(request,'thanks.html',data)
+            status=status,
 
-# thanks-us-page---------
+            # post_status=counter,
 
+            Event=upcoming_events,
 
+            Event_date=start_date,
 
+            Eventend_date=end_date,
 
+            author_id = request.user.id
 
+                )
 
+        newsdata.save()
 
-def SiteMap(request):
+        if newsdata is not None:
 
-    blogdata=NewsPost.objects.all().order_by('-id') [:4]
+            messages.success(request, 'Your news post successfully!')
 
-    articales=NewsPost.objects.filter(articles=1, status='active').order_by('-id') [:3]
+            return redirect('guest-news-post')
 
-    vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:2]
+        else:
 
-    headline=NewsPost.objects.filter(Head_Lines=1, status='active').order_by('-id') [:14]
+            messages.success(request, 'You Are Not Registered !')
 
-    trending=NewsPost.objects.filter(trending=1, status='active').order_by('-id') [:3]
+            return redirect('guest-news-post')
 
-    brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-id') [:8]
+    else:
 
-    
+            data=chrome_context(ads=SIDEBAR_ADS, trendpost=3)
 
-    # --------------ad-manage-meny--------------
+            data['categories']=data['Blogcat'][:11]
 
-    adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
+    return render(request,'inn/guestnewspost.html',data)
 
-    adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
+# cat-guestnewspost-page--end--------
 
-    
 
-    adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
 
-    adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
+# cat-EditNewsPost-page--start--------
 
-    
+@login_required(login_url="/login")
 
-    adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
+def EditNewsPost(request,post_id):
 
-    adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
+    blogdata=NewsPost.objects.get(id=post_id)
 
-    
+    chrome=get_chrome()
 
-    adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
+    data={
 
-    adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
+            'ed':blogdata,
 
-    
+            'categories':chrome['Blogcat'][:11],
 
-    adrcol=ad_category.objects.get(ads_cat_slug='mrec')
+            'Blogcat':chrome['Blogcat'],
 
-    adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
+            'trendpost':chrome['trendpost'][:3],
 
-    
+            'Articale':chrome['Articale'][:3],
 
-    # festivetop
+            }
 
-    # festiveleft
+    return render(request,'inn/edit-news-post.html',data)
 
-    # festiveright
 
-# -------------end-ad-manage-meny--------------  
 
-    # slider=NewsPost.objects.filter(id=1).order_by('id')[:5] use for filter value
+# cat-updateNewsPost-page--start--------
 
-    Category=category.objects.filter(cat_status='active').order_by('order') [:12]
+@login_required(login_url="/login")
 
-    slider=NewsPost.objects.filter().order_by('-id')[:5]
+def UpdateNewsPost(request):
 
-    latestnews=NewsPost.objects.all().order_by('-id')[:5]
+    if request.method == "POST":
 
-    data={
+        if 'upcoming_events' in request.POST:
 
-            'BlogData':blogdata,
+            start_date = request.POST.get('start_date')
 
-            'Slider':slider,
+            end_date = request.POST.get('end_date')
 
-            'Blogcat':Category,
+        else:
 
-            'latnews':latestnews,
+            start_date = date.today()
 
-            'adtop':adtop,
+            end_date = date.today()
 
-            'adleft':adleft,
+            
 
-            'adright':adright,
+        
 
-            'adtl':adtopleft,
+        if 'post_image' in request.FILES:
 
-            'adtr':adtopright,
+            post_image = request.FILES['post_image']
 
-            'Articale':articales,
+        else:
 
-            'vidart':vidarticales,
+            post_image =request.POST.get('post_image')
 
-            'headline':headline,
+            
 
-            'trendpost':trending,
+        post_id = request.POST.get('postId')
 
-            'bnews':brknews,
+        postcat = request.POST.get('post_cat')
 
-            'sitemapcat':Category,
+        post_title = request.POST.get('post_title')
 
-        }
+        post_short_des = request.POST.get('post_short_des')
 
-    return render(request,'sitemap.html',data)
+        post_des = request.POST.get('post_des')
 
+        post_tag = request.POST.get('post_tag')
 
+        is_active = request.POST.get('is_active')
 
-# advertise-with-us-page---------
+        Head_Lines = request.POST.get('Head_Lines')
 
-def advertise(request):
+        articles = request.POST.get('articles')
 
-    blogdata=NewsPost.objects.all().order_by('-id') [:4]
+        trending = request.POST.get('trending')
 
-    articales=NewsPost.objects.filter(articles=1, status='active').order_by('-id') [:3]
+        brknews = request.POST.get('BreakingNews')
 
-    vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:2]
+        newsch = request.POST.get('scheduled_datetime')
 
-    headline=NewsPost.objects.filter(Head_Lines=1, status='active').order_by('-id') [:14]
+        order = request.POST.get('order')
 
-    trending=NewsPost.objects.filter(trending=1, status='active').order_by('-id') [:7]
+        counter = request.POST.get('counter')
 
-    brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-id') [:8]
+        status = "inactive"
 
-    
+        upcoming_events=request.POST.get('upcoming_events')
 
-    # --------------ad-manage-meny--------------
+        
 
-    adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
+        # Instantiate NewsPost with corrected fields
 
-    adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
+        newsdata = NewsPost(
 
-    
+            id=post_id,
 
-    adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
+            post_cat_id=postcat,
 
-    adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
+            post_title=post_title,
 
-    
+            post_short_des=post_short_des,
 
-    adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
+            post_des=post_des,
 
-    adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
+            post_image=post_image,
 
-    
+            post_tag=post_tag,
 
-    adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
+            is_active=is_active,
 
-    adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
+            Head_Lines=Head_Lines,
 
-    
+            articles=articles,
 
-    adrcol=ad_category.objects.get(ads_cat_slug='mrec')
+            trending=trending,
 
-    adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
+            BreakingNews=brknews,
 
-    
+            schedule_date=newsch,
 
-    # festivetop
+            order=order,
 
-    # festiveleft
+            status=status,
 
-    # festiveright
+            post_status=counter,
 
-# -------------end-ad-manage-meny--------------  
+            Event=upcoming_events,
 
-    # slider=NewsPost.objects.filter(id=1).order_by('id')[:5] use for filter value
+            Event_date=start_date,
 
-    Category=category.objects.filter(cat_status='active').order_by('order') [:12]
+            Eventend_date=end_date,
 
-    slider=NewsPost.objects.filter().order_by('-id')[:5]
+            author_id = request.user.id,
 
-    latestnews=NewsPost.objects.all().order_by('-id')[:5]
+            post_date=date.today()
 
-    data={
+                )
 
-            'BlogData':blogdata,
+        newsdata.save()
 
-            'Slider':slider,
+        if newsdata is not None:
 
-            'Blogcat':Category,
+            messages.success(request, 'Your news post Update successfully!')
 
-            'latnews':latestnews,
+            return redirect('managepost')
 
-            'adtop':adtop,
+        else:
 
-            'adleft':adleft,
+            messages.success(request, 'Not Update Somthing Went Wrong !')
 
-            'adright':adright,
+            return redirect('managepost')
 
-            'adtl':adtopleft,
+    
 
-            'adtr':adtopright,
 
-            'Articale':articales,
 
-            'vidart':vidarticales,
+# sitemap-us-page---------
 
-            'headline':headline,
+# thanks-page---------
 
-            'trendpost':trending,
+def thanks(request):
 
-            'bnews':brknews,
+    blogdata=NewsPost.objects.cards().order_by('-id') [:4]
 
-        }
+    data=chrome_context(ads=SIDEBAR_ADS, mainnews=0, vidnews=0)
 
-   
+    data['BlogData']=blogdata
 
-    return render(request,'advertise-with-us.html',data)
+    return render(request,'thanks.html',data)
 
+# thanks-us-page---------
 
 
 
 
 
 
-def Adsinquiry(request):
 
-    seo='voicesofuae'
+def SiteMap(request):
 
-    blogdata = NewsPost.objects.filter(
+    blogdata=NewsPost.objects.cards().order_by('-id') [:4]
 
-        is_active=1, status='active').order_by('-id')[:20]
+    data=chrome_context(ads=SIDEBAR_ADS, mainnews=0, vidnews=0, trendpost=3)
 
-    mainnews = NewsPost.objects.filter(status='active').order_by('order')[:4]
+    data.update({
 
-    articales = NewsPost.objects.filter(
+            'BlogData':blogdata,
 
-        articles=1, status='active').order_by('-id')[:3]
+        })
 
-    Category = category.objects.filter(
+    return render(request,'sitemap.html',data)
 
-        cat_status='active').order_by('order')[:11]
 
 
+# advertise-with-us-page---------
 
-    # slider=NewsPost.objects.filter(id=1).order_by('id')[:5] use for filter value
+def advertise(request):
 
+    blogdata=NewsPost.objects.cards().order_by('-id') [:4]
 
+    data=chrome_context(ads=SIDEBAR_ADS, mainnews=0, vidnews=0)
 
-    slider = NewsPost.objects.filter().order_by('-id')[:5]
+    data['BlogData']=blogdata
 
-    latestnews = NewsPost.objects.all().order_by('-id')[:5]
+    return render(request,'advertise-with-us.html',data)
 
-    data = {
 
-            'indseo':seo,
 
-            'BlogData': blogdata,
 
-            'mainnews': mainnews,
 
-            'Slider': slider,
 
-            'Blogcat': Category,
 
-            'latnews': latestnews,
+def Adsinquiry(request):
 
-            'Articale': articales,
+    seo='voicesofuae'
 
-        }
+    data = chrome_context(vidart=0, headline=0, trendpost=0, bnews=0, vidnews=0, Blogcat=11)
+    data['indseo'] = seo
 
 
 
@@ -3583,107 +1712,29 @@ def Adsinquiry(request):
 
 
 
+@anonymous_page_cache('cms:{slug}')
+
 def cms_detail(request, slug):
 
     page = get_object_or_404(CMS, slug=slug, status='active')
 
     
 
-    page.viewcounter = (page.viewcounter or 0) + 1
-
-    page.save(update_fields=['viewcounter'])
-
-
-
-    blogdata=NewsPost.objects.all().order_by('-id') [:4]
-
-    articales=NewsPost.objects.filter(articles=1, status='active').order_by('-id') [:3]
-
-    vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:2]
-
-    headline=NewsPost.objects.filter(Head_Lines=1, status='active').order_by('-id') [:14]
-
-    trending=NewsPost.objects.filter(trending=1, status='active').order_by('-id') [:3]
-
-    brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-id') [:8]
-
-    
-
-    # --------------ad-manage-meny--------------
-
-    adtlid=ad_category.objects.get(ads_cat_slug='topleft-600x80')
-
-    adtopleft=ad.objects.filter(ads_cat_id=adtlid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adtrid=ad_category.objects.get(ads_cat_slug='topright-600x80')
-
-    adtopright=ad.objects.filter(ads_cat_id=adtrid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adtopid=ad_category.objects.get(ads_cat_slug='leaderboard')
-
-    adtop=ad.objects.filter(ads_cat_id=adtopid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adleftid=ad_category.objects.get(ads_cat_slug='skyscraper')
-
-    adleft=ad.objects.filter(ads_cat_id=adleftid.id, is_active=1).order_by('-id') [:1]
-
-    
-
-    adrcol=ad_category.objects.get(ads_cat_slug='mrec')
-
-    adright=ad.objects.filter(ads_cat_id=adrcol.id, is_active=1).order_by('-id') [:1]
-
-    
+    record_view(page, request)
 
-    # slider=NewsPost.objects.filter(id=1).order_by('id')[:5] use for filter value
 
-    Category=category.objects.filter(cat_status='active').order_by('order') [:12]
 
-    slider=NewsPost.objects.filter().order_by('-id')[:5]
+    blogdata=NewsPost.objects.cards().order_by('-id') [:4]
 
-    latestnews=NewsPost.objects.all().order_by('-id')[:5]
+    data=chrome_context(ads=SIDEBAR_ADS, mainnews=0, vidnews=0, trendpost=3)
 
-    data={
+    data.update({
 
             'BlogData':blogdata,
 
-            'Slider':slider,
-
-            'Blogcat':Category,
-
-            'latnews':latestnews,
-
-            'adtop':adtop,
-
-            'adleft':adleft,
-
-            'adright':adright,
-
-            'adtl':adtopleft,
-
-            'adtr':adtopright,
-
-            'Articale':articales,
-
-            'vidart':vidarticales,
-
-            'headline':headline,
-
-            'trendpost':trending,
-
-            'bnews':brknews,
-
             'page': page,
 
-        }
-
-
+        })
 
     return render(request, 'cms_page.html', data)
 
@@ -3727,21 +1778,17 @@ Sitemap: https://www.armustnews.com/sitemap
 
 def profiledxb(request, username ):
 
-    current_datetime = datetime.now()
-
     profile_journalist = get_object_or_404(Journalist, username=username)
 
 
 
-    journalist_articles = NewsPost.objects.filter(journalist=profile_journalist, articles=1, status='active').order_by('-id')[:6]
+    journalist_articles = NewsPost.objects.cards().filter(journalist=profile_journalist, articles=1, status='active').order_by('-id')[:6]
 
     galleries = profile_journalist.galleries.filter(status='active').order_by('-post_at')[:8]
 
-    category_list = category.objects.filter(cat_status='active').order_by('order')[:12]
-
-    journalist_blogdata = NewsPost.objects.filter(journalist=profile_journalist, status='active').order_by('-id')[:6]
+    journalist_blogdata = NewsPost.objects.cards().filter(journalist=profile_journalist, status='active').order_by('-id')[:6]
 
-    journalist_podcast = VideoNews.objects.filter(journalist=profile_journalist, is_active='active').order_by('-id')[:6]
+    journalist_podcast = VideoNews.objects.cards().filter(journalist=profile_journalist, is_active='active').order_by('-id')[:6]
 
 
 
@@ -3762,26 +1809,9 @@ def profiledxb(request, username ):
 
 
     # General blog and media
+    context = chrome_context(BlogData=10, headline=4, Slider=0, latnews=0)
 
-    blogdata = NewsPost.objects.filter(schedule_date__lt=current_datetime, is_active=1, status='active').order_by('-id')[:10]
-
-    mainnews = NewsPost.objects.filter(schedule_date__lt=current_datetime, is_active=1, status='active').order_by('-id')[:2]
-
-    articles = NewsPost.objects.filter(schedule_date__lt=current_datetime, articles=1, status='active').order_by('-id')[:3]
-
-    headlines = NewsPost.objects.filter(schedule_date__lt=current_datetime, Head_Lines=1, status='active').order_by('-id')[:4]
-
-    trending = NewsPost.objects.filter(schedule_date__lt=current_datetime, trending=1, status='active').order_by('-id')[:7]
-
-    breaking = NewsPost.objects.filter(schedule_date__lt=current_datetime, BreakingNews=1, status='active').order_by('-id')[:8]
-
-    podcast = VideoNews.objects.filter(is_active='active').order_by('-id')[:1]
-
-    video_articles = VideoNews.objects.filter(articles=1, is_active='active', video_type='video').order_by('order')[:2]
-
-
-
-    context = {
+    context.update({
 
         'journalist': profile_journalist,
 
@@ -3791,23 +1821,7 @@ def profiledxb(request, username ):
 
         'galleries': galleries,
 
-        'Blogcat': category_list,
-
-        'BlogData': blogdata,
-
-        'mainnews': mainnews,
-
-        'Articale': articles,
-
-        'headline': headlines,
-
-        'trendpost': trending,
-
-        'bnews': breaking,
-
-        'vidnews': podcast,
-
-        'vidart': video_articles,
+        'mainnews': context['BlogData'][:2],
 
         'child_profiles': child_profiles,
 
@@ -3815,9 +1829,7 @@ def profiledxb(request, username ):
 
         'journalist_podcast': journalist_podcast,
 
-    }
-
-
+    })
 
     return render(request, "inn/profile.html", context)
 
@@ -6,7 +6,8 @@ import random
 from django.urls import reverse
 from django.views.decorators.csrf import csrf_exempt
 from django.core.cache import cache
-from post_management.models import category,sub_category,NewsPost,VideoNews
+from post_management.models import NewsPost,VideoNews
+from post_management.chrome import get_chrome, chrome_context
 from cities_light.models import Country, Region, City
 from phonenumbers import parse, is_valid_number, NumberParseException
 from .models import CountryCode 
@@ -68,33 +69,11 @@ def Journalist_News_Post(request):
         messages.success(request, 'Your news has been successfully submitted! It will be reviewed by our trusted team before publication.')
         return redirect('news-post')
     else:
-        blogdata=NewsPost.objects.filter(is_active=1,status='active').order_by('-id') [:20]
-        mainnews=NewsPost.objects.filter(status='active').order_by('order')[:4]
-        articales=NewsPost.objects.filter(articles=1,status='active').order_by('-id') [:3]
-        vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:2]
-        headline=NewsPost.objects.filter(Head_Lines=1,status='active').order_by('-id') [:14]
-        trending=NewsPost.objects.filter(trending=1,status='active').order_by('-id') [:3]
-        brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-id') [:8]
-        podcast=VideoNews.objects.filter(is_active='active').order_by('-id') [:1]
-        Category=category.objects.filter(cat_status='active').order_by('order') [:12]
-        Categories=category.objects.filter(cat_status='active').order_by('order') [:12]
-        slider=NewsPost.objects.filter().order_by('-id')[:5]
-        latestnews=NewsPost.objects.all().order_by('-id')[:5]
-        data={
-            'BlogData':blogdata,
-            'mainnews':mainnews,
-            'Slider':slider,
-            'Blogcat':Category,
-            'latnews':latestnews,
-            'Articale':articales,
-            'vidart':vidarticales,
-            'headline':headline,
-            'trendpost':trending,
-            'bnews':brknews,
-            'vidnews':podcast,
-            'categories':Categories,
+        data=chrome_context(trendpost=3)
+        data.update({
+            'categories':data['Blogcat'],
             'journalist': journalist,
-            }
+            })
     return render(request, 'inn/Journalist_news_post.html', data)
             
 
@@ -110,18 +89,19 @@ def Journalist_Manage_Post(request):
         messages.error(request, "Invalid journalist account.")
         return redirect('sign-in')
 
-    blogdata = NewsPost.objects.filter(journalist=journalist, is_active=1).order_by('-id')[:20]
-    mainnews = NewsPost.objects.filter(journalist=journalist, status='active').order_by('order')[:4]
-    articales = NewsPost.objects.filter(journalist=journalist, articles=1, status='active').order_by('-id')[:3]
-    headline = NewsPost.objects.filter(journalist=journalist, Head_Lines=1, status='active').order_by('-id')[:14]
-    trending = NewsPost.objects.filter(journalist=journalist, trending=1, status='active').order_by('-id')[:3]
-    brknews = NewsPost.objects.filter(journalist=journalist, BreakingNews=1, status='active').order_by('-id')[:8]
-    slider = NewsPost.objects.filter(journalist=journalist).order_by('-id')[:5]
-    latestnews = NewsPost.objects.filter(journalist=journalist).order_by('-id')[:5]
-    vidarticales = VideoNews.objects.filter(articles=1, is_active='active', video_type='video').order_by('order')[:2]
-    podcast = VideoNews.objects.filter(is_active='active').order_by('-id')[:1]
-    Category = category.objects.filter(cat_status='active').order_by('order')[:11]
-    Categories = category.objects.filter(cat_status='active').order_by('order')[:11]
+    blogdata = NewsPost.objects.cards().filter(journalist=journalist, is_active=1).order_by('-id')[:20]
+    mainnews = NewsPost.objects.cards().filter(journalist=journalist, status='active').order_by('order')[:4]
+    articales = NewsPost.objects.cards().filter(journalist=journalist, articles=1, status='active').order_by('-id')[:3]
+    headline = NewsPost.objects.cards().filter(journalist=journalist, Head_Lines=1, status='active').order_by('-id')[:14]
+    trending = NewsPost.objects.cards().filter(journalist=journalist, trending=1, status='active').order_by('-id')[:3]
+    brknews = NewsPost.objects.cards().filter(journalist=journalist, BreakingNews=1, status='active').order_by('-id')[:8]
+    slider = NewsPost.objects.cards().filter(journalist=journalist).order_by('-id')[:5]
+    latestnews = NewsPost.objects.cards().filter(journalist=journalist).order_by('-id')[:5]
+    chrome = get_chrome()
+    vidarticales = chrome['vidart'][:2]
+    podcast = chrome['vidnews'][:1]
+    Category = chrome['Blogcat'][:11]
+    Categories = Category
 
     data = {
         'BlogData': blogdata,
@@ -158,10 +138,10 @@ def Journalist_Edit_News_Post(request, post_id):
         messages.error(request, "You are not authorized to edit this post.")
         return redirect('manage-post')
 
-    Category = category.objects.filter(cat_status='active').order_by('order')[:11]
-    Categories = category.objects.filter(cat_status='active').order_by('order')[:11]
-    trending = NewsPost.objects.filter(journalist=journalist, trending=1, status='active').order_by('-id')[:3]
-    articales = NewsPost.objects.filter(journalist=journalist, articles=1, status='active').order_by('-id')[:3]
+    Category = get_chrome()['Blogcat'][:11]
+    Categories = Category
+    trending = NewsPost.objects.cards().filter(journalist=journalist, trending=1, status='active').order_by('-id')[:3]
+    articales = NewsPost.objects.cards().filter(journalist=journalist, articles=1, status='active').order_by('-id')[:3]
 
     data = {
         'ed': blogdata,
@@ -268,8 +248,8 @@ def Journalist_video_Post(request):
         return redirect('news-post')
     else:
 
-        Category=category.objects.filter(cat_status='active').order_by('order') [:12]
-        Categories=category.objects.filter(cat_status='active').order_by('order') [:12]
+        Category=get_chrome()['Blogcat']
+        Categories=Category
         data={
             'Blogcat':Category,
             'categories':Categories,
@@ -290,18 +270,18 @@ def Journalist_Manage_Video_Post(request):
         messages.error(request, "Invalid journalist account.")
         return redirect('sign-in')
 
-    headline = VideoNews.objects.filter(journalist=journalist, Head_Lines=1, is_active='active',).order_by('-id')[:14]
-    articales = VideoNews.objects.filter(journalist=journalist, articles=1, is_active='active',).order_by('-id')[:3]
-    trending = VideoNews.objects.filter(journalist=journalist, trending=1, is_active='active',).order_by('-id')[:3]
-    brknews = VideoNews.objects.filter(journalist=journalist, BreakingNews=1, is_active='active',).order_by('-id')[:8]
-    vidarticales = VideoNews.objects.filter(articles=1, is_active='active', video_type='video').order_by('order')[:2]
+    headline = VideoNews.objects.cards().filter(journalist=journalist, Head_Lines=1, is_active='active',).order_by('-id')[:14]
+    articales = VideoNews.objects.cards().filter(journalist=journalist, articles=1, is_active='active',).order_by('-id')[:3]
+    trending = VideoNews.objects.cards().filter(journalist=journalist, trending=1, is_active='active',).order_by('-id')[:3]
+    brknews = VideoNews.objects.cards().filter(journalist=journalist, BreakingNews=1, is_active='active',).order_by('-id')[:8]
+    vidarticales = get_chrome()['vidart'][:2]
 
-    video_podcast = VideoNews.objects.filter(journalist=journalist, video_type='video').order_by('-id')
-    reels_podcast = VideoNews.objects.filter(journalist=journalist, video_type='reel').order_by('-id')
-    BlogData = VideoNews.objects.filter(journalist=journalist).order_by('-id')
+    video_podcast = VideoNews.objects.cards().filter(journalist=journalist, video_type='video').order_by('-id')
+    reels_podcast = VideoNews.objects.cards().filter(journalist=journalist, video_type='reel').order_by('-id')
+    BlogData = VideoNews.objects.cards().filter(journalist=journalist).order_by('-id')
     
-    Category = category.objects.filter(cat_status='active').order_by('order')[:11]
-    Categories = category.objects.filter(cat_status='active').order_by('order')[:11]
+    Category = get_chrome()['Blogcat'][:11]
+    Categories = Category
 
     data = {
         'video_podcast': video_podcast,
@@ -337,8 +317,8 @@ def Journalist_Edit_Video_Post(request, post_id):
         messages.error(request, "You are not authorized to edit this post.")
         return redirect('manage-video-post')
 
-    Category = category.objects.filter(cat_status='active').order_by('order')[:11]
-    Categories = category.objects.filter(cat_status='active').order_by('order')[:11]
+    Category = get_chrome()['Blogcat'][:11]
+    Categories = Category
 
     data = {
         'ed': videopost,
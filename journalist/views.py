@@ -6,7 +6,8 @@ import random
 from django.urls import reverse
 from django.views.decorators.csrf import csrf_exempt
 from django.core.cache import cache
-from post_management.models import category,sub_category,NewsPost,VideoNews
+from post_management.models import NewsPost,VideoNews
+from post_management.chrome import get_chrome, chrome_context
 from cities_light.models import Country, Region, City
 from phonenumbers import parse, is_valid_number, NumberParseException
 from .models import CountryCode 
@@ -269,9 +270,10 @@ def Journalist_Sign_Up(request):
     Qualifications = Qualification.objects.all()
     country_codes = CountryCode.objects.all().order_by("name")
     nationalities = Country.objects.only("id", "name").order_by("name")
-    Category = category.objects.filter(cat_status="active").order_by("order")[:11]
-    trending = NewsPost.objects.filter(trending=1, status="active").order_by("-id")[:3]
-    articles = NewsPost.objects.filter(articles=1, status="active").order_by("-id")[:3]
+    chrome = get_chrome()
+    Category = chrome["Blogcat"][:11]
+    trending = chrome["trendpost"][:3]
+    articles = chrome["Articale"][:3]
     registered_organizations = Journalist.objects.filter(status='active', registration_type='organisation')
 
     data = {
@@ -487,23 +489,23 @@ def Journalist_Dashboard(request):
     profile_journalist = get_object_or_404(Journalist, id=journalist_id)
     
     current_datetime = datetime.now()
-    events=NewsPost.objects.filter(schedule_date__lt=current_datetime,Event=1,status='active').order_by('-id')[:10]
+    events=NewsPost.objects.cards().filter(schedule_date__lt=current_datetime,Event=1,status='active').order_by('-id')[:10]
 
-    total_active_posts = NewsPost.objects.filter(journalist=journalist, status='active').order_by('-id')
+    total_active_posts = NewsPost.objects.cards().filter(journalist=journalist, status='active').order_by('-id')
     total_active_posts_count = total_active_posts.count()
     total_inactive_posts = NewsPost.objects.filter(journalist=journalist, status='inactive').count()
     total_rejected_posts = NewsPost.objects.filter(journalist=journalist, status='rejected').count()
 
-    total_active_articles = NewsPost.objects.filter(journalist=journalist, status='active', articles=1).order_by('-id')
+    total_active_articles = NewsPost.objects.cards().filter(journalist=journalist, status='active', articles=1).order_by('-id')
     total_active_articles_count = total_active_articles.count()
 
-    all_videos_post = VideoNews.objects.filter(journalist=journalist,).order_by('-id')
-    active_video_type = VideoNews.objects.filter(is_active='active', video_type='video', journalist=journalist,).order_by('-id')
-    inactive_video_type = VideoNews.objects.filter(is_active='inactive', video_type='video', journalist=journalist,).order_by('-id')
-    rejected_video_type = VideoNews.objects.filter(is_active='rejected', video_type='video', journalist=journalist,).order_by('-id')
-    active_reels_type = VideoNews.objects.filter(is_active='active', video_type='reel', journalist=journalist,).order_by('-id')
-    inactive_reels_type = VideoNews.objects.filter(is_active='inactive', video_type='reel', journalist=journalist,).order_by('-id')
-    rejected_reels_type = VideoNews.objects.filter(is_active='rejected', video_type='reel', journalist=journalist,).order_by('-id')
+    all_videos_post = VideoNews.objects.cards().filter(journalist=journalist,).order_by('-id')
+    active_video_type = VideoNews.objects.cards().filter(is_active='active', video_type='video', journalist=journalist,).order_by('-id')
+    inactive_video_type = VideoNews.objects.cards().filter(is_active='inactive', video_type='video', journalist=journalist,).order_by('-id')
+    rejected_video_type = VideoNews.objects.cards().filter(is_active='rejected', video_type='video', journalist=journalist,).order_by('-id')
+    active_reels_type = VideoNews.objects.cards().filter(is_active='active', video_type='reel', journalist=journalist,).order_by('-id')
+    inactive_reels_type = VideoNews.objects.cards().filter(is_active='inactive', video_type='reel', journalist=journalist,).order_by('-id')
+    rejected_reels_type = VideoNews.objects.cards().filter(is_active='rejected', video_type='reel', journalist=journalist,).order_by('-id')
     all_videos_post_count = all_videos_post.count()
     active_reels_count = active_reels_type.count()
     inactive_reels_count = inactive_reels_type.count()
@@ -512,18 +514,19 @@ def Journalist_Dashboard(request):
     inactive_video_count = inactive_video_type.count()
     rejected_video_count = rejected_video_type.count()
 
-    blogdata = NewsPost.objects.filter(journalist=journalist, is_active=1).order_by('-id')[:20]
-    mainnews = NewsPost.objects.filter(journalist=journalist, status='active').order_by('order')[:4]
-    articales = NewsPost.objects.filter(journalist=journalist, articles=1, status='active').order_by('-id')[:3]
-    headline = NewsPost.objects.filter(journalist=journalist, Head_Lines=1, status='active').order_by('-id')[:14]
-    trending = NewsPost.objects.filter(journalist=journalist, trending=1, status='active').order_by('-id')[:3]
-    brknews = NewsPost.objects.filter(journalist=journalist, BreakingNews=1, status='active').order_by('-id')[:8]
-    slider = NewsPost.objects.filter(journalist=journalist).order_by('-id')[:5]
-    latestnews = NewsPost.objects.filter(journalist=journalist).order_by('-id')[:5]
-    vidarticales = VideoNews.objects.filter(articles=1, is_active='active', video_type='video').order_by('order')[:2]
-    podcast = VideoNews.objects.filter(is_active='active').order_by('-id')[:1]
-    Category = category.objects.filter(cat_status='active').order_by('order')[:11]
-    Categories = category.objects.filter(cat_status='active').order_by('order')[:11]
+    blogdata = NewsPost.objects.cards().filter(journalist=journalist, is_active=1).order_by('-id')[:20]
+    mainnews = NewsPost.objects.cards().filter(journalist=journalist, status='active').order_by('order')[:4]
+    articales = NewsPost.objects.cards().filter(journalist=journalist, articles=1, status='active').order_by('-id')[:3]
+    headline = NewsPost.objects.cards().filter(journalist=journalist, Head_Lines=1, status='active').order_by('-id')[:14]
+    trending = NewsPost.objects.cards().filter(journalist=journalist, trending=1, status='active').order_by('-id')[:3]
+    brknews = NewsPost.objects.cards().filter(journalist=journalist, BreakingNews=1, status='active').order_by('-id')[:8]
+    slider = NewsPost.objects.cards().filter(journalist=journalist).order_by('-id')[:5]
+    latestnews = NewsPost.objects.cards().filter(journalist=journalist).order_by('-id')[:5]
+    chrome = get_chrome()
+    vidarticales = chrome['vidart'][:2]
+    podcast = chrome['vidnews'][:1]
+    Category = chrome['Blogcat'][:11]
+    Categories = Category
 
     child_profiles = None
     if profile_journalist.registration_type == 'organisation':
@@ -573,44 +576,23 @@ def Journalist_Profile(request):
     except Journalist.DoesNotExist:
         return redirect('sign-in')
     
-    blogdata=NewsPost.objects.filter(is_active=1,status='active').order_by('-id') [:20]
-    mainnews=NewsPost.objects.filter(status='active').order_by('order')[:4]
-    articales=NewsPost.objects.filter(articles=1,status='active').order_by('-id') [:3]
-    vidarticales=VideoNews.objects.filter(articles=1,is_active='active',video_type='video').order_by('order')[:2]
-    headline=NewsPost.objects.filter(Head_Lines=1,status='active').order_by('-id') [:14]
-    trending=NewsPost.objects.filter(trending=1,status='active').order_by('-id') [:3]
-    brknews=NewsPost.objects.filter(BreakingNews=1,status='active').order_by('-id') [:8]
-    podcast=VideoNews.objects.filter(is_active='active').order_by('-id') [:1]
-    Category=category.objects.filter(cat_status='active').order_by('order') [:11]
-    Categories=category.objects.filter(cat_status='active').order_by('order') [:11]
-    slider=NewsPost.objects.filter().order_by('-id')[:5]
-    latestnews=NewsPost.objects.all().order_by('-id')[:5]
+
     country_codes = CountryCode.objects.all().order_by("name")
     nationalities = Country.objects.only("id", "name").order_by("name")
     language = Language.objects.all()
     Qualifications = Qualification.objects.all()
     equipment = Equipment.objects.all()
     
-    data = {
-        'BlogData':blogdata,
-        'mainnews':mainnews,
-        'Slider':slider,
-        'Blogcat':Category,
-        'latnews':latestnews,
-        'Articale':articales,
-        'vidart':vidarticales,
-        'headline':headline,
-        'trendpost':trending,
-        'bnews':brknews,
-        'vidnews':podcast,
-        'categories':Categories,
+    data = chrome_context(trendpost=3, Blogcat=11)
+    data.update({
+        'categories':data['Blogcat'],
         'journalist': journalist,
         'country_codes': country_codes,
         "nationalities": nationalities,
         "languages": language,
         "qualification": Qualifications,
         "equipments": equipment,
-    }
+    })
     return render(request, 'inn/Journalist_profile.html', data)
 
 
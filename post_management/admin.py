@@ -1,5 +1,5 @@
 from django.contrib import admin
-from post_management.models import category, sub_category, NewsPost, VideoNews, slider,NewsRedirect
+from post_management.models import category, sub_category, NewsPost, VideoNews, slider,NewsRedirect,ImageJob,Tag
 from django.contrib.auth.models import User
 import csv
 from django.http import HttpResponse
@@ -54,6 +54,8 @@ class Post_Admin(admin.ModelAdmin):
     list_filter=('post_date', 'status', TopViewedFilter, 'journalist__registration_type', 'author', 'journalist__first_name', 'journalist__organisation_name', 'post_cat','order','Head_Lines','articles','trending','BreakingNews','Event')
     list_display=('post_title', 'get_posted_by', 'post_date','slug','post_status','viewcounter','order','is_active','status','post_cat','post_image','Head_Lines','articles','trending','BreakingNews','Event','Event_date','schedule_date','post_date','updated_at',)
     list_editable=('status','is_active','order')
+    # post_cat prints its parent category, get_posted_by reads journalist/author
+    list_select_related = ('post_cat__sub_cat', 'author', 'journalist')
     cropping_fields = {'image_crop': ('post_image',)}
     ordering = ('-viewcounter', '-post_date')
     readonly_fields = ('viewcounter',)
@@ -108,6 +110,7 @@ class VideoPost(admin.ModelAdmin):
     list_filter=('video_date','is_active', TopViewedFilter, 'journalist__registration_type', 'author', 'journalist__first_name', 'journalist__organisation_name', 'News_Category','order')
     readonly_fields = ('viewcounter',)
     list_editable=('is_active','order',)
+    list_select_related = ('News_Category__sub_cat', 'author', 'journalist')
     actions = ['export_video_posts_csv']
 
     class Media:
@@ -189,3 +192,17 @@ class NewsRedirectAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
     )
+
+
+@admin.register(Tag)
+class TagAdmin(admin.ModelAdmin):
+    list_display = ['name']
+    search_fields = ['name']
+
+
+@admin.register(ImageJob)
+class ImageJobAdmin(admin.ModelAdmin):
+    list_display = ['image', 'status', 'attempts', 'created_at', 'updated_at']
+    list_filter = ['status']
+    search_fields = ['image']
+    readonly_fields = ['created_at', 'updated_at']
@@ -0,0 +1,88 @@
+from django.core.cache import cache
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from .chrome import chrome_version, CHROME_TIMEOUT
+from .models import NewsPost, VideoNews
+from .pagination import KeysetPage, keyset_page
+
+CATEGORY_CACHE_KEY = "catpage:{subcat}:{version}"
+
+# block -> (filter on top of the subcategory's posts, page size, cursor prefix)
+NEWS_BLOCKS = {
+    'blogdata': ({}, 12, ''),
+    'latest': ({'is_active': True}, 3, None),
+    'headline': ({'Head_Lines': True}, 5, 'headline'),
+    'articles': ({'articles': True}, 5, 'articles'),
+    'trending': ({'trending': True}, 7, 'trending'),
+    'brknews': ({'BreakingNews': True}, 8, 'brknews'),
+}
+VIDEO_BLOCKS = {
+    'videos': ({'video_type': 'video'}, 10, 'videos'),
+    'reels': ({'video_type': 'reel'}, 10, 'reels'),
+    'podcast': ({}, 7, 'podcast'),
+}
+
+NEWEST = [F('schedule_date').desc(), F('id').desc()]
+
+
+def _first_pages(queryset, blocks):
+    """
+    First page (plus one row, for has_next) of every block in one windowed
+    query: a ROW_NUMBER per block, keeping the rows that make some block's cut.
+    """
+    rows = {}
+    keep = Q()
+    for name, (flags, per_page, prefix) in blocks.items():
+        partition = [F(field) for field in flags]
+        rows[name] = f'{name}_row'
+        queryset = queryset.annotate(**{
+            rows[name]: Window(RowNumber(), partition_by=partition or None, order_by=NEWEST),
+        })
+        keep |= Q(**flags, **{f'{rows[name]}__lte': per_page + 1})
+
+    pages = {name: [] for name in blocks}
+    for obj in queryset.filter(keep).order_by('-schedule_date', '-id'):
+        for name, (flags, per_page, prefix) in blocks.items():
+            if getattr(obj, rows[name]) <= per_page + 1 and all(getattr(obj, k) == v for k, v in flags.items()):
+                pages[name].append(obj)
+    return pages
+
+
+def _load(subcat):
+    now = timezone.now()
+    posts = NewsPost.objects.cards().filter(post_cat=subcat, schedule_date__lt=now, status='active')
+    videos = VideoNews.objects.cards().filter(News_Category=subcat, schedule_date__lt=now, is_active='active')
+    pages = _first_pages(posts, NEWS_BLOCKS)
+    pages.update(_first_pages(videos, VIDEO_BLOCKS))
+    return pages
+
+
+def category_blocks(subcat, request):
+    """
+    {block: KeysetPage} for a subcategory page.
+
+    First pages come from two windowed queries (posts, videos) cached per
+    subcategory and content version. A block only gets its own query when the
+    request carries that block's cursor.
+    """
+    key = CATEGORY_CACHE_KEY.format(subcat=subcat.pk, version=chrome_version())
+    pages = cache.get(key)
+    if pages is None:
+        pages = _load(subcat)
+        cache.set(key, pages, CHROME_TIMEOUT)
+
+    now = timezone.now()
+    blocks = {}
+    for blocks_spec, model, base in (
+        (NEWS_BLOCKS, NewsPost, Q(post_cat=subcat, status='active')),
+        (VIDEO_BLOCKS, VideoNews, Q(News_Category=subcat, is_active='active')),
+    ):
+        for name, (flags, per_page, prefix) in blocks_spec.items():
+            page = KeysetPage(pages[name][:per_page], len(pages[name]) > per_page, False, prefix or '')
+            if prefix is not None and (page.after_param in request.GET or page.before_param in request.GET):
+                queryset = model.objects.cards().filter(base, schedule_date__lt=now, **flags)
+                page = keyset_page(queryset, request, per_page, prefix)
+            blocks[name] = page
+    return blocks
@@ -0,0 +1,117 @@
+from datetime import datetime
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from Ad_management.placements import ads_for
+from .models import category, NewsPost, VideoNews
+
+CHROME_VERSION_KEY = "chrome:version"
+CHROME_CACHE_KEY = "chrome:{version}"
+# when the version was last bumped, for Last-Modified on cached pages
+CHROME_CHANGED_KEY = "chrome:changed"
+# Scheduled posts go live without a save, so the cached chrome also expires on its own.
+CHROME_TIMEOUT = 60
+
+# context name -> default number of items handed to the template
+SIDEBAR = {
+    'BlogData': 20,
+    'mainnews': 4,
+    'Articale': 3,
+    'vidart': 2,
+    'headline': 14,
+    'trendpost': 7,
+    'bnews': 8,
+    'vidnews': 1,
+    'Blogcat': 12,
+    'Slider': 5,
+    'latnews': 5,
+}
+
+# context name -> ad_category slug
+AD_SLOTS = {
+    'adtop': 'leaderboard',
+    'adleft': 'skyscraper',
+    'adright': 'mrec',
+    'adtl': 'topleft-600x80',
+    'adtr': 'topright-600x80',
+    'bgad': 'festivebg',
+    'headtopad': 'topad',
+    'popup': 'popup',
+    'lfs': 'left-fest-square',
+}
+AD_LIMITS = {'lfs': 4}
+
+SIDEBAR_ADS = ('adtop', 'adleft', 'adright', 'adtl', 'adtr')
+FESTIVE_ADS = SIDEBAR_ADS + ('bgad',)
+HEADER_ADS = FESTIVE_ADS + ('headtopad', 'popup')
+ALL_ADS = tuple(AD_SLOTS)
+
+
+def chrome_version():
+    version = cache.get(CHROME_VERSION_KEY)
+    if version is None:
+        cache.add(CHROME_VERSION_KEY, 1, None)
+        version = cache.get(CHROME_VERSION_KEY, 1)
+    return version
+
+
+def bump_chrome_version():
+    try:
+        cache.incr(CHROME_VERSION_KEY)
+    except ValueError:
+        cache.set(CHROME_VERSION_KEY, 2, None)
+    cache.set(CHROME_CHANGED_KEY, timezone.now(), None)
+
+
+def _build_chrome():
+    current_datetime = datetime.now()
+    posts = NewsPost.objects.cards().filter(schedule_date__lt=current_datetime, status='active')
+    videos = VideoNews.objects.cards().filter(is_active='active')
+    chrome = {
+        'BlogData': list(posts.filter(is_active=1).order_by('-id')[:20]),
+        'mainnews': list(posts.order_by('order')[:4]),
+        'Articale': list(posts.filter(articles=1).order_by('-id')[:14]),
+        'vidart': list(videos.filter(articles=1, video_type='video').order_by('order')[:8]),
+        'headline': list(posts.filter(Head_Lines=1).order_by('-id')[:14]),
+        'trendpost': list(posts.filter(trending=1).order_by('-id')[:8]),
+        'bnews': list(posts.filter(BreakingNews=1).order_by('-id')[:8]),
+        'vidnews': list(videos.order_by('-id')[:2]),
+        'Blogcat': list(category.objects.filter(cat_status='active').order_by('order')[:12]),
+        'Slider': list(NewsPost.objects.cards().order_by('-id')[:5]),
+        'latnews': list(NewsPost.objects.cards().order_by('-id')[:5]),
+    }
+    for name, slug in AD_SLOTS.items():
+        chrome[name] = ads_for(slug, AD_LIMITS.get(name, 1))
+    return chrome
+
+
+def get_chrome():
+    """
+    Shared header/sidebar/ad blocks, built once per content version.
+    """
+    key = CHROME_CACHE_KEY.format(version=chrome_version())
+    chrome = cache.get(key)
+    if chrome is None:
+        chrome = _build_chrome()
+        cache.set(key, chrome, CHROME_TIMEOUT)
+    return chrome
+
+
+def chrome_context(ads=(), **limits):
+    """
+    Template context for the shared page chrome.
+
+    Every SIDEBAR block is included at its default size unless overridden in
+    ``limits``; pass ``name=0`` to leave a block out. ``ads`` names the ad
+    slots (keys of AD_SLOTS) the page renders.
+    """
+    chrome = get_chrome()
+    data = {}
+    for name, size in SIDEBAR.items():
+        size = limits.get(name, size)
+        if size:
+            data[name] = chrome[name][:size]
+    for name in ads:
+        data[name] = chrome[name]
+    return data
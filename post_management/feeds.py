@@ -0,0 +1,46 @@
+from django.db.models import F, Window, prefetch_related_objects
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from .models import NewsPost
+
+
+def latest_per_category(categories, limit=9):
+    """
+    {category: {"subcategories": [...], "posts": [latest ``limit`` posts]}}
+    for each of ``categories`` in order, in two queries: one for the
+    subcategories and one windowed query (ROW_NUMBER per category) for posts.
+    """
+    categories = list(categories)
+    prefetch_related_objects(categories, 'sub_category_set')
+
+    posts = (
+        NewsPost.objects.cards().filter(
+            post_cat__sub_cat__in=categories,
+            is_active=1,
+            status='active',
+            schedule_date__lte=timezone.now(),
+        )
+        .annotate(
+            feed_cat_id=F('post_cat__sub_cat_id'),
+            feed_row=Window(
+                RowNumber(),
+                partition_by=F('post_cat__sub_cat_id'),
+                order_by=[F('schedule_date').desc(), F('id').desc()],
+            ),
+        )
+        .filter(feed_row__lte=limit)
+        .order_by('feed_cat_id', 'feed_row')
+    )
+
+    by_category = {cat.id: [] for cat in categories}
+    for post in posts:
+        by_category[post.feed_cat_id].append(post)
+
+    return {
+        cat: {
+            "subcategories": list(cat.sub_category_set.all()),
+            "posts": by_category[cat.id],
+        }
+        for cat in categories
+    }
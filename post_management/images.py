@@ -0,0 +1,171 @@
+import os
+import time
+
+from django.conf import settings
+from PIL import Image
+
+THUMBNAIL_SIZE = (400, 400)
+THUMBNAIL_DIR = "thumbnails"
+
+# Responsive renditions built for every tracked image: each width in both
+# formats, smallest first. Nothing is upscaled, the first width at or past
+# the original is written at the original size and the rest are skipped.
+RENDITION_DIR = "renditions"
+RENDITION_WIDTHS = (320, 640, 960, 1280)
+RENDITION_FORMATS = (
+    ('webp', 'WEBP', {'quality': 80, 'method': 4}),
+    ('jpg', 'JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+)
+
+# Derivatives only ever get written, so a file once found is remembered for the
+# life of the process; one not built yet is looked for again after this long.
+DERIVATIVE_RECHECK = 60
+
+_derivatives = {}
+_rendition_sizes = {}
+
+
+class ImageChangeMixin:
+    """
+    Remembers the stored file name of each field in ``tracked_images`` when a
+    row is loaded, so save() can tell a new upload from an ordinary edit.
+
+    ``tracked_images`` maps field name -> (max width, max height). New uploads
+    are queued as ImageJob rows and resized by the image worker, so the
+    request that uploaded them never waits on PIL.
+    """
+    tracked_images = {}
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.remember_images()
+        return instance
+
+    def save(self, *args, **kwargs):
+        changed = [name for name in self.tracked_images if self.image_changed(name)]
+        super().save(*args, **kwargs)
+        self.remember_images()
+        if changed:
+            queue_images([
+                (getattr(self, name).name, self.tracked_images[name])
+                for name in changed
+            ])
+
+    def remember_images(self):
+        # a deferred field stays out of __dict__ until it is touched
+        self._stored_images = {
+            name: str(self.__dict__[name] or '')
+            for name in self.tracked_images
+            if name in self.__dict__
+        }
+
+    def image_changed(self, name):
+        if name not in self.__dict__:
+            return False
+        image = getattr(self, name)
+        if not image:
+            return False
+        # the shared placeholder (VideoNews' thumbnail/na.jpg) is not an upload
+        if image.name == self._meta.get_field(name).get_default():
+            return False
+        stored = getattr(self, '_stored_images', {})
+        return not image._committed or name not in stored or image.name != stored[name]
+
+
+def queue_images(images):
+    """
+    Queue (storage name, (max width, max height)) pairs for the image worker.
+    """
+    from .models import ImageJob
+
+    ImageJob.objects.bulk_create([
+        ImageJob(image=name, max_width=size[0], max_height=size[1])
+        for name, size in images
+    ])
+
+
+def thumbnail_name(name):
+    folder, filename = os.path.split(name)
+    return os.path.join(folder, THUMBNAIL_DIR, filename)
+
+
+def rendition_name(name, width, ext):
+    folder, filename = os.path.split(name)
+    # keep the source extension in the stem, photo.jpg and photo.png can sit side by side
+    stem = filename.replace(".", "_")
+    return os.path.join(folder, RENDITION_DIR, f"{stem}-{width}.{ext}")
+
+
+def derivative_exists(name):
+    """
+    Whether the worker has written ``name`` (a storage name) yet, without a
+    stat per card on every render.
+    """
+    found, checked = _derivatives.get(name, (False, 0))
+    if not found and time.monotonic() - checked > DERIVATIVE_RECHECK:
+        found = os.path.exists(os.path.join(settings.MEDIA_ROOT, name))
+        _derivatives[name] = (found, time.monotonic())
+    return found
+
+
+def rendition_widths(name):
+    """
+    (file width, real width) of each rendition of ``name`` written so far in
+    every format. Only the last one can be narrower than its file width, when
+    the original is smaller than that step; its real width is read from the
+    file header once per process.
+    """
+    widths = []
+    for width in RENDITION_WIDTHS:
+        if not all(derivative_exists(rendition_name(name, width, ext)) for ext, fmt, options in RENDITION_FORMATS):
+            break
+        widths.append((width, width))
+    if widths:
+        last = rendition_name(name, widths[-1][0], 'jpg')
+        if last not in _rendition_sizes:
+            try:
+                with Image.open(os.path.join(settings.MEDIA_ROOT, last)) as img:
+                    _rendition_sizes[last] = img.width
+            except OSError:
+                # half-written or removed under us, leave it out this time
+                return widths[:-1]
+        widths[-1] = (widths[-1][0], _rendition_sizes[last])
+    return widths
+
+
+def write_renditions(img, name):
+    os.makedirs(os.path.join(settings.MEDIA_ROOT, os.path.dirname(name), RENDITION_DIR), exist_ok=True)
+    has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+    sources = {
+        'WEBP': img.convert("RGBA" if has_alpha else "RGB"),
+        'JPEG': img.convert("RGB"),
+    }
+    for width in RENDITION_WIDTHS:
+        size = (min(width, img.width), round(img.height * min(width, img.width) / img.width))
+        for ext, fmt, options in RENDITION_FORMATS:
+            resized = sources[fmt] if size[0] == img.width else sources[fmt].resize(size, Image.LANCZOS)
+            resized.save(os.path.join(settings.MEDIA_ROOT, rendition_name(name, width, ext)), fmt, **options)
+        if width >= img.width:
+            break
+
+
+def process_image(name, max_size=None):
+    """
+    Shrink the original to fit ``max_size`` and write its derivatives.
+    """
+    path = os.path.join(settings.MEDIA_ROOT, name)
+    with Image.open(path) as img:
+        img.load()
+    if max_size and (img.width > max_size[0] or img.height > max_size[1]):
+        img.thumbnail(max_size)
+        img.save(path)
+
+    write_renditions(img, name)
+
+    thumb_path = os.path.join(settings.MEDIA_ROOT, thumbnail_name(name))
+    os.makedirs(os.path.dirname(thumb_path), exist_ok=True)
+    if img.mode in ("RGBA", "P"):
+        img = img.convert("RGB")
+    img.thumbnail(THUMBNAIL_SIZE)
+    img.save(thumb_path, "JPEG", quality=85)
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from post_management.models import sub_category, NewsPost, VideoNews
+from post_management.tags import sync_tags
+
+
+class Command(BaseCommand):
+    help = "Parse the #tag text of every post, video and sub category into Tag rows"
+
+    def handle(self, *args, **options):
+        for model, field in ((NewsPost, 'post_tag'), (VideoNews, 'video_tag'), (sub_category, 'subcat_tag')):
+            count = 0
+            for item in model.objects.only('id', field).iterator():
+                sync_tags(item, getattr(item, field))
+                count += 1
+            self.stdout.write(self.style.SUCCESS(f"{model.__name__}: {count} tagged"))
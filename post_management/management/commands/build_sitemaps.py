@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+import os
+
+from armustnews.sitemaps import FEEDS, dirty_dir, sitemap_path, write_sitemap, write_month, feed_months
+
+
+class Command(BaseCommand):
+    help = "Pre-render sitemap files, rebuilding only the month shards whose posts changed"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--full", action="store_true", help="Rebuild every month shard")
+
+    def handle(self, *args, **options):
+        # take the markers first so saves made during the build flag the next run
+        dirty = set()
+        markers = dirty_dir()
+        if os.path.isdir(markers):
+            for marker in os.listdir(markers):
+                feed, year, month = marker.rsplit("-", 2)
+                dirty.add((feed, int(year), int(month)))
+                os.remove(os.path.join(markers, marker))
+
+        shards = 0
+        for feed in FEEDS:
+            months = set(feed_months(feed))
+            # months that lost their last post still get an (empty) shard rewritten
+            months |= {(year, month) for dirty_feed, year, month in dirty if dirty_feed == feed}
+            for year, month in sorted(months):
+                if options["full"] or (feed, year, month) in dirty or not os.path.exists(sitemap_path(feed, year, month)):
+                    write_month(feed, year, month)
+                    shards += 1
+
+        # the news sitemap is a rolling 7 days, always rebuild it
+        write_sitemap("news")
+
+        if shards or not os.path.exists(sitemap_path()):
+            for feed in FEEDS:
+                write_sitemap(feed)
+            write_sitemap()
+
+        self.stdout.write(self.style.SUCCESS(f"Month shards rebuilt: {shards}"))
@@ -1,63 +1,143 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.apps import apps
 from django.conf import settings
-from PIL import Image
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+import json
 import os
+import time
+
+from post_management.images import ImageChangeMixin, process_image
 
-THUMBNAIL_SIZE = (400, 400)
 IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".gif")
+# source path -> [mtime, size] of every image already processed
+MANIFEST_NAME = ".thumbnails-manifest.json"
+# progress is saved every this many images, so an interrupted backfill resumes
+MANIFEST_SAVE_EVERY = 200
+
+
+def _tracked_names():
+    """
+    Storage names of every image a template can ask renditions for: the
+    ``tracked_images`` fields of the ImageChangeMixin models. Ad creatives,
+    CKEditor uploads and the like are left alone.
+    """
+    names = set()
+    for model in apps.get_models():
+        if not issubclass(model, ImageChangeMixin):
+            continue
+        for field in model.tracked_images:
+            default = model._meta.get_field(field).get_default()
+            names.update(
+                name for name in model.objects.exclude(**{f"{field}__isnull": True}).values_list(field, flat=True).distinct()
+                if name and name != default
+            )
+    return names
+
+
+def _process(name):
+    try:
+        process_image(name)
+    except Exception as e:
+        return name, str(e)
+    return name, None
+
+
+def _save_manifest(path, manifest):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp, path)
 
 
 class Command(BaseCommand):
-    help = "Automatically scan all image files inside MEDIA_ROOT and generate thumbnails"
+    help = "Build thumbnails and renditions for new or changed post, video, slider and CMS images"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processes to use (default: all cores)")
+        parser.add_argument("--since", help="Only look at files modified on or after this date (YYYY-MM-DD)")
+        parser.add_argument("--dry-run", action="store_true", help="List what would be processed and exit")
 
     def handle(self, *args, **options):
-        media_root = settings.MEDIA_ROOT
+        media_root = str(settings.MEDIA_ROOT)
 
         if not os.path.isdir(media_root):
             self.stdout.write(self.style.ERROR(f"MEDIA_ROOT not found: {media_root}"))
             return
 
-        created = 0
-        skipped = 0
-        failed = 0
-
-        # Walk through all folders inside MEDIA_ROOT
-        for root, dirs, files in os.walk(media_root):
-            # Make thumbnails folder inside each folder
-            thumb_dir = os.path.join(root, "thumbnails")
-            os.makedirs(thumb_dir, exist_ok=True)
+        since = None
+        if options["since"]:
+            try:
+                since = datetime.strptime(options["since"], "%Y-%m-%d").timestamp()
+            except ValueError:
+                raise CommandError("--since must look like YYYY-MM-DD")
 
-            for filename in files:
-                if not filename.lower().endswith(IMAGE_EXTENSIONS):
-                    continue
+        manifest_path = os.path.join(media_root, MANIFEST_NAME)
+        manifest = {}
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                manifest = json.load(f)
 
-                original_path = os.path.join(root, filename)
-                thumb_path = os.path.join(thumb_dir, filename)
+        todo = {}
+        skipped = 0
+        missing = 0
+        for name in sorted(_tracked_names()):
+            if not name.lower().endswith(IMAGE_EXTENSIONS):
+                continue
 
-                # Skip if thumb exists
-                if os.path.exists(thumb_path):
-                    skipped += 1
-                    continue
+            try:
+                stat = os.stat(os.path.join(media_root, name))
+            except FileNotFoundError:
+                missing += 1
+                continue
+            if since and stat.st_mtime < since:
+                continue
 
-                try:
-                    with Image.open(original_path) as img:
-                        if img.mode in ("RGBA", "P"):
-                            img = img.convert("RGB")
+            if manifest.get(name) == [stat.st_mtime, stat.st_size]:
+                skipped += 1
+                continue
+            todo[name] = [stat.st_mtime, stat.st_size]
 
-                        img.thumbnail(THUMBNAIL_SIZE)
-                        img.save(thumb_path, "JPEG", quality=85)
+        if options["dry_run"]:
+            for name in sorted(todo):
+                self.stdout.write(name)
+            self.stdout.write(self.style.SUCCESS(f"Would process: {len(todo)}"))
+            self.stdout.write(self.style.WARNING(f"Up to date: {skipped}"))
+            self.stdout.write(self.style.WARNING(f"Missing files: {missing}"))
+            return
 
+        created = 0
+        failed = 0
+        started = time.monotonic()
+        try:
+            with ProcessPoolExecutor(max_workers=max(1, options["workers"])) as pool:
+                futures = [pool.submit(_process, name) for name in todo]
+                try:
+                    for future in as_completed(futures):
+                        name, error = future.result()
+                        if error:
+                            failed += 1
+                            self.stdout.write(self.style.ERROR(f"Error generating thumbnail for {name}: {error}"))
+                            continue
                         created += 1
-                        self.stdout.write(self.style.SUCCESS(f"Thumbnail created: {thumb_path}"))
+                        manifest[name] = todo[name]
+                        self.stdout.write(self.style.SUCCESS(f"Thumbnail created: {name}"))
+                        if created % MANIFEST_SAVE_EVERY == 0:
+                            _save_manifest(manifest_path, manifest)
+                except BaseException:
+                    # Ctrl-C / crash: don't sit through the rest of the queue
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+        finally:
+            _save_manifest(manifest_path, manifest)
 
-                except Exception as e:
-                    failed += 1
-                    self.stdout.write(
-                        self.style.ERROR(f"Error generating thumbnail for {filename}: {e}")
-                    )
+        elapsed = time.monotonic() - started
 
         # Summary
         self.stdout.write(self.style.SUCCESS("----- SUMMARY -----"))
         self.stdout.write(self.style.SUCCESS(f"Created: {created}"))
         self.stdout.write(self.style.WARNING(f"Skipped: {skipped}"))
+        self.stdout.write(self.style.WARNING(f"Missing files: {missing}"))
         self.stdout.write(self.style.ERROR(f"Failed: {failed}"))
+        if created:
+            self.stdout.write(self.style.SUCCESS(f"Time: {elapsed:.1f}s ({created / elapsed:.1f} images/s)"))
@@ -0,0 +1,62 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import F
+from django.utils import timezone
+
+from post_management.images import process_image
+from post_management.models import ImageJob
+
+MAX_ATTEMPTS = 3
+# a job left "running" this long belongs to a worker that died
+STALE_AFTER = timedelta(minutes=10)
+
+
+class Command(BaseCommand):
+    help = "Image worker: resize queued uploads and build their thumbnails"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Drain the queue once and exit")
+        parser.add_argument("--sleep", type=float, default=5, help="Seconds to wait when the queue is empty")
+        parser.add_argument("--batch", type=int, default=20, help="Jobs to pick up per pass")
+
+    def handle(self, *args, **options):
+        while True:
+            done = self.run_batch(options["batch"])
+            if done:
+                continue
+            if options["once"]:
+                return
+            time.sleep(options["sleep"])
+
+    def run_batch(self, size):
+        ImageJob.objects.filter(
+            status='running', updated_at__lt=timezone.now() - STALE_AFTER
+        ).update(status='pending')
+
+        ids = list(ImageJob.objects.filter(status='pending').values_list('id', flat=True)[:size])
+        for job_id in ids:
+            # claim the job, another worker may have taken it already
+            claimed = ImageJob.objects.filter(id=job_id, status='pending').update(
+                status='running', attempts=F('attempts') + 1, updated_at=timezone.now()
+            )
+            if claimed:
+                self.run_job(ImageJob.objects.get(id=job_id))
+        return len(ids)
+
+    def run_job(self, job):
+        size = (job.max_width, job.max_height) if job.max_width and job.max_height else None
+        try:
+            process_image(job.image, size)
+        except Exception as e:
+            job.error = str(e)
+            job.status = 'failed' if job.attempts >= MAX_ATTEMPTS else 'pending'
+            job.save(update_fields=['error', 'status', 'updated_at'])
+            self.stdout.write(self.style.ERROR(f"Error processing {job.image}: {e}"))
+            return
+
+        job.status = 'done'
+        job.error = None
+        job.save(update_fields=['error', 'status', 'updated_at'])
+        self.stdout.write(self.style.SUCCESS(f"Processed: {job.image}"))
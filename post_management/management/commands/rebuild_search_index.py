@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from post_management.search import fts_available, rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for news posts"
+
+    def handle(self, *args, **options):
+        if not fts_available():
+            self.stdout.write(self.style.WARNING("No full-text index on this database, search falls back to a table scan"))
+            return
+        rebuild_index()
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt"))
@@ -0,0 +1,46 @@
+from html import unescape
+
+from django.db import migrations
+from django.utils.html import strip_tags
+
+FTS_TABLE = "post_management_newspost_fts"
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        "title, short_des, body, tags, "
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    )
+
+    NewsPost = apps.get_model("post_management", "NewsPost")
+    for post in NewsPost.objects.only("id", "post_title", "post_short_des", "post_des", "post_tag").iterator():
+        schema_editor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, short_des, body, tags) VALUES (%s, %s, %s, %s, %s)",
+            [
+                post.pk,
+                post.post_title or "",
+                post.post_short_des or "",
+                unescape(strip_tags(post.post_des or "")),
+                " ".join(tag.lstrip("#") for tag in (post.post_tag or "").split()),
+            ],
+        )
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('post_management', '0003_imagejob'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.4 on 2026-10-18 01:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('post_management', '0004_newspost_fts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='newspost',
+            name='tags',
+            field=models.ManyToManyField(blank=True, editable=False, related_name='posts', to='post_management.tag'),
+        ),
+        migrations.AddField(
+            model_name='sub_category',
+            name='tags',
+            field=models.ManyToManyField(blank=True, editable=False, related_name='subcategories', to='post_management.tag'),
+        ),
+        migrations.AddField(
+            model_name='videonews',
+            name='tags',
+            field=models.ManyToManyField(blank=True, editable=False, related_name='videos', to='post_management.tag'),
+        ),
+    ]
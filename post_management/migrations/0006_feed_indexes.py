@@ -0,0 +1,92 @@
+# Generated by Django 5.2.4 on 2026-10-18 01:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('journalist', '0001_initial'),
+        ('post_management', '0005_tags'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='newspost',
+            index=models.Index(fields=['post_cat', 'status', '-schedule_date', '-id'], name='newspost_cat_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newspost',
+            index=models.Index(fields=['journalist', 'status', '-id'], name='newspost_journalist_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newspost',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['-updated_at'], name='newspost_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newspost',
+            index=models.Index(condition=models.Q(('is_active', True), ('status', 'active')), fields=['-schedule_date', '-id'], name='newspost_latest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newspost',
+            index=models.Index(condition=models.Q(('Head_Lines', True), ('status', 'active')), fields=['-schedule_date', '-id'], name='newspost_headlines_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newspost',
+            index=models.Index(condition=models.Q(('articles', True), ('status', 'active')), fields=['-schedule_date', '-id'], name='newspost_articles_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newspost',
+            index=models.Index(condition=models.Q(('status', 'active'), ('trending', True)), fields=['-schedule_date', '-id'], name='newspost_trending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newspost',
+            index=models.Index(condition=models.Q(('BreakingNews', True), ('status', 'active')), fields=['-schedule_date', '-id'], name='newspost_breaking_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newspost',
+            index=models.Index(condition=models.Q(('Event', True), ('status', 'active')), fields=['-schedule_date', '-id'], name='newspost_event_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newspost',
+            index=models.Index(condition=models.Q(('is_active', True), ('status', 'active')), fields=['-id'], name='newspost_latest_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newspost',
+            index=models.Index(condition=models.Q(('Head_Lines', True), ('status', 'active')), fields=['-id'], name='newspost_headlines_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newspost',
+            index=models.Index(condition=models.Q(('articles', True), ('status', 'active')), fields=['-id'], name='newspost_articles_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newspost',
+            index=models.Index(condition=models.Q(('status', 'active'), ('trending', True)), fields=['-id'], name='newspost_trending_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newspost',
+            index=models.Index(condition=models.Q(('BreakingNews', True), ('status', 'active')), fields=['-id'], name='newspost_breaking_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newspost',
+            index=models.Index(condition=models.Q(('Event', True), ('status', 'active')), fields=['-id'], name='newspost_event_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='videonews',
+            index=models.Index(fields=['is_active', 'video_type', 'order'], name='videonews_type_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='videonews',
+            index=models.Index(fields=['is_active', '-schedule_date', '-id'], name='videonews_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='videonews',
+            index=models.Index(fields=['News_Category', 'is_active', 'video_type', 'order'], name='videonews_cat_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='videonews',
+            index=models.Index(fields=['is_active', '-updated_at'], name='videonews_updated_idx'),
+        ),
+    ]
@@ -4,8 +4,6 @@ from autoslug import AutoSlugField
 
 from image_cropping import ImageCropField, ImageRatioField
 
-from PIL import Image
-
 from ckeditor.fields import RichTextField
 
 from ckeditor_uploader.fields import RichTextUploadingField
@@ -20,6 +18,20 @@ from journalist.models import Journalist
 
 from django.core.exceptions import ValidationError
 
+from .images import ImageChangeMixin
+
+
+
+class Tag(models.Model):
+
+    # lowercase, without the leading '#', see post_management/tags.py
+
+    name=models.CharField(max_length=100,unique=True)
+
+    def __str__(self):
+
+        return "#" + self.name
+
 
 
 class category(models.Model):
@@ -56,6 +68,8 @@ class sub_category(models.Model):
 
     subcat_tag=models.TextField(null=True,default="#trending #latest", verbose_name="Cat tag")
 
+    tags=models.ManyToManyField("Tag", related_name="subcategories", blank=True, editable=False)
+
     STATUS_CHOICES = (
 
         ('active', 'Active'),
@@ -74,45 +88,61 @@ class sub_category(models.Model):
 
     
 
-class NewsPost(models.Model):
+class CardQuerySet(models.QuerySet):
 
-    post_cat=models.ForeignKey("sub_category", verbose_name="Select Cetegory",null=True,default=None,on_delete=models.CASCADE)
+    # long bodies only the detail/edit pages show
+    card_deferred = ()
 
-    post_title=models.CharField(max_length=150, verbose_name="News Head Line",null=True,default=None)
+    # what a card prints next to the title: category (its __str__ reads the
+    # parent category too) and get_posted_by()
+    card_related = ()
 
-    post_short_des=models.CharField(max_length=160, verbose_name="Short Discretion",null=True,default=None)
+    def cards(self):
+        """
+        Rows for listings, sidebars and cards: everything but the long text,
+        with the category and author/journalist joined in.
+        """
+        return self.defer(*self.card_deferred).select_related(*self.card_related)
 
-    post_des=RichTextUploadingField(null=True,default='No News', verbose_name="Long Discretion")
 
-    # post_image=models.FileField(upload_to="blog/", max_length=255,null=True,default=None)
 
-    post_image = ImageCropField(upload_to='blog/%Y/%m/%d', max_length=255,null=True,default=None, verbose_name="News Image (1280X720px)")
+class NewsPostQuerySet(CardQuerySet):
 
-    #image_crop = ImageRatioField('post_image', '430x360')
+    card_deferred = ('post_des', 'post_tag')
 
-    
+    card_related = ('post_cat__sub_cat', 'author', 'journalist')
+
+
+
+class VideoNewsQuerySet(CardQuerySet):
+
+    card_deferred = ('video_des', 'video_tag')
+
+    card_related = ('News_Category__sub_cat', 'author', 'journalist')
 
-    def save(self, *args, **kwargs):
 
-        # Override the save method to resize the image before saving
 
-        super(NewsPost, self).save(*args, **kwargs)
+class NewsPost(ImageChangeMixin, models.Model):
 
-        # Open the image
+    post_cat=models.ForeignKey("sub_category", verbose_name="Select Cetegory",null=True,default=None,on_delete=models.CASCADE)
+
+    post_title=models.CharField(max_length=150, verbose_name="News Head Line",null=True,default=None)
 
-        img = Image.open(self.post_image.path)
+    post_short_des=models.CharField(max_length=160, verbose_name="Short Discretion",null=True,default=None)
+
+    post_des=RichTextUploadingField(null=True,default='No News', verbose_name="Long Discretion")
 
-        # Set the desired size for cropping (width, height)
+    # post_image=models.FileField(upload_to="blog/", max_length=255,null=True,default=None)
 
-        desired_size = (1280, 720)
+    post_image = ImageCropField(upload_to='blog/%Y/%m/%d', max_length=255,null=True,default=None, verbose_name="News Image (1280X720px)")
 
-        # Resize the image while maintaining the aspect ratio
+    #image_crop = ImageRatioField('post_image', '430x360')
 
-        img.thumbnail(desired_size)
+    
 
-        # Save the resized image back to the original path
+    # resized to fit inside this box off-request, see images.py
 
-        img.save(self.post_image.path)
+    tracked_images = {'post_image': (1280, 720)}
 
     
 
@@ -120,6 +150,8 @@ class NewsPost(models.Model):
 
     post_tag=models.TextField(null=True,default="#trending #latest", verbose_name="News tag")
 
+    tags=models.ManyToManyField("Tag", related_name="posts", blank=True, editable=False)
+
         
 
     is_active=models.BooleanField(verbose_name="Latest News", null=True, default=True)
@@ -170,6 +202,10 @@ class NewsPost(models.Model):
 
 
 
+    objects = NewsPostQuerySet.as_manager()
+
+
+
     def get_posted_by(self):
 
         if self.journalist:
@@ -208,11 +244,58 @@ class NewsPost(models.Model):
 
          return reverse('newsdetails', args=[self.slug])
 
+
+
+    class Meta:
+
+        # matched to the feed queries in armustnews/views.py, journalist and sitemaps
+
+        indexes = [
+
+
+            models.Index(fields=['post_cat', 'status', '-schedule_date', '-id'], name='newspost_cat_feed_idx'),
+
+            models.Index(fields=['journalist', 'status', '-id'], name='newspost_journalist_idx'),
+
+            models.Index(fields=['-updated_at'], condition=models.Q(status='active'), name='newspost_updated_idx'),
+
+            # one small index per feed and order; a plain (status, date) index would win the
+
+            # planner's guess for every flag and then walk past all the non-matching rows.
+
+            # Listings page by (schedule_date, id), sidebar and home blocks take the newest ids.
+
+            models.Index(fields=['-schedule_date', '-id'], condition=models.Q(status='active', is_active=True), name='newspost_latest_idx'),
+
+            models.Index(fields=['-schedule_date', '-id'], condition=models.Q(status='active', Head_Lines=True), name='newspost_headlines_idx'),
+
+            models.Index(fields=['-schedule_date', '-id'], condition=models.Q(status='active', articles=True), name='newspost_articles_idx'),
+
+            models.Index(fields=['-schedule_date', '-id'], condition=models.Q(status='active', trending=True), name='newspost_trending_idx'),
+
+            models.Index(fields=['-schedule_date', '-id'], condition=models.Q(status='active', BreakingNews=True), name='newspost_breaking_idx'),
+
+            models.Index(fields=['-schedule_date', '-id'], condition=models.Q(status='active', Event=True), name='newspost_event_idx'),
+
+            models.Index(fields=['-id'], condition=models.Q(status='active', is_active=True), name='newspost_latest_id_idx'),
+
+            models.Index(fields=['-id'], condition=models.Q(status='active', Head_Lines=True), name='newspost_headlines_id_idx'),
+
+            models.Index(fields=['-id'], condition=models.Q(status='active', articles=True), name='newspost_articles_id_idx'),
+
+            models.Index(fields=['-id'], condition=models.Q(status='active', trending=True), name='newspost_trending_id_idx'),
+
+            models.Index(fields=['-id'], condition=models.Q(status='active', BreakingNews=True), name='newspost_breaking_id_idx'),
+
+            models.Index(fields=['-id'], condition=models.Q(status='active', Event=True), name='newspost_event_id_idx'),
+
+        ]
+
         
 
 
 
-class VideoNews(models.Model):
+class VideoNews(ImageChangeMixin, models.Model):
 
     News_Category =models.ForeignKey("sub_category", verbose_name="Select Category",null=True,default=None,on_delete=models.CASCADE)
 
@@ -238,8 +321,12 @@ class VideoNews(models.Model):
 
     video_thumbnail = ImageCropField(upload_to='thumbnail/%Y/%m/%d', max_length=255,null=True,default='thumbnail/na.jpg',blank=True, verbose_name="Thumbnail (1280X720px)")
 
+    tracked_images = {'video_thumbnail': (1280, 720)}
+
     video_tag=models.CharField(max_length=255,null=True,default=0)
 
+    tags=models.ManyToManyField("Tag", related_name="videos", blank=True, editable=False)
+
     schedule_date=models.DateTimeField(unique=False,null=False,default=timezone.now,verbose_name="Schedule Date")
 
     video_date=models.DateTimeField(auto_now_add=True)
@@ -278,6 +365,10 @@ class VideoNews(models.Model):
 
 
 
+    objects = VideoNewsQuerySet.as_manager()
+
+
+
     def get_posted_by(self):
 
         if self.journalist:
@@ -316,43 +407,39 @@ class VideoNews(models.Model):
 
         return reverse('videonewsdetails', args=[self.slug])
 
-     
-
-class slider(models.Model):
 
-    slidercat=models.ForeignKey("sub_category", verbose_name="Select Cetegory",null=True,default=None,on_delete=models.CASCADE)
 
-    title=models.CharField(max_length=200, verbose_name="News Head Line",null=True,default=None)
+    class Meta:
 
-    des=models.CharField(max_length=300, verbose_name="Short Discretion",null=True,default=None)
+        indexes = [
 
-    sliderimage = ImageCropField(upload_to='blog/', max_length=255,null=True,default=None, verbose_name="Slider Image (1400X520px)")
+            models.Index(fields=['is_active', 'video_type', 'order'], name='videonews_type_order_idx'),
 
-    #image_crop = ImageRatioField('post_image', '430x360')
+            models.Index(fields=['is_active', '-schedule_date', '-id'], name='videonews_feed_idx'),
 
-    
+            models.Index(fields=['News_Category', 'is_active', 'video_type', 'order'], name='videonews_cat_order_idx'),
 
-    def save(self, *args, **kwargs):
+            models.Index(fields=['is_active', '-updated_at'], name='videonews_updated_idx'),
 
-        # Override the save method to resize the image before saving
+        ]
 
-        super(slider, self).save(*args, **kwargs)
+     
 
-        # Open the image
+class slider(ImageChangeMixin, models.Model):
 
-        img = Image.open(self.sliderimage.path)
+    slidercat=models.ForeignKey("sub_category", verbose_name="Select Cetegory",null=True,default=None,on_delete=models.CASCADE)
 
-        # Set the desired size for cropping (width, height)
+    title=models.CharField(max_length=200, verbose_name="News Head Line",null=True,default=None)
 
-        desired_size = (1400, 520)
+    des=models.CharField(max_length=300, verbose_name="Short Discretion",null=True,default=None)
 
-        # Resize the image while maintaining the aspect ratio
+    sliderimage = ImageCropField(upload_to='blog/', max_length=255,null=True,default=None, verbose_name="Slider Image (1400X520px)")
 
-        img.thumbnail(desired_size)
+    #image_crop = ImageRatioField('post_image', '430x360')
 
-        # Save the resized image back to the original path
+    
 
-        img.save(self.sliderimage.path)
+    tracked_images = {'sliderimage': (1400, 520)}
 
     
 
@@ -420,4 +507,31 @@ class NewsRedirect(models.Model):
     def clean(self):
         """Validate that old_slug and redirect_slug are different"""
         if self.old_slug == self.redirect_slug:
-            raise ValidationError("Old slug and redirect slug cannot be the same")
\ No newline at end of file
+            raise ValidationError("Old slug and redirect slug cannot be the same")
+
+class ImageJob(models.Model):
+    """
+    Queue of uploaded images waiting for the image worker
+    (manage.py process_image_jobs) to resize them and build derivatives.
+    """
+    image = models.CharField(max_length=255, help_text="Storage name of the uploaded image")
+    max_width = models.IntegerField(null=True, blank=True, default=None)
+    max_height = models.IntegerField(null=True, blank=True, default=None)
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    )
+    status = models.CharField(max_length=8, choices=STATUS_CHOICES, default='pending')
+    attempts = models.IntegerField(default=0)
+    error = models.TextField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [models.Index(fields=['status', 'id'])]
+
+    def __str__(self):
+        return f"{self.image} ({self.status})"
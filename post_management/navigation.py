@@ -0,0 +1,49 @@
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import category
+
+MENU_VERSION_KEY = "menu:version"
+MENU_CACHE_KEY = "menu:{version}"
+MENU_CHANGED_KEY = "menu:changed"
+# only category/sub_category saves change the menu, the timeout just clears out old versions
+MENU_TIMEOUT = 60 * 60 * 24
+MENU_SIZE = 12
+
+
+def menu_version():
+    version = cache.get(MENU_VERSION_KEY)
+    if version is None:
+        cache.add(MENU_VERSION_KEY, 1, None)
+        version = cache.get(MENU_VERSION_KEY, 1)
+    return version
+
+
+def bump_menu_version():
+    try:
+        cache.incr(MENU_VERSION_KEY)
+    except ValueError:
+        cache.set(MENU_VERSION_KEY, 2, None)
+    cache.set(MENU_CHANGED_KEY, timezone.now(), None)
+
+
+def _build_menu():
+    return list(
+        category.objects.filter(cat_status='active')
+        .order_by('order')
+        .prefetch_related('sub_category_set')[:MENU_SIZE]
+    )
+
+
+def menu_tree():
+    """
+    Active categories for the header menu, each with its sub categories
+    prefetched, so ``link.sub_category_set.all`` in templates costs no query.
+    Built once per menu version and shared through the cache.
+    """
+    key = MENU_CACHE_KEY.format(version=menu_version())
+    menu = cache.get(key)
+    if menu is None:
+        menu = _build_menu()
+        cache.set(key, menu, MENU_TIMEOUT)
+    return menu
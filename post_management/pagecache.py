@@ -0,0 +1,201 @@
+import hashlib
+import re
+import time
+from datetime import datetime, timezone as dt_timezone
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, QueryDict
+from django.middleware.csrf import get_token
+from django.views.decorators.http import condition
+
+from Ad_management.placements import PLACEMENTS_TIMEOUT
+from setting.context import setting_version, SETTING_CHANGED_KEY
+from .chrome import chrome_version, CHROME_CHANGED_KEY, CHROME_TIMEOUT
+from .navigation import menu_version, MENU_CHANGED_KEY
+from .viewcounts import replay_views
+
+# Pages are also purged by signals, the timeout only covers what signals
+# can't see: scheduled posts going live and sidebar blocks of other pages.
+PAGE_CACHE_TIMEOUT = getattr(settings, 'PAGE_CACHE_TIMEOUT', 120)
+
+# Scheduled posts going live and ad date windows change the sidebar and ads
+# without bumping any version, the caches just expire. ETag/Last-Modified roll
+# over once per this window so a 304 never outlives the longest of those TTLs.
+VALIDATOR_WINDOW = max(PAGE_CACHE_TIMEOUT, CHROME_TIMEOUT, PLACEMENTS_TIMEOUT)
+
+# every cached page depends on this group (header, sidebar, ads, footer)
+ALL_PAGES = 'all'
+
+GROUP_VERSION_KEY = "pagecache:group:{}"
+PAGE_KEY = "pagecache:page:{path}:{versions}"
+
+# The only query params a cached view reads are keyset cursors (after, before,
+# <block>_after, <block>_before). Everything else (utm_*, fbclid, ...) is
+# dropped before the view runs, so it neither splits the cache nor ends up
+# in the cached HTML.
+CURSOR_PARAMS = ('after', 'before')
+CURSOR_SUFFIXES = ('_after', '_before')
+
+# Header forms render {% csrf_token %} (input value and {{ csrf_token }} in JS).
+# The cached copy keeps a placeholder and every hit gets its own token, which
+# also makes CsrfViewMiddleware set the csrftoken cookie.
+CSRF_INPUT_RE = re.compile(rb'name="csrfmiddlewaretoken" value="([a-zA-Z0-9]+)"')
+CSRF_PLACEHOLDER = b'__pagecache_csrf_token__'
+
+
+def _group_versions(groups):
+    keys = [GROUP_VERSION_KEY.format(group) for group in groups]
+    found = cache.get_many(keys)
+    return [found.get(key, 1) for key in keys]
+
+
+def purge_pages(*groups):
+    """
+    Drop every cached page that belongs to any of ``groups``.
+    """
+    for group in groups:
+        key = GROUP_VERSION_KEY.format(group)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 2, None)
+
+
+def _cacheable(request):
+    return (
+        request.method in ('GET', 'HEAD')
+        and not request.user.is_authenticated
+        # a flash message rendered into the page must not be served to others
+        and 'messages' not in request.COOKIES
+    )
+
+
+def _page_query(request):
+    query = QueryDict(mutable=True)
+    for name, values in sorted(request.GET.lists()):
+        if name in CURSOR_PARAMS or name.endswith(CURSOR_SUFFIXES):
+            query.setlist(name, values)
+    query._mutable = False
+    return query
+
+
+def _cached_content(request, content):
+    """
+    The page as stored: its CSRF token swapped for the placeholder, or None
+    when a token was used but can't be found to swap out (don't cache then).
+    """
+    if not request.META.get('CSRF_COOKIE_NEEDS_UPDATE'):
+        return content
+    match = CSRF_INPUT_RE.search(content)
+    if match is None:
+        return None
+    return content.replace(match.group(1), CSRF_PLACEHOLDER)
+
+
+def anonymous_page_cache(*groups):
+    """
+    Cache a view's page for anonymous readers, keyed by path and cursor params.
+
+    ``groups`` are purge groups, formatted with the view's URL kwargs,
+    e.g. ``@anonymous_page_cache('news:{slug}')``. Every page is also in
+    the ALL_PAGES group.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if not _cacheable(request):
+                return view(request, *args, **kwargs)
+
+            request.GET = _page_query(request)
+            # get_full_path()/build_absolute_uri() in templates read this one
+            request.META['QUERY_STRING'] = request.GET.urlencode()
+            page_groups = [ALL_PAGES] + [group.format(**kwargs) for group in groups]
+            key = PAGE_KEY.format(
+                path=hashlib.md5(request.get_full_path().encode()).hexdigest(),
+                versions=".".join(str(v) for v in _group_versions(page_groups)),
+            )
+            page = cache.get(key)
+            if page is not None:
+                replay_views(page['views'])
+                content = page['content']
+                if CSRF_PLACEHOLDER in content:
+                    content = content.replace(CSRF_PLACEHOLDER, get_token(request).encode())
+                response = HttpResponse(content, content_type=page['content_type'])
+                response['X-Page-Cache'] = 'hit'
+                return response
+
+            response = view(request, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming and not response.cookies:
+                content = _cached_content(request, response.content)
+                if content is not None:
+                    cache.set(key, {
+                        'content': content,
+                        'content_type': response['Content-Type'],
+                        'views': getattr(request, 'recorded_views', []),
+                    }, PAGE_CACHE_TIMEOUT)
+            return response
+        return wrapper
+    return decorator
+
+
+def _validator_window():
+    """
+    Start of the current VALIDATOR_WINDOW, as an aware datetime.
+    """
+    now = time.time()
+    return datetime.fromtimestamp(now - now % VALIDATOR_WINDOW, tz=dt_timezone.utc)
+
+
+def conditional_page(queryset):
+    """
+    ETag/Last-Modified for an anonymous detail page, answering
+    If-None-Match/If-Modified-Since with a 304 before the view runs.
+
+    The page's row is ``queryset`` filtered by the view's URL kwargs, e.g.
+    ``@conditional_page(NewsPost.objects.filter(status='active'))`` on a
+    ``<slug>`` view. Its updated_at, the chrome, menu and site setting
+    versions and the current VALIDATOR_WINDOW make the ETag. Last-Modified
+    is the latest of updated_at, the times those versions were bumped and
+    the window's start, so neither validator outlives a sidebar or ad change.
+    A 304 still counts as a view of the row.
+    """
+    def page_row(request, kwargs):
+        # etag and last_modified both need it, one query per request
+        if not hasattr(request, 'page_row'):
+            request.page_row = None
+            if _cacheable(request):
+                row = queryset.filter(**kwargs).values_list('pk', 'updated_at').first()
+                if row is not None:
+                    request.page_row = row + (_validator_window(),)
+        return request.page_row
+
+    def etag(request, *args, **kwargs):
+        row = page_row(request, kwargs)
+        if row is None:
+            return None
+        pk, updated, window = row
+        versions = f"{updated.isoformat()}:{chrome_version()}:{menu_version()}:{setting_version()}:{window.timestamp():.0f}"
+        return hashlib.md5(versions.encode()).hexdigest()
+
+    def last_modified(request, *args, **kwargs):
+        row = page_row(request, kwargs)
+        if row is None:
+            return None
+        pk, updated, window = row
+        changed = cache.get_many([CHROME_CHANGED_KEY, MENU_CHANGED_KEY, SETTING_CHANGED_KEY])
+        return max([updated, window, *changed.values()])
+
+    def decorator(view):
+        conditional_view = condition(etag_func=etag, last_modified_func=last_modified)(view)
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            if response.status_code == 304 and request.page_row is not None:
+                # the view didn't run, count the read it would have recorded
+                replay_views([(queryset.model._meta.label, request.page_row[0])])
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.db.models import Q
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+class KeysetPage(list):
+    """
+    One page of a keyset (cursor) listing, newest first by (schedule_date, id).
+
+    It is the page's rows, so templates loop and slice it like a list. There
+    is no page count: an extra row is fetched to know whether there is a next
+    page, which keeps deep pages as cheap as the first one.
+    """
+
+    def __init__(self, rows, has_next, has_previous, prefix=''):
+        super().__init__(rows)
+        self.has_next = has_next
+        self.has_previous = has_previous
+        self.after_param = f'{prefix}_after' if prefix else 'after'
+        self.before_param = f'{prefix}_before' if prefix else 'before'
+
+    @property
+    def next_cursor(self):
+        return encode_cursor(self[-1]) if self else ''
+
+    @property
+    def previous_cursor(self):
+        return encode_cursor(self[0]) if self else ''
+
+
+def encode_cursor(obj):
+    delta = obj.schedule_date - EPOCH
+    return f'{delta // timedelta(microseconds=1)}.{obj.pk}'
+
+
+def decode_cursor(value):
+    """
+    (schedule_date, id) from a cursor, or None when it is missing or mangled.
+    """
+    try:
+        micros, pk = value.split('.')
+        return EPOCH + timedelta(microseconds=int(micros)), int(pk)
+    except (AttributeError, ValueError, OverflowError):
+        return None
+
+
+def keyset_page(queryset, request, per_page=12, prefix=''):
+    """
+    The page of ``queryset`` the request's ``after``/``before`` cursor points
+    at (``<prefix>_after``/``<prefix>_before`` when a view pages several blocks).
+    """
+    page = KeysetPage([], False, False, prefix)
+    queryset = queryset.order_by('-schedule_date', '-id')
+    after = decode_cursor(request.GET.get(page.after_param))
+    before = decode_cursor(request.GET.get(page.before_param))
+
+    if before:
+        date, pk = before
+        rows = list(queryset.filter(Q(schedule_date__gt=date) | Q(schedule_date=date, id__gt=pk)).reverse()[:per_page + 1])
+        has_previous = len(rows) > per_page
+        rows = rows[:per_page][::-1]
+        return KeysetPage(rows, True, has_previous, prefix)
+
+    if after:
+        date, pk = after
+        queryset = queryset.filter(Q(schedule_date__lt=date) | Q(schedule_date=date, id__lt=pk))
+    rows = list(queryset[:per_page + 1])
+    return KeysetPage(rows[:per_page], len(rows) > per_page, bool(after), prefix)
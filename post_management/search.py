@@ -0,0 +1,133 @@
+import re
+from html import unescape
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db.models import Q
+from django.utils.html import strip_tags
+
+from .models import NewsPost
+
+# FTS5 index over NewsPost, rowid = NewsPost.id (created by migration 0004)
+FTS_TABLE = "post_management_newspost_fts"
+# bm25 column weights: title, short des, body, tags
+FTS_WEIGHTS = (10.0, 4.0, 1.0, 2.0)
+
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+_fts_available = None
+
+
+def fts_available():
+    global _fts_available
+    if _fts_available is None:
+        _fts_available = (
+            connection.vendor == "sqlite"
+            and FTS_TABLE in connection.introspection.table_names()
+        )
+    return _fts_available
+
+
+def search_document(post):
+    """
+    The four indexed columns for a post: title, short des, plain body, tags.
+    """
+    body = unescape(strip_tags(post.post_des or ""))
+    tags = " ".join(tag.lstrip("#") for tag in (post.post_tag or "").split())
+    return [post.post_title or "", post.post_short_des or "", body, tags]
+
+
+def index_post(post):
+    if not fts_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [post.pk])
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, short_des, body, tags) VALUES (%s, %s, %s, %s, %s)",
+            [post.pk] + search_document(post),
+        )
+
+
+def unindex_post(post_id):
+    if not fts_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [post_id])
+
+
+def rebuild_index():
+    if not fts_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+    for post in NewsPost.objects.only("id", "post_title", "post_short_des", "post_des", "post_tag").iterator():
+        index_post(post)
+
+
+class SearchResults:
+    """
+    Ranked FTS matches that only load the rows of the page being shown,
+    so it can be handed straight to Paginator.
+    """
+
+    def __init__(self, words):
+        # every word must match, each one as a prefix: "dub"* "news"*
+        self.match = " ".join('"%s"*' % word for word in words)
+        self._count = None
+
+    _from = (
+        f" FROM {FTS_TABLE} f JOIN post_management_newspost p ON p.id = f.rowid"
+        f" WHERE {FTS_TABLE} MATCH %s AND p.status = 'active' AND p.is_active = 1"
+    )
+
+    def count(self):
+        if self._count is None:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT COUNT(*)" + self._from, [self.match])
+                self._count = cursor.fetchone()[0]
+        return self._count
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+        start = index.start or 0
+        stop = self.count() if index.stop is None else index.stop
+        weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT p.id{self._from} ORDER BY bm25({FTS_TABLE}, {weights}), p.id DESC LIMIT %s OFFSET %s",
+                [self.match, max(stop - start, 0), start],
+            )
+            ids = [row[0] for row in cursor.fetchall()]
+        posts = NewsPost.objects.cards().in_bulk(ids)
+        return [posts[i] for i in ids if i in posts]
+
+
+def search_posts(query):
+    """
+    Active posts matching every word of ``query`` (prefix match), best first.
+    """
+    words = WORD_RE.findall(query or "")
+    if not words:
+        return NewsPost.objects.none()
+    if fts_available():
+        return SearchResults(words)
+    if not settings.DEBUG:
+        raise ImproperlyConfigured(
+            f"Search needs the {FTS_TABLE} FTS5 table (migration 0004, SQLite only)."
+        )
+
+    # dev only: a database without the FTS5 table gets an unindexed scan over the same fields
+    posts = NewsPost.objects.cards().filter(is_active=1, status="active")
+    for word in words:
+        posts = posts.filter(
+            Q(post_title__icontains=word)
+            | Q(post_short_des__icontains=word)
+            | Q(post_des__icontains=word)
+            | Q(post_tag__icontains=word)
+        )
+    return posts.order_by("-schedule_date")
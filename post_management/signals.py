@@ -1,49 +1,107 @@
-import os
-from django.conf import settings
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from PIL import Image
-from .models import NewsPost
+from Ad_management.models import ad_category, ad
+from setting.models import CMS, profile_setting
+from setting.context import bump_setting_version
+from armustnews.sitemaps import mark_month_dirty, NEWS_FEEDS, VIDEO_FEEDS
+from .models import category, sub_category, NewsPost, VideoNews
+from .chrome import bump_chrome_version
+from .navigation import bump_menu_version
+from .search import index_post, unindex_post
+from .tags import sync_tags
+from .pagecache import purge_pages, ALL_PAGES
 
-THUMBNAIL_SIZE = (400, 400)
-IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".gif")
 
 
-@receiver(post_save, sender=NewsPost)
-def run_thumbnail_logic_on_new_post(sender, instance, created, **kwargs):
+@receiver([post_save, post_delete], sender=NewsPost)
+@receiver([post_save, post_delete], sender=VideoNews)
+@receiver([post_save, post_delete], sender=category)
+@receiver([post_save, post_delete], sender=sub_category)
+@receiver([post_save, post_delete], sender=ad_category)
+@receiver([post_save, post_delete], sender=ad)
+def invalidate_page_chrome(sender, **kwargs):
     """
-    Run thumbnail generation ONLY when a new NewsPost is created.
+    Any change to content shown in the header/sidebar starts a new chrome version.
     """
+    bump_chrome_version()
+
+
+@receiver([post_save, post_delete], sender=category)
+@receiver([post_save, post_delete], sender=sub_category)
+def invalidate_menu(sender, **kwargs):
+    bump_menu_version()
+
+
+@receiver(post_save, sender=NewsPost)
+def update_search_index(sender, instance, **kwargs):
+    index_post(instance)
+
+
+@receiver(post_delete, sender=NewsPost)
+def remove_from_search_index(sender, instance, **kwargs):
+    unindex_post(instance.pk)
+
+
+@receiver(post_save, sender=NewsPost)
+def sync_post_tags(sender, instance, **kwargs):
+    sync_tags(instance, instance.post_tag)
 
-    if not created:
-        return   # <-- UPDATE par run nahi hoga, sirf CREATE par
 
-    if not instance.post_image:
-        return   # No image uploaded, skip
+@receiver(post_save, sender=VideoNews)
+def sync_video_tags(sender, instance, **kwargs):
+    sync_tags(instance, instance.video_tag)
 
-    original_path = instance.post_image.path
-    root = os.path.dirname(original_path)
-    filename = os.path.basename(original_path)
 
-    # Thumbnail folder
-    thumb_dir = os.path.join(root, "thumbnails")
-    os.makedirs(thumb_dir, exist_ok=True)
+@receiver(post_save, sender=sub_category)
+def sync_subcategory_tags(sender, instance, **kwargs):
+    sync_tags(instance, instance.subcat_tag)
 
-    thumb_path = os.path.join(thumb_dir, filename)
 
-    # Skip if thumb exists
-    if os.path.exists(thumb_path):
-        return
+@receiver([post_save, post_delete], sender=NewsPost)
+def purge_post_pages(sender, instance, **kwargs):
+    groups = ['home', 'news-lists', f'news:{instance.slug}']
+    if instance.post_cat_id:
+        groups.append(f'subcat:{instance.post_cat.subcat_slug}')
+    purge_pages(*groups)
+
+
+@receiver([post_save, post_delete], sender=VideoNews)
+def purge_video_pages(sender, instance, **kwargs):
+    groups = ['home', f'video:{instance.slug}']
+    if instance.News_Category_id:
+        groups.append(f'subcat:{instance.News_Category.subcat_slug}')
+    purge_pages(*groups)
+
+
+@receiver([post_save, post_delete], sender=CMS)
+@receiver([post_save, post_delete], sender=profile_setting)
+def invalidate_site_settings(sender, **kwargs):
+    bump_setting_version()
+
+
+@receiver([post_save, post_delete], sender=CMS)
+@receiver([post_save, post_delete], sender=profile_setting)
+def purge_cms_pages(sender, instance, **kwargs):
+    # the header/footer show the profile and list CMS pages, so every page changes
+    purge_pages(ALL_PAGES)
+
+
+@receiver([post_save, post_delete], sender=category)
+@receiver([post_save, post_delete], sender=sub_category)
+@receiver([post_save, post_delete], sender=ad_category)
+@receiver([post_save, post_delete], sender=ad)
+def purge_all_pages(sender, **kwargs):
+    """
+    Menus, category blocks and ads are on every page.
+    """
+    purge_pages(ALL_PAGES)
 
-    try:
-        with Image.open(original_path) as img:
-            if img.mode in ("RGBA", "P"):
-                img = img.convert("RGB")
 
-            img.thumbnail(THUMBNAIL_SIZE)
-            img.save(thumb_path, "JPEG", quality=85)
+@receiver([post_save, post_delete], sender=NewsPost)
+def mark_post_month(sender, instance, **kwargs):
+    mark_month_dirty(NEWS_FEEDS, instance.post_date)
 
-            print("Thumbnail Created:", thumb_path)
 
-    except Exception as e:
-        print("Thumbnail Error:", e)
+@receiver([post_save, post_delete], sender=VideoNews)
+def mark_video_month(sender, instance, **kwargs):
+    mark_month_dirty(VIDEO_FEEDS, instance.video_date)
@@ -0,0 +1,27 @@
+import re
+
+# hyphens are part of a tag: #uae-news
+TAG_RE = re.compile(r"#([\w-]+)", re.UNICODE)
+
+
+def parse_tags(text):
+    """
+    "#Dubai #latest news #dubai #uae-news" -> ["dubai", "latest", "uae-news"]
+    """
+    names = []
+    for name in TAG_RE.findall(str(text or "")):
+        name = name.strip("-").lower()[:100]
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def sync_tags(instance, text):
+    """
+    Point ``instance.tags`` at the Tag rows for the #tags in ``text``.
+    """
+    from .models import Tag
+
+    names = parse_tags(text)
+    Tag.objects.bulk_create([Tag(name=name) for name in names], ignore_conflicts=True)
+    instance.tags.set(Tag.objects.filter(name__in=names))
@@ -1,4 +1,7 @@
 from django import template
+from django.conf import settings
+
+from post_management.images import derivative_exists, rendition_name, rendition_widths
 
 register = template.Library()
 
@@ -18,4 +21,27 @@ def thumbnail_url(image_url):
     folder = "/".join(parts[:-1])  # /media/upload
 
     # Us folder ke andar thumbnails subfolder assume karo
-    return f"{folder}/thumbnails/{filename}"
+    thumb = f"{folder}/thumbnails/{filename}"
+
+    # Worker ne abhi thumbnail nahi banaya to original hi dikhao
+    name = thumb[len(settings.MEDIA_URL):] if thumb.startswith(settings.MEDIA_URL) else thumb
+    if not derivative_exists(name.lstrip("/")):
+        return image_url
+    return thumb
+
+
+@register.simple_tag
+def image_srcset(image, ext="jpg"):
+    """
+    srcset ke liye rendition list, jaise
+    "/upload/blog/renditions/photo-320.webp 320w, /upload/blog/renditions/photo-640.webp 640w"
+    Renditions abhi nahi bane to khali string, browser src wala original lega.
+    Usage: <img src="{{ post.post_image.url }}" srcset="{% image_srcset post.post_image %}" sizes="...">
+    """
+    if not image:
+        return ""
+    name = str(getattr(image, "name", image))
+    return ", ".join(
+        f"{settings.MEDIA_URL}{rendition_name(name, width, ext)} {real_width}w"
+        for width, real_width in rendition_widths(name)
+    )
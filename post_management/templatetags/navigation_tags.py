@@ -0,0 +1,14 @@
+from django import template
+
+from post_management.navigation import menu_tree
+
+register = template.Library()
+
+
+@register.simple_tag
+def nav_menu():
+    """
+    Header menu: categories with their sub categories, from the cache.
+    Usage: {% nav_menu as menu %} then {% for link in menu %}
+    """
+    return menu_tree()
@@ -0,0 +1,21 @@
+from django import template
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def page_url(context, page, direction):
+    """
+    Query string for the next/previous page of a KeysetPage.
+    Baaki blocks ke cursors URL me waise hi rehte hain.
+    Usage: <a href="{% page_url BlogData 'next' %}">
+    """
+    query = context['request'].GET.copy()
+    query.pop('page', None)
+    query.pop(page.after_param, None)
+    query.pop(page.before_param, None)
+    if direction == 'next':
+        query[page.after_param] = page.next_cursor
+    else:
+        query[page.before_param] = page.previous_cursor
+    return '?' + query.urlencode()
@@ -1,3 +1,562 @@
-from django.test import TestCase
-
-# Create your tests here.
+import gzip
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.http import QueryDict
+from django.shortcuts import render
+from django.test import Client, RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from armustnews import sitemaps
+from armustnews.views import eventdetails
+from Seo_management.models import seo_optimization
+from post_management.chrome import bump_chrome_version
+from post_management.models import category, sub_category, NewsPost, VideoNews
+from post_management.pagecache import CSRF_PLACEHOLDER
+from post_management.pagination import decode_cursor, encode_cursor, keyset_page
+from post_management.search import search_posts
+from post_management.templatetags.pagination_tags import page_url
+from post_management import pagecache, viewcounts
+from post_management.viewcounts import flush_views, record_view
+from setting.models import CMS
+
+# tests never touch the deployment's cache (file/redis), see CACHE_BACKEND,
+# or drop dirty markers into the real sitemaps/ when they save posts
+TEST_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+TEST_SITEMAP_ROOT = tempfile.mkdtemp(prefix='sitemaps-')
+
+# feed -> the flag the sidebar/feed block filters on; each has a partial
+# index on (schedule_date, id) named newspost_<feed>_idx and one on id
+# named newspost_<feed>_id_idx
+FEED_FLAGS = {
+    'latest': {'is_active': True},
+    'headlines': {'Head_Lines': True},
+    'articles': {'articles': True},
+    'trending': {'trending': True},
+    'breaking': {'BreakingNews': True},
+    'event': {'Event': True},
+}
+
+
+def tearDownModule():
+    shutil.rmtree(TEST_SITEMAP_ROOT, ignore_errors=True)
+
+
+@override_settings(CACHES=TEST_CACHES, SITEMAP_ROOT=TEST_SITEMAP_ROOT)
+class CardQueryCountTests(TestCase):
+    """
+    cards() joins in the category and author/journalist, so a listing costs
+    the same number of queries however many cards it shows. Counted with
+    every cache cold: chrome, menu, site settings and ads included.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.editor = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        for slug in ('https://www.armustnews.com', '/all-news/latest'):
+            seo_optimization.objects.create(pageslug=slug, author=cls.editor)
+        published = timezone.now() - timezone.timedelta(days=1)
+        subcats = []
+        for i in range(3):
+            cat = category.objects.create(cat_name=f'Cat {i}', order=i)
+            subcats.append(sub_category.objects.create(sub_cat=cat, subcat_name=f'Sub {i}', order=i))
+        NewsPost.objects.bulk_create([
+            NewsPost(post_cat=subcats[i % 3], post_title=f'Post {i}', post_image='blog/p.jpg', author=cls.editor,
+                     schedule_date=published, Head_Lines=i % 2 == 0, articles=i % 3 == 0, trending=i % 4 == 0,
+                     BreakingNews=i % 5 == 0, Event=i % 6 == 0, slug=f'post-{i}')
+            for i in range(30)
+        ])
+        VideoNews.objects.bulk_create([
+            VideoNews(News_Category=subcats[i % 3], video_title=f'Video {i}', video_url='abc', author=cls.editor,
+                      schedule_date=published, video_type='reel' if i % 2 else 'video', articles=True, slug=f'video-{i}')
+            for i in range(6)
+        ])
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        flush_views()
+
+    def test_home(self):
+        with self.assertNumQueries(26):
+            self.assertEqual(self.client.get('/').status_code, 200)
+
+    def test_all_news(self):
+        with self.assertNumQueries(18):
+            self.assertEqual(self.client.get('/all-news/latest').status_code, 200)
+
+    def test_admin_changelist(self):
+        self.client.force_login(self.editor)
+        with self.assertNumQueries(15):
+            self.assertEqual(self.client.get('/admin/post_management/newspost/').status_code, 200)
+
+
+@override_settings(CACHES=TEST_CACHES, SITEMAP_ROOT=TEST_SITEMAP_ROOT)
+class FeedIndexTests(TestCase):
+
+    def assertUsesIndex(self, queryset, index):
+        plan = queryset.explain()
+        self.assertIn(f'USING INDEX {index}', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_sidebar_blocks_read_the_id_index(self):
+        # the chrome/home shape: published, one flag, newest ids first, a few rows
+        now = timezone.now()
+        for feed, flags in FEED_FLAGS.items():
+            with self.subTest(feed=feed):
+                posts = NewsPost.objects.cards().filter(schedule_date__lt=now, status='active', **flags)
+                self.assertUsesIndex(posts.order_by('-id')[:14], f'newspost_{feed}_id_idx')
+
+    def test_listings_read_the_schedule_date_index(self):
+        # the AllNews/keyset shape: newest schedule_date first
+        now = timezone.now()
+        for feed, flags in FEED_FLAGS.items():
+            with self.subTest(feed=feed):
+                posts = NewsPost.objects.cards().filter(schedule_date__lt=now, status='active', **flags)
+                self.assertUsesIndex(posts.order_by('-schedule_date', '-id')[:13], f'newspost_{feed}_idx')
+
+    def test_event_block_without_date_filter(self):
+        posts = NewsPost.objects.cards().filter(Event=1, status='active')
+        self.assertUsesIndex(posts.order_by('-id')[:10], 'newspost_event_id_idx')
+
+
+@override_settings(CACHES=TEST_CACHES, SITEMAP_ROOT=TEST_SITEMAP_ROOT)
+class PageCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        CMS.objects.create(pagename='About Armust', author=User.objects.create(username='editor'))
+        self.url = '/about-armust/'
+
+    def tearDown(self):
+        # pending page views would otherwise flush at exit, after the test db is gone
+        flush_views()
+
+    def csrf_token(self, response):
+        return re.search(r'name="csrfmiddlewaretoken" value="([^"]+)"', response.content.decode()).group(1)
+
+    def test_cache_hit_gets_its_own_csrf_token_and_cookie(self):
+        first = Client(enforce_csrf_checks=True)
+        first.get(self.url)
+        second = Client(enforce_csrf_checks=True)
+        response = second.get(self.url)
+
+        self.assertEqual(response['X-Page-Cache'], 'hit')
+        self.assertNotIn(CSRF_PLACEHOLDER, response.content)
+        self.assertIn('csrftoken', response.cookies)
+        subscribe = second.post('/UserSubscriber', {'csrfmiddlewaretoken': self.csrf_token(response), 'email': 'reader@example.com'})
+        self.assertNotEqual(subscribe.status_code, 403)
+
+    def test_tracking_params_share_one_entry(self):
+        self.client.get(self.url + '?utm_source=newsletter')
+        response = self.client.get(self.url + '?fbclid=abc')
+
+        self.assertEqual(response['X-Page-Cache'], 'hit')
+        self.assertNotIn(b'utm_source', response.content)
+
+
+@override_settings(CACHES=TEST_CACHES, SITEMAP_ROOT=TEST_SITEMAP_ROOT)
+class ConditionalPageTests(TestCase):
+
+    def setUp(self):
+        editor = User.objects.create(username='editor')
+        subcat = sub_category.objects.create(sub_cat=category.objects.create(cat_name='Desh'), subcat_name='Rajya')
+        self.post = NewsPost.objects.create(post_cat=subcat, post_title='Old story', post_image='blog/p.jpg', author=editor,
+                                            schedule_date=timezone.now() - timezone.timedelta(days=1), slug='old-story')
+        # updated_at is auto_now, backdate it so a bump lands in a later second
+        NewsPost.objects.filter(pk=self.post.pk).update(updated_at=timezone.now() - timezone.timedelta(hours=1))
+        # and forget the bumps those saves made
+        cache.clear()
+        self.url = '/old-story'
+        # a fixed clock, so no validator window rolls over mid test
+        clock = mock.patch('post_management.pagecache.time')
+        self.clock = clock.start()
+        self.addCleanup(clock.stop)
+        self.clock.time.return_value = time.time()
+
+    def tearDown(self):
+        flush_views()
+
+    def test_if_modified_since_sees_chrome_changes(self):
+        last_modified = self.client.get(self.url)['Last-Modified']
+        self.assertEqual(self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+
+        bump_chrome_version()
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['Last-Modified'], last_modified)
+
+    def test_validators_roll_over_with_the_window(self):
+        first = self.client.get(self.url)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+
+        # a scheduled post went live or an ad window opened, nothing got bumped
+        self.clock.time.return_value += pagecache.VALIDATOR_WINDOW
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 200)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified']).status_code, 200)
+
+    def test_not_modified_still_counts_the_view(self):
+        etag = self.client.get(self.url)['ETag']
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(self.client.get(self.url)['X-Page-Cache'], 'hit')
+
+        flush_views()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.viewcounter, 3)
+
+
+@override_settings(CACHES=TEST_CACHES, SITEMAP_ROOT=TEST_SITEMAP_ROOT)
+class ConcurrentWriteTests(TransactionTestCase):
+    """
+    View-count flushes and editor saves from several threads at once, each
+    on its own connection. WAL, busy_timeout and BEGIN IMMEDIATE should let
+    them queue up instead of failing with "database is locked".
+    """
+
+    THREADS = 6
+    ROUNDS = 20
+
+    def setUp(self):
+        editor = User.objects.create(username='editor')
+        subcat = sub_category.objects.create(sub_cat=category.objects.create(cat_name='Desh'), subcat_name='Rajya')
+        published = timezone.now() - timezone.timedelta(days=1)
+        self.posts = [
+            NewsPost.objects.create(post_cat=subcat, post_title=f'Story {i}', post_image='blog/p.jpg', author=editor,
+                                    schedule_date=published, slug=f'story-{i}')
+            for i in range(self.THREADS)
+        ]
+
+    def tearDown(self):
+        flush_views()
+
+    def test_parallel_flushes_and_saves_wait_for_the_lock(self):
+        self.assertEqual(connection.cursor().execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+        start = threading.Barrier(self.THREADS)
+        errors = []
+
+        def work(post):
+            try:
+                start.wait()
+                for i in range(self.ROUNDS):
+                    for other in self.posts:
+                        record_view(other)
+                    flush_views()
+                    # read then write in one transaction, the case a deferred BEGIN can't upgrade
+                    with transaction.atomic():
+                        story = NewsPost.objects.get(pk=post.pk)
+                        story.post_title = f'{story.post_title} {i}'
+                        story.save()
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=work, args=(post,)) for post in self.posts]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        flush_views()
+        hits = self.THREADS * self.ROUNDS
+        self.assertEqual(list(NewsPost.objects.values_list('viewcounter', flat=True)), [hits] * self.THREADS)
+
+
+@override_settings(CACHES=TEST_CACHES, SITEMAP_ROOT=TEST_SITEMAP_ROOT)
+class ViewCountFlushTests(TransactionTestCase):
+
+    def setUp(self):
+        flush_views()
+        subcat = sub_category.objects.create(sub_cat=category.objects.create(cat_name='Desh'), subcat_name='Rajya')
+        self.post = NewsPost.objects.create(post_cat=subcat, post_title='Quiet story', post_image='blog/p.jpg',
+                                            author=User.objects.create(username='editor'),
+                                            schedule_date=timezone.now(), slug='quiet-story')
+
+    def tearDown(self):
+        flush_views()
+
+    def test_quiet_worker_flushes_on_its_own(self):
+        with mock.patch.object(viewcounts, 'FLUSH_INTERVAL', 0.2):
+            record_view(self.post)
+            record_view(self.post)
+        # no more hits, no flush_views() call: only the timer can write these out
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            self.post.refresh_from_db()
+            if self.post.viewcounter == 2:
+                break
+            time.sleep(0.05)
+        self.assertEqual(self.post.viewcounter, 2)
+        self.assertIsNone(viewcounts._timer)
+
+
+@override_settings(CACHES=TEST_CACHES, SITEMAP_ROOT=TEST_SITEMAP_ROOT)
+class GenerateThumbnailsTests(TestCase):
+
+    def test_only_tracked_images_are_processed(self):
+        with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root):
+            for name in ('blog/story.jpg', 'ads/banner.jpg', 'uploads/ckeditor.png'):
+                os.makedirs(os.path.join(media_root, os.path.dirname(name)), exist_ok=True)
+                open(os.path.join(media_root, name), 'wb').close()
+            subcat = sub_category.objects.create(sub_cat=category.objects.create(cat_name='Desh'), subcat_name='Rajya')
+            NewsPost.objects.create(post_cat=subcat, post_title='Story', post_image='blog/story.jpg',
+                                    author=User.objects.create(username='editor'), schedule_date=timezone.now(), slug='story')
+            out = StringIO()
+            call_command('generate_thumbnails', '--dry-run', stdout=out)
+
+        self.assertIn('blog/story.jpg', out.getvalue())
+        self.assertNotIn('ads/banner.jpg', out.getvalue())
+        self.assertNotIn('ckeditor', out.getvalue())
+        self.assertIn('Would process: 1', out.getvalue())
+
+
+@override_settings(CACHES=TEST_CACHES, SITEMAP_ROOT=TEST_SITEMAP_ROOT)
+class SearchTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.editor = User.objects.create(username='editor')
+        cls.subcat = sub_category.objects.create(sub_cat=category.objects.create(cat_name='Desh'), subcat_name='Rajya')
+
+    def post(self, title, **fields):
+        return NewsPost.objects.create(post_cat=self.subcat, post_title=title, author=self.editor,
+                                       schedule_date=timezone.now(), **fields)
+
+    def titles(self, query):
+        return [post.post_title for post in search_posts(query)[:10]]
+
+    def test_title_match_ranks_above_body_match(self):
+        self.post('Monsoon session opens', post_des='<p>Budget talks continue</p>')
+        self.post('Budget approved', post_des='<p>Monsoon session closes</p>')
+
+        self.assertEqual(self.titles('budget'), ['Budget approved', 'Monsoon session opens'])
+        self.assertEqual(self.titles('monsoon'), ['Monsoon session opens', 'Budget approved'])
+
+    def test_every_word_matches_as_a_prefix(self):
+        self.post('Election results declared')
+        self.post('Election rally in Patna')
+
+        self.assertCountEqual(self.titles('elect'), ['Election rally in Patna', 'Election results declared'])
+        self.assertEqual(self.titles('elect resul'), ['Election results declared'])
+        self.assertEqual(self.titles('<>'), [])
+
+    def test_inactive_posts_are_left_out(self):
+        self.post('Cricket final', status='inactive')
+        self.assertEqual(search_posts('cricket').count(), 0)
+
+    def test_index_follows_save_and_delete(self):
+        post = self.post('Flood warning issued')
+        post.post_title = 'Heatwave warning issued'
+        post.save()
+
+        self.assertEqual(self.titles('heatwave'), ['Heatwave warning issued'])
+        self.assertEqual(self.titles('flood'), [])
+        post.delete()
+        self.assertEqual(self.titles('heatwave'), [])
+
+    def test_scan_fallback_is_dev_only(self):
+        self.post('Flood warning issued')
+        with mock.patch('post_management.search.fts_available', return_value=False):
+            with override_settings(DEBUG=True):
+                self.assertEqual(self.titles('flood'), ['Flood warning issued'])
+            with self.assertRaises(ImproperlyConfigured):
+                search_posts('flood')
+
+
+@override_settings(CACHES=TEST_CACHES, SITEMAP_ROOT=TEST_SITEMAP_ROOT)
+class EventTagTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        editor = User.objects.create(username='editor')
+        cat = category.objects.create(cat_name='Events')
+        cls.tagged = sub_category.objects.create(sub_cat=cat, subcat_name='Bihar Floods', subcat_tag='#flood #bihar')
+        cls.untagged = sub_category.objects.create(sub_cat=cat, subcat_name='Everything', subcat_tag='')
+        for title, tags in (('Both', '#flood #bihar'), ('Flood only', '#flood'), ('Cricket', '#cricket')):
+            NewsPost.objects.create(post_cat=cls.tagged, post_title=title, post_tag=tags, author=editor,
+                                    schedule_date=timezone.now())
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        flush_views()
+
+    def bytag(self, subcat):
+        # called directly, the catdetails route matches /events/<slug> first
+        request = RequestFactory().get(f'/events/{subcat.subcat_slug}')
+        request.user = AnonymousUser()
+        with mock.patch('armustnews.views.render', wraps=render) as rendered:
+            eventdetails(request, subcat.subcat_slug)
+        return sorted(post.post_title for post in rendered.call_args.args[2]['bytag'])
+
+    def test_posts_need_every_sub_category_tag(self):
+        self.assertEqual(self.bytag(self.tagged), ['Both'])
+
+    def test_sub_category_without_tags_lists_every_post(self):
+        self.assertEqual(self.bytag(self.untagged), ['Both', 'Cricket', 'Flood only'])
+
+
+@override_settings(CACHES=TEST_CACHES)
+class SitemapTests(TestCase):
+
+    def setUp(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        self.root = root.name
+        sitemap_root = override_settings(SITEMAP_ROOT=self.root)
+        sitemap_root.enable()
+        self.addCleanup(sitemap_root.disable)
+
+        editor = User.objects.create(username='editor')
+        subcat = sub_category.objects.create(sub_cat=category.objects.create(cat_name='Desh'), subcat_name='Rajya')
+        self.posts = [
+            NewsPost.objects.create(post_cat=subcat, post_title=f'Story {i}', author=editor, schedule_date=timezone.now())
+            for i in range(3)
+        ]
+        today = timezone.localtime(self.posts[0].post_date)
+        self.year, self.month = today.year, today.month
+        self.url = f'/sitemap/archive/{self.year}/{self.month}/'
+
+    def body(self, response):
+        # the test client closes the response once this is consumed
+        content = b''.join(response.streaming_content)
+        if response.get('Content-Encoding') == 'gzip':
+            content = gzip.decompress(content)
+        return content
+
+    def build(self):
+        call_command('build_sitemaps', stdout=StringIO())
+
+    def test_saves_mark_the_month_under_sitemap_root(self):
+        marker = os.path.join(self.root, '.dirty', f'archive-{self.year:04d}-{self.month:02d}')
+        self.assertTrue(os.path.exists(marker))
+        self.build()
+        self.assertEqual(os.listdir(os.path.join(self.root, '.dirty')), [])
+
+    def test_unbuilt_month_streams_live(self):
+        response = self.client.get(self.url)
+        self.assertNotIn('ETag', response)
+        plain = self.body(response)
+        self.assertEqual(plain.count(b'<url>'), 3)
+
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(self.body(response), plain)
+
+    def test_built_month_is_served_from_file(self):
+        self.build()
+        path = sitemaps.sitemap_path('archive', self.year, self.month)
+        with open(path, 'rb') as f:
+            built = f.read()
+        self.assertEqual(built.count(b'<url>'), 3)
+
+        response = self.client.get(self.url)
+        etag, last_modified = response['ETag'], response['Last-Modified']
+        self.assertIn('max-age', response['Cache-Control'])
+        self.assertEqual(self.body(response), built)
+
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(self.body(response), built)
+
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+
+    def test_month_over_the_url_limit_is_split_into_pages(self):
+        month = f'/sitemap/archive/{self.year:04d}/{self.month:02d}'
+        with mock.patch.object(sitemaps, 'MAX_URLS', 2):
+            index = self.client.get('/sitemap/archive').content
+            self.assertIn(f'{month}</loc>'.encode(), index)
+            self.assertIn(f'{month}/2</loc>'.encode(), index)
+            self.assertEqual(self.body(self.client.get(self.url)).count(b'<url>'), 2)
+            self.assertEqual(self.body(self.client.get(f'{self.url}2/')).count(b'<url>'), 1)
+            self.assertEqual(self.client.get(f'{self.url}3/').status_code, 404)
+
+            self.build()
+            self.assertTrue(os.path.exists(sitemaps.sitemap_path('archive', self.year, self.month, 2)))
+            self.posts[0].delete()
+            self.build()
+            self.assertFalse(os.path.exists(sitemaps.sitemap_path('archive', self.year, self.month, 2)))
+
+
+@override_settings(CACHES=TEST_CACHES, SITEMAP_ROOT=TEST_SITEMAP_ROOT)
+class KeysetPaginationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        editor = User.objects.create(username='editor')
+        subcat = sub_category.objects.create(sub_cat=category.objects.create(cat_name='Desh'), subcat_name='Rajya')
+        base = timezone.now() - timezone.timedelta(days=1)
+        # two posts per schedule_date, so the id tie-break is exercised too
+        NewsPost.objects.bulk_create([
+            NewsPost(post_cat=subcat, post_title=f'Post {i}', author=editor,
+                     schedule_date=base - timezone.timedelta(hours=i // 2), slug=f'post-{i}')
+            for i in range(30)
+        ])
+        cls.newest_first = list(NewsPost.objects.order_by('-schedule_date', '-id').values_list('id', flat=True))
+
+    def page(self, **params):
+        return keyset_page(NewsPost.objects.cards(), RequestFactory().get('/', params), 12)
+
+    def ids(self, page):
+        return [post.id for post in page]
+
+    def test_cursor_round_trip(self):
+        post = NewsPost.objects.first()
+        self.assertEqual(decode_cursor(encode_cursor(post)), (post.schedule_date, post.pk))
+
+    def test_malformed_cursors_are_ignored(self):
+        for value in (None, '', 'garbage', '1.2.3', 'x.1', '1.x', '9' * 30 + '.1'):
+            with self.subTest(value=value):
+                self.assertIsNone(decode_cursor(value))
+
+        page = self.page(after='garbage')
+        self.assertEqual(self.ids(page), self.newest_first[:12])
+        self.assertFalse(page.has_previous)
+
+    def test_next_cursors_walk_every_post_once(self):
+        pages = [self.page()]
+        while pages[-1].has_next:
+            pages.append(self.page(after=pages[-1].next_cursor))
+
+        self.assertEqual([len(page) for page in pages], [12, 12, 6])
+        self.assertEqual(sum((self.ids(page) for page in pages), []), self.newest_first)
+        self.assertEqual([page.has_previous for page in pages], [False, True, True])
+
+    def test_before_cursor_goes_back_a_page(self):
+        second = self.page(after=self.page().next_cursor)
+        third = self.page(after=second.next_cursor)
+
+        back = self.page(before=third.previous_cursor)
+        self.assertEqual(self.ids(back), self.ids(second))
+        self.assertTrue(back.has_next)
+        self.assertTrue(back.has_previous)
+
+        first = self.page(before=back.previous_cursor)
+        self.assertEqual(self.ids(first), self.newest_first[:12])
+        self.assertFalse(first.has_previous)
+
+    def test_page_url_swaps_only_its_own_cursor(self):
+        first = self.page()
+        request = RequestFactory().get('/', {'title': 'flood', 'page': '2', 'before': 'old', 'news_after': 'other'})
+        query = QueryDict(page_url({'request': request}, first, 'next')[1:])
+
+        self.assertEqual(query['after'], first.next_cursor)
+        self.assertEqual(query['title'], 'flood')
+        self.assertEqual(query['news_after'], 'other')
+        self.assertNotIn('before', query)
+        self.assertNotIn('page', query)
@@ -0,0 +1,87 @@
+import atexit
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.apps import apps
+from django.db import connection
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce
+
+# Hits are kept in memory and written out in one go once either limit is hit,
+# so a busy article costs one UPDATE per flush instead of one per view.
+# The first buffered hit also starts a timer, so a quiet worker still writes
+# its hits out after FLUSH_INTERVAL instead of holding them till exit.
+FLUSH_INTERVAL = 30
+FLUSH_HITS = 200
+
+_lock = threading.Lock()
+_pending = Counter()
+_last_flush = time.monotonic()
+_timer = None
+
+
+def record_view(instance, request=None):
+    """
+    Count a view of any model with a ``viewcounter`` field.
+
+    Pass the request on cacheable pages so a cached copy of the page
+    keeps counting (see pagecache).
+    """
+    if request is not None:
+        request.recorded_views = getattr(request, 'recorded_views', []) + [(instance._meta.label, instance.pk)]
+    _count(type(instance), instance.pk)
+
+
+def replay_views(views):
+    for label, pk in views:
+        _count(apps.get_model(label), pk)
+
+
+def _count(model, pk):
+    global _timer
+    with _lock:
+        _pending[(model, pk)] += 1
+        if _timer is None:
+            _timer = threading.Timer(FLUSH_INTERVAL, _timed_flush)
+            _timer.daemon = True
+            _timer.start()
+        due = (
+            sum(_pending.values()) >= FLUSH_HITS
+            or time.monotonic() - _last_flush >= FLUSH_INTERVAL
+        )
+    if due:
+        flush_views()
+
+
+def _timed_flush():
+    try:
+        flush_views()
+    finally:
+        # the timer thread's own connection, nobody else will close it
+        connection.close()
+
+
+def flush_views():
+    global _last_flush, _timer
+    with _lock:
+        pending = dict(_pending)
+        _pending.clear()
+        _last_flush = time.monotonic()
+        if _timer is not None:
+            _timer.cancel()
+            _timer = None
+    if not pending:
+        return
+
+    # group rows that got the same number of hits so each group is one UPDATE
+    batches = defaultdict(list)
+    for (model, pk), hits in pending.items():
+        batches[(model, hits)].append(pk)
+    for (model, hits), pks in batches.items():
+        model.objects.filter(pk__in=pks).update(
+            viewcounter=Coalesce(F('viewcounter'), Value(0)) + hits
+        )
+
+
+atexit.register(flush_views)
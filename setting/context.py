@@ -1,11 +1,49 @@
+from django.core.cache import cache
+from django.utils import timezone
+
 from .models import profile_setting, CMS
 
+SETTING_VERSION_KEY = "setting:version"
+SETTING_CACHE_KEY = "setting:{version}"
+SETTING_CHANGED_KEY = "setting:changed"
+# profile_setting/CMS saves bump the version, the timeout just clears out old ones
+SETTING_TIMEOUT = 60 * 60 * 24
+
+def setting_version():
+    version = cache.get(SETTING_VERSION_KEY)
+    if version is None:
+        cache.add(SETTING_VERSION_KEY, 1, None)
+        version = cache.get(SETTING_VERSION_KEY, 1)
+    return version
+
+def bump_setting_version():
+    try:
+        cache.incr(SETTING_VERSION_KEY)
+    except ValueError:
+        cache.set(SETTING_VERSION_KEY, 2, None)
+    cache.set(SETTING_CHANGED_KEY, timezone.now(), None)
+
+def site_settings():
+    """
+    Site profile and the footer's CMS links, shared through the cache.
+    Footer sirf naam aur slug dikhata hai, Content body load nahi karte.
+    """
+    key = SETTING_CACHE_KEY.format(version=setting_version())
+    data = cache.get(key)
+    if data is None:
+        data = {
+            'profile_setting': profile_setting.objects.first(),
+            'pages': list(CMS.objects.filter(status='active').order_by('order').only('pagename', 'slug', 'order')),
+        }
+        cache.set(key, data, SETTING_TIMEOUT)
+    return data
+
 def setting_context(request):
     return {
-        'profile_setting': profile_setting.objects.first()
+        'profile_setting': site_settings()['profile_setting']
     }
 
 def cms_context(request):
     return {
-        'pages': CMS.objects.filter(status='active').order_by('order')
-    }
\ No newline at end of file
+        'pages': site_settings()['pages']
+    }
@@ -1,26 +1,20 @@
 from django.db import models
 from autoslug import AutoSlugField
 from image_cropping import ImageCropField, ImageRatioField
-from PIL import Image
 from ckeditor.fields import RichTextField
 from ckeditor_uploader.fields import RichTextUploadingField
 from django.utils import timezone
 from django.urls import reverse
 from django.contrib.auth.models import User
+from post_management.images import ImageChangeMixin
 
-class CMS(models.Model):
+class CMS(ImageChangeMixin, models.Model):
     pagename=models.CharField(max_length=150, verbose_name="Page Name",null=True,default=None)
     Content=RichTextUploadingField(null=True,default='No News', verbose_name="Long Discretion")
     pageimage = ImageCropField(upload_to='cms/', max_length=255, null=True, blank=True, verbose_name="Page Image (1280X220px)")
     
-    def save(self, *args, **kwargs):
-        super(CMS, self).save(*args, **kwargs)
-        if self.pageimage:
-            img = Image.open(self.pageimage.path)
-            desired_size = (1280, 220)
-            img.thumbnail(desired_size)
-            img.save(self.pageimage.path)
-    
+    tracked_images = {'pageimage': (1280, 220)}
+
     slug=AutoSlugField(max_length=200, populate_from='pagename',unique=True,null=True,default=None)
     post_date=models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)